@@ -0,0 +1,33 @@
+"""
+JSON encode/decode for the library's per-row columns.
+
+Uses orjson when it happens to be importable and the stdlib json module
+otherwise. orjson is never required — the client stays stdlib-only so it
+runs on Houdini's bundled Python — but pipelines that already ship it get
+a faster decode of the JSON columns in every search result.
+
+Both paths write compact JSON that either one reads back, and both raise
+json.JSONDecodeError (orjson's error subclasses it) on malformed input.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj):
+        """Encode obj as compact JSON text."""
+        # Non-str keys are stringified, as the stdlib encoder does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    loads = json.loads
+
+    def dumps(obj):
+        """Encode obj as compact JSON text."""
+        return json.dumps(obj, separators=(',', ':'))
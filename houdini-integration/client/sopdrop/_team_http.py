@@ -350,7 +350,14 @@ def get_all_assets_cached() -> tuple[list[dict], dict]:
 
 def search_assets(*, query="", context=None, tags=None, collection_id=None,
                   sort_by="updated_at", sort_order="desc", limit=100, offset=0,
-                  favorites_only=False) -> list[dict]:
+                  favorites_only=False, after=None, fields=None) -> list[dict]:
+    # fields is accepted for signature parity; the server always returns
+    # full asset records.
+    if after is not None:
+        # The server pages by offset only. Returning the first page again
+        # would loop a caller forever and an empty page would look like the
+        # end of the results, so make the caller switch to offset.
+        raise ValueError("cursor pagination not supported in team HTTP mode")
     sort_map = {
         "updated_at": "updated", "created_at": "recent", "name": "name",
         "use_count": "downloads", "last_used_at": "updated",
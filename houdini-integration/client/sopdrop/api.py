@@ -68,19 +68,38 @@ class NotFoundError(SopdropError):
     pass
 
 
+# SSL contexts by insecure flag. Building one loads the whole CA bundle
+# (load_verify_locations), which takes hundreds of ms on Windows builds of
+# Houdini's Python, so each is built once per process and reused.
+_ssl_contexts = {}
+
+
+def _get_ssl_ctx(insecure=False):
+    """Return the cached verifying (certifi if installed) or unverified context."""
+    ctx = _ssl_contexts.get(insecure)
+    if ctx is None:
+        import ssl
+        if insecure:
+            ctx = ssl.create_default_context()
+            ctx.check_hostname = False
+            ctx.verify_mode = ssl.CERT_NONE
+        else:
+            try:
+                import certifi
+                ctx = ssl.create_default_context(cafile=certifi.where())
+            except ImportError:
+                ctx = ssl.create_default_context()
+        _ssl_contexts[insecure] = ctx
+    return ctx
+
+
 def _ssl_urlopen(req, timeout=30):
     """urlopen with SSL fallback for Houdini's bundled Python."""
     import ssl
     url = req.full_url if hasattr(req, 'full_url') else str(req)
     if url.startswith("https://"):
         try:
-            ctx = ssl.create_default_context()
-            try:
-                import certifi
-                ctx = ssl.create_default_context(cafile=certifi.where())
-            except ImportError:
-                pass
-            return urlopen(req, timeout=timeout, context=ctx)
+            return urlopen(req, timeout=timeout, context=_get_ssl_ctx())
         except (ssl.SSLCertVerificationError, URLError) as e:
             is_ssl = isinstance(e, ssl.SSLCertVerificationError)
             if isinstance(e, URLError) and 'CERTIFICATE_VERIFY_FAILED' in str(e.reason):
@@ -92,10 +111,7 @@ def _ssl_urlopen(req, timeout=30):
                 "Install certifi (`pip install certifi`) to fix this.",
                 stacklevel=2,
             )
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            return urlopen(req, timeout=timeout, context=ctx)
+            return urlopen(req, timeout=timeout, context=_get_ssl_ctx(insecure=True))
     return urlopen(req, timeout=timeout)
 
 
@@ -919,33 +935,7 @@ class SopdropClient:
         req.add_header('Content-Type', f'multipart/form-data; boundary={boundary}')
 
         try:
-            import ssl
-            if url.startswith("https://"):
-                try:
-                    ctx = ssl.create_default_context()
-                    try:
-                        import certifi
-                        ctx = ssl.create_default_context(cafile=certifi.where())
-                    except ImportError:
-                        pass
-                    response = urllib.request.urlopen(req, timeout=120, context=ctx)
-                except (ssl.SSLCertVerificationError, URLError) as ssl_err:
-                    is_ssl = isinstance(ssl_err, ssl.SSLCertVerificationError)
-                    if isinstance(ssl_err, URLError) and 'CERTIFICATE_VERIFY_FAILED' in str(ssl_err.reason):
-                        is_ssl = True
-                    if not is_ssl:
-                        raise
-                    import warnings
-                    warnings.warn(
-                        "SSL certificate verification failed. Falling back to unverified connection.",
-                        stacklevel=2
-                    )
-                    ctx = ssl.create_default_context()
-                    ctx.check_hostname = False
-                    ctx.verify_mode = ssl.CERT_NONE
-                    response = urllib.request.urlopen(req, timeout=120, context=ctx)
-            else:
-                response = urllib.request.urlopen(req, timeout=120)
+            response = _ssl_urlopen(req, timeout=120)
 
             result = json.loads(response.read().decode())
 
@@ -31,6 +31,7 @@ DEFAULTS = {
     "ui_scale": 1.0,  # UI scale factor (0.8 - 2.5)
     # Mode
     "local_only": False,  # Hide all cloud/API features (for studio-internal use)
+    "sqlite_mmap": False,  # Memory-mapped reads for local library DBs (opt-in: ~ may be a network mount)
 }
 
 def get_config_dir():
@@ -120,6 +121,22 @@ def get_local_only():
     return config.get("local_only", False)
 
 
+def get_sqlite_mmap():
+    """Check if local library databases may read pages through mmap.
+
+    Off by default: home directories can be NFS or roaming mounts, where
+    mmap can crash SQLite. Only enable it when ~/.sopdrop is on a local disk.
+    Can be overridden by the SOPDROP_SQLITE_MMAP environment variable.
+    """
+    env = os.environ.get("SOPDROP_SQLITE_MMAP", "").lower()
+    if env in ("1", "true", "yes"):
+        return True
+    if env in ("0", "false", "no"):
+        return False
+    config = get_config()
+    return bool(config.get("sqlite_mmap", False))
+
+
 def get_workstation_user():
     """Return the OS username of the current workstation user, sanitized.
 
@@ -5,12 +5,36 @@ Handles importing .sopdrop packages into Houdini.
 Uses Houdini's native loadItemsFromFile() for reliable deserialization.
 """
 
-import base64
+import binascii
 import hashlib
 import tempfile
 import os
 from typing import Dict, Any, List, Optional, Tuple
 
+try:
+    import hou
+except ImportError:
+    # Not running inside Houdini (CLI, tooling). The public entry points
+    # check for this before touching the scene.
+    hou = None
+
+# Verbose import tracing. Off by default — the per-item prints (and the
+# HOM calls made only to format them) are measurable on large pastes.
+_DEBUG = os.environ.get("SOPDROP_DEBUG") == "1"
+
+# Base64 slice size for streaming decode. Must be a multiple of 4 so every
+# slice decodes on its own.
+_DECODE_CHUNK_SIZE = 1024 * 1024
+
+# Whitespace b64decode skips (line-wrapped encoders add it), removed before
+# slicing so it can't shift the 4-char slice boundaries
+_B64_WHITESPACE = ' \t\n\r\v\f'
+_STRIP_B64_WHITESPACE = str.maketrans('', '', _B64_WHITESPACE)
+
+# How many missing HDA dependencies to name before a failing import gives up
+# scanning and reports "(and more)".
+_MAX_REPORTED_MISSING = 5
+
 
 class ImportError(Exception):
     """Error during import."""
@@ -168,15 +192,11 @@ class _PlaceholderParent:
     """
 
     def __init__(self, real_parent, missing_types):
-        import hou as _hou
         object.__setattr__(self, '_real_parent', real_parent)
         object.__setattr__(self, '_missing_types', set(missing_types))
-        object.__setattr__(self, '_hou', _hou)
         object.__setattr__(self, '_placeholders', [])
 
     def createNode(self, type_name, node_name=None, *args, **kwargs):
-        hou = self._hou
-
         # Check if this type is one of the missing ones
         if type_name in self._missing_types:
             # Create a subnet as placeholder
@@ -265,7 +285,8 @@ def import_items(
     Returns:
         List of created items
     """
-    import hou
+    if hou is None:
+        raise ImportError("Houdini not available")
 
     # Validate package format
     fmt = package.get("format", "")
@@ -287,7 +308,22 @@ def _import_v2(
     allow_placeholders: bool = False,
 ) -> List:
     """Import v2 format (binary/cpio based)."""
-    import hou
+    # Cheap validations run first; the dependency check enumerates the
+    # whole node type system, so it comes last.
+
+    # Get the binary data
+    encoded_data = package.get("data")
+    if not encoded_data:
+        raise ImportError("Package contains no data")
+
+    # Guard against excessively large packages that could OOM Houdini.
+    # 500 MB decoded (667 MB base64-encoded) is a generous upper bound.
+    MAX_ENCODED_SIZE = 667 * 1024 * 1024
+    if len(encoded_data) > MAX_ENCODED_SIZE:
+        raise ImportError(
+            f"Package is too large ({len(encoded_data) // (1024*1024)} MB encoded). "
+            f"Maximum supported size is ~500 MB."
+        )
 
     # Get target node
     if target_node is None:
@@ -308,10 +344,22 @@ def _import_v2(
                 f"Navigate to a {package_context.upper()} network and try again."
             )
 
+    # Check Houdini version (warn only)
+    package_version = package.get("houdini_version", "unknown")
+    current_version = hou.applicationVersionString()
+    if package_version != "unknown" and package_version != current_version:
+        print(f"Note: Package was created in Houdini {package_version}, "
+              f"you are using {current_version}.")
+
     # Check dependencies
     dependencies = package.get("dependencies", [])
     if dependencies:
-        missing = _check_missing_hdas(dependencies)
+        # Without placeholders the import fails on the first missing type,
+        # so stop scanning once there are enough names for the error.
+        missing = _check_missing_hdas(
+            dependencies,
+            max_missing=None if allow_placeholders else _MAX_REPORTED_MISSING,
+        )
         if missing:
             if allow_placeholders:
                 # Let loadItemsFromFile() proceed — Houdini creates native
@@ -320,58 +368,61 @@ def _import_v2(
                 print(f"[Sopdrop] Proceeding with {len(missing)} missing HDA(s): {', '.join(names)}")
                 print("[Sopdrop] Missing types will appear as error nodes in the network")
             else:
-                raise MissingDependencyError(_format_missing_deps_error(missing, v2=True))
-
-    # Get the binary data
-    encoded_data = package.get("data")
-    if not encoded_data:
-        raise ImportError("Package contains no data")
-
-    # Guard against excessively large packages that could OOM Houdini.
-    # 500 MB decoded (667 MB base64-encoded) is a generous upper bound.
-    MAX_ENCODED_SIZE = 667 * 1024 * 1024
-    if len(encoded_data) > MAX_ENCODED_SIZE:
-        raise ImportError(
-            f"Package is too large ({len(encoded_data) // (1024*1024)} MB encoded). "
-            f"Maximum supported size is ~500 MB."
-        )
-
-    # Decode from base64
-    try:
-        binary_data = base64.b64decode(encoded_data)
-    except Exception as e:
-        raise ImportError(f"Failed to decode package data: {e}")
-
-    # Verify checksum
+                raise MissingDependencyError(
+                    _format_missing_deps_error(missing, max_listed=_MAX_REPORTED_MISSING, v2=True))
+
+    # Verify checksum. Newer packages also checksum the base64 text itself
+    # ("checksum_b64"), which lets us reject corrupt data before decoding
+    # anything or touching the filesystem. Some packages put that hash in
+    # "checksum" ("checksum_encoding": "base64"). Otherwise "checksum"
+    # covers the decoded bytes, which are hashed during the decode below.
     expected_checksum = package.get("checksum")
-    if expected_checksum:
-        actual_checksum = hashlib.sha256(binary_data).hexdigest()
-        if actual_checksum != expected_checksum:
+    if package.get("checksum_b64"):
+        text_checksum = package["checksum_b64"]
+        text_algo = package.get("checksum_b64_algo", "sha256")
+    elif expected_checksum and package.get("checksum_encoding", "binary") == "base64":
+        text_checksum, text_algo = expected_checksum, package.get("checksum_algo", "sha256")
+    else:
+        text_checksum = None
+    if text_checksum:
+        hasher = _new_hasher(text_algo)
+        try:
+            hasher.update(encoded_data.encode('ascii'))
+        except UnicodeEncodeError as e:
+            raise ImportError(f"Failed to decode package data: {e}")
+        if hasher.hexdigest() != text_checksum:
             raise ChecksumError(
                 "Package checksum verification failed. "
                 "The data may be corrupted or tampered with."
             )
+        expected_checksum = None  # Already verified
+    hasher = _new_hasher(package.get("checksum_algo", "sha256")) if expected_checksum else None
 
-    # Check Houdini version (warn only)
-    package_version = package.get("houdini_version", "unknown")
-    current_version = hou.applicationVersionString()
-    if package_version != "unknown" and package_version != current_version:
-        print(f"Note: Package was created in Houdini {package_version}, "
-              f"you are using {current_version}.")
-
-    # Write binary data to temp file
+    # Decode from base64 straight into the temp file.
     # Note: We must close the file before Houdini can read it
-    fd, temp_path = tempfile.mkstemp(suffix='.cpio')
-    try:
-        os.write(fd, binary_data)
-        os.fsync(fd)
-    finally:
-        os.close(fd)
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.cpio') as f:
+        temp_path = f.name
+        try:
+            bytes_written = _decode_payload(encoded_data, f, hasher)
+            # No fsync: closing the file flushes into the page cache, which
+            # is all loadItemsFromFile() reads from, and the file is
+            # unlinked right after the load — durability buys nothing here.
+        except Exception:
+            # Close before unlinking — Windows refuses to delete open files
+            f.close()
+            os.unlink(temp_path)
+            raise
+
+    if hasher is not None and hasher.hexdigest() != expected_checksum:
+        os.unlink(temp_path)
+        raise ChecksumError(
+            "Package checksum verification failed. "
+            "The data may be corrupted or tampered with."
+        )
 
     try:
-        # Debug: print file size
-        file_size = os.path.getsize(temp_path)
-        print(f"[Sopdrop] Loading {file_size} bytes from temp file...")
+        if _DEBUG:
+            print(f"[Sopdrop] Loading {bytes_written} bytes from temp file...")
 
         # Check if this package came from a container HDA (e.g. SOP Create).
         # If so, create the container first and load children into it.
@@ -414,13 +465,13 @@ def _import_v2(
                     print(f"[Sopdrop] Could not create container '{type_name}' (type not available), loading flat")
 
         # Track items before import to detect new ones
-        items_before = set(target_node.allItems())
+        items_before = frozenset(target_node.allItems())
 
         # Load items using Houdini's native method
         result = load_target.loadItemsFromFile(temp_path)
 
-        # Debug: see what we got back
-        print(f"[Sopdrop] loadItemsFromFile returned: {type(result)}")
+        if _DEBUG:
+            print(f"[Sopdrop] loadItemsFromFile returned: {type(result)}")
 
         # Get items from return value
         items_from_return = []
@@ -430,10 +481,6 @@ def _import_v2(
             elif hasattr(result, 'position'):
                 items_from_return = [result]
 
-        # Also detect new items by comparing before/after (fallback for older Houdini)
-        items_after = set(target_node.allItems())
-        new_items = list(items_after - items_before)
-
         # If we loaded into a container, the container is the only top-level item.
         # Just position it, select it, and lay out its children.
         if container_node is not None:
@@ -445,35 +492,37 @@ def _import_v2(
             print(f"[Sopdrop] Loaded into container '{container_node.type().name()}' with {len(container_node.children())} children")
             return [container_node]
 
+        # Also detect new items by comparing before/after (fallback for older
+        # Houdini). One allItems() walk covers nodes, boxes, stickies and dots.
+        new_items = [item for item in target_node.allItems() if item not in items_before]
+
         # Collect items to move and items to select
         # Strategy:
         # - Move network boxes (which moves their contents too)
         # - Move nodes NOT in network boxes
         # - Move sticky notes NOT in network boxes
 
-        # Use networkBoxes() and stickyNotes() directly from target_node
-        # to get the definitive list (avoids duplicates from set difference)
-        all_netboxes_after = set(target_node.networkBoxes())
-        all_stickies_after = set(target_node.stickyNotes())
-
-        # Find which ones are new (weren't there before)
-        new_netboxes = [nb for nb in all_netboxes_after if nb not in items_before]
-        new_stickies = [s for s in all_stickies_after if s not in items_before]
-
-        # For nodes, filter from new_items
+        # Separate items by type in a single pass over the new items
+        # (same approach as v1 import)
+        new_netboxes = []
+        new_stickies = []
+        new_dots = []
         all_nodes = []
         for item in new_items:
-            if isinstance(item, hou.Node):
+            if isinstance(item, hou.NetworkBox):
+                new_netboxes.append(item)
+            elif isinstance(item, hou.StickyNote):
+                new_stickies.append(item)
+            elif isinstance(item, hou.NetworkDot):
+                # Network dots (connector waypoints) also need repositioning
+                new_dots.append(item)
+            elif isinstance(item, hou.Node):
                 try:
                     if item.parent() == target_node:
                         all_nodes.append(item)
                 except Exception:
                     pass
 
-        # Network dots (connector waypoints) also need repositioning — they
-        # aren't captured by networkBoxes()/stickyNotes() so pull from new_items.
-        new_dots = [item for item in new_items if isinstance(item, hou.NetworkDot)]
-
         sticky_notes = new_stickies
 
         # Filter to only top-level network boxes for repositioning.
@@ -492,24 +541,25 @@ def _import_v2(
             except Exception:
                 top_level_netboxes.append(netbox)
 
-        if nested_netboxes:
+        if _DEBUG and nested_netboxes:
             print(f"[Sopdrop] {len(nested_netboxes)} nested netbox(es) will move with parent — skipping independent move")
 
         network_boxes = top_level_netboxes
         # all_netboxes used for selection includes everything
         all_netboxes = new_netboxes
 
-        # Build set of nodes inside network boxes (we won't move these - the box moves them)
+        # Build set of nodes inside network boxes (we won't move these - the box moves them).
+        # hou.Node hashes by session identity, so the wrappers themselves can
+        # be the set keys — no per-node path() string building needed.
         nodes_in_boxes = set()
         for netbox in all_netboxes:
             try:
-                for node in netbox.nodes():
-                    nodes_in_boxes.add(node.path())
+                nodes_in_boxes.update(netbox.nodes())
             except Exception as e:
                 print(f"[Sopdrop] Error getting netbox nodes: {e}")
 
         # Filter to nodes NOT in network boxes
-        nodes_to_move = [n for n in all_nodes if n.path() not in nodes_in_boxes]
+        nodes_to_move = [n for n in all_nodes if n not in nodes_in_boxes]
 
         # For sticky notes, check if they have a parent network box
         # We need to do this BEFORE capturing positions, so we only capture loose stickies
@@ -523,49 +573,53 @@ def _import_v2(
                     stickies_to_move.append(sticky)
                 else:
                     stickies_in_boxes.append(sticky)
-                    print(f"[Sopdrop] Sticky '{(sticky.text() or '')[:20]}...' is inside netbox, will move with box")
+                    if _DEBUG:
+                        print(f"[Sopdrop] Sticky '{(sticky.text() or '')[:20]}...' is inside netbox, will move with box")
             except Exception as e:
                 # If we can't check, assume it needs moving
                 stickies_to_move.append(sticky)
                 print(f"[Sopdrop] Could not check sticky parent box: {e}")
 
-        # Capture network box sizes and positions BEFORE any operations
-        netbox_data = {}
+        # Capture network box sizes and positions BEFORE any operations,
+        # as (netbox, pos, size, comment) tuples
+        netbox_saved = []
         for netbox in network_boxes:
             try:
                 size = netbox.size()
                 pos = netbox.position()
-                comment = netbox.comment() or "unnamed"
-                netbox_data[id(netbox)] = {
-                    'size': (size[0], size[1]),
-                    'pos': (pos[0], pos[1]),
-                    'comment': comment
-                }
-                print(f"[Sopdrop] Captured netbox '{comment}': pos=({pos[0]:.2f}, {pos[1]:.2f}), size=({size[0]:.2f}, {size[1]:.2f})")
+                comment = None
+                if _DEBUG:
+                    comment = netbox.comment() or "unnamed"
+                    print(f"[Sopdrop] Captured netbox '{comment}': pos=({pos[0]:.2f}, {pos[1]:.2f}), size=({size[0]:.2f}, {size[1]:.2f})")
+                netbox_saved.append((netbox, (pos[0], pos[1]), (size[0], size[1]), comment))
             except Exception as e:
+                netbox_saved.append((netbox, None, None, None))
                 print(f"[Sopdrop] Error capturing netbox data: {e}")
 
-        # Capture sticky note sizes and positions ONLY for stickies NOT in boxes
-        # Stickies inside boxes will be moved by the box automatically
-        sticky_data = {}
+        # Capture sticky note sizes and positions ONLY for stickies NOT in boxes,
+        # as (sticky, pos, size, text) tuples. Stickies inside boxes will be
+        # moved by the box automatically; stickies we fail to capture are
+        # moved like plain items.
+        sticky_saved = []
+        loose_stickies = []
         for sticky in stickies_to_move:
             try:
                 size = sticky.size()
                 pos = sticky.position()
-                text_preview = (sticky.text() or "")[:20]
-                sticky_data[id(sticky)] = {
-                    'size': (size[0], size[1]),
-                    'pos': (pos[0], pos[1]),
-                    'text': text_preview
-                }
-                print(f"[Sopdrop] Captured loose sticky '{text_preview}...': pos=({pos[0]:.2f}, {pos[1]:.2f}), size=({size[0]:.2f}, {size[1]:.2f})")
+                text_preview = None
+                if _DEBUG:
+                    text_preview = (sticky.text() or "")[:20]
+                    print(f"[Sopdrop] Captured loose sticky '{text_preview}...': pos=({pos[0]:.2f}, {pos[1]:.2f}), size=({size[0]:.2f}, {size[1]:.2f})")
+                sticky_saved.append((sticky, (pos[0], pos[1]), (size[0], size[1]), text_preview))
             except Exception as e:
+                loose_stickies.append(sticky)
                 print(f"[Sopdrop] Error capturing sticky data: {e}")
 
         # For selection, we want all items (including nested boxes)
         all_top_level = all_nodes + all_netboxes + sticky_notes + new_dots
 
-        print(f"[Sopdrop] Found {len(all_nodes)} nodes ({len(nodes_to_move)} outside boxes), {len(all_netboxes)} netboxes ({len(network_boxes)} top-level), {len(sticky_notes)} sticky notes ({len(stickies_to_move)} outside boxes), {len(new_dots)} dots")
+        if _DEBUG:
+            print(f"[Sopdrop] Found {len(all_nodes)} nodes ({len(nodes_to_move)} outside boxes), {len(all_netboxes)} netboxes ({len(network_boxes)} top-level), {len(sticky_notes)} sticky notes ({len(stickies_to_move)} outside boxes), {len(new_dots)} dots")
 
         # If no items found, return empty
         if not all_top_level:
@@ -575,21 +629,16 @@ def _import_v2(
         # Reposition items to target location
         # - Nodes/stickies/dots outside boxes: move individually
         # - Network boxes: move the box (contents move with it)
-        items_to_move = nodes_to_move + stickies_to_move + new_dots
-        if position and (items_to_move or network_boxes):
-            print(f"[Sopdrop] Repositioning {len(items_to_move)} loose items + {len(network_boxes)} netboxes to ({position[0]:.1f}, {position[1]:.1f})")
-            _reposition_items(items_to_move, position, network_boxes, netbox_data, sticky_data)
-        else:
+        items_to_move = nodes_to_move + loose_stickies + new_dots
+        if position and (items_to_move or sticky_saved or netbox_saved):
+            if _DEBUG:
+                print(f"[Sopdrop] Repositioning {len(items_to_move) + len(sticky_saved)} loose items + {len(netbox_saved)} netboxes to ({position[0]:.1f}, {position[1]:.1f})")
+            _reposition_items(items_to_move, position, netbox_saved, sticky_saved)
+        elif _DEBUG:
             print("[Sopdrop] No position specified, items at original location")
 
         # Clear existing selection, then select all new items
-        target_node.setSelected(False, clear_all_selected=True)
-        for item in all_top_level:
-            try:
-                if hasattr(item, 'setSelected'):
-                    item.setSelected(True, clear_all_selected=False)
-            except Exception:
-                pass
+        _select_items(all_top_level)
 
         return all_top_level
 
@@ -601,6 +650,57 @@ def _import_v2(
             os.unlink(temp_path)
 
 
+def _new_hasher(algo: str):
+    """Return a fresh hash object for a package checksum algorithm name.
+
+    Packages without a checksum_algo field use SHA-256. BLAKE2b is
+    truncated to 32 bytes so the hex digest keeps SHA-256's length.
+    """
+    if algo == "blake2b":
+        return hashlib.blake2b(digest_size=32)
+    if algo == "sha256":
+        return hashlib.sha256()
+    raise ImportError(f"Unsupported checksum algorithm: {algo}")
+
+
+def _decode_payload(encoded_data: str, out, hasher=None) -> int:
+    """Base64-decode encoded_data into the writable out, chunk by chunk.
+
+    Chunks are sliced on 4-char boundaries so each decodes independently,
+    which keeps peak memory at one chunk instead of the whole payload.
+    Decoded bytes are fed to hasher as well, if one is given.
+
+    Like b64decode, line-wrapped or otherwise whitespace-padded data is
+    accepted: whitespace is stripped first so the slices stay aligned, and
+    a slice thrown out of alignment by any other ignored character makes
+    the rest decode in one go.
+
+    Returns the number of decoded bytes written.
+    """
+    if any(c in encoded_data for c in _B64_WHITESPACE):
+        encoded_data = encoded_data.translate(_STRIP_B64_WHITESPACE)
+    bytes_written = 0
+    for start in range(0, len(encoded_data), _DECODE_CHUNK_SIZE):
+        try:
+            # a2b_base64 is the C routine behind b64decode, without
+            # the per-call wrapper overhead.
+            chunk = binascii.a2b_base64(encoded_data[start:start + _DECODE_CHUNK_SIZE])
+        except (binascii.Error, ValueError):
+            try:
+                chunk = binascii.a2b_base64(encoded_data[start:])
+            except (binascii.Error, ValueError) as e:
+                raise ImportError(f"Failed to decode package data: {e}")
+            if hasher is not None:
+                hasher.update(chunk)
+            out.write(chunk)
+            return bytes_written + len(chunk)
+        if hasher is not None:
+            hasher.update(chunk)
+        out.write(chunk)
+        bytes_written += len(chunk)
+    return bytes_written
+
+
 def _patch_old_format_code(code):
     """Patch old-format v1 code to fix variable references after asCode navigation.
 
@@ -731,8 +831,6 @@ def _import_v1(
         allow_placeholders: If True, missing HDA types become red placeholder
             subnets instead of raising MissingDependencyError.
     """
-    import hou
-
     # Get target node
     if target_node is None:
         pane = hou.ui.paneTabOfType(hou.paneTabType.NetworkEditor)
@@ -754,14 +852,20 @@ def _import_v1(
     missing_type_names = []
     dependencies = package.get("dependencies", [])
     if dependencies:
-        missing = _check_missing_hdas(dependencies)
+        # Placeholder mode needs every missing type name; otherwise we only
+        # need enough for the error message.
+        missing = _check_missing_hdas(
+            dependencies,
+            max_missing=None if allow_placeholders else _MAX_REPORTED_MISSING,
+        )
         if missing:
             if allow_placeholders:
                 use_placeholders = True
                 missing_type_names = [dep.get("name") for dep in missing if dep.get("name")]
                 print(f"[Sopdrop] Using placeholders for {len(missing_type_names)} missing HDA(s): {', '.join(missing_type_names)}")
             else:
-                raise MissingDependencyError(_format_missing_deps_error(missing))
+                raise MissingDependencyError(
+                    _format_missing_deps_error(missing, max_listed=_MAX_REPORTED_MISSING))
 
     # Get the code
     code = package.get("code", "")
@@ -816,7 +920,7 @@ def _import_v1(
                 print(f"[Sopdrop] Could not create container '{type_name}' (type not available), loading flat")
 
     # Track items before import
-    items_before = set(target_node.allItems())
+    items_before = frozenset(target_node.allItems())
 
     # Build the exec namespace — use proxy parent if placeholders are needed
     if use_placeholders:
@@ -854,8 +958,6 @@ def _import_v1_inner(
     missing_type_names, items_before, position, package_meta=None,
 ):
     """Inner import logic, runs inside an undo group."""
-    import hou
-
     # Execute the code.
     # Strategy: try the full code first. If it fails, make connection/addItem
     # calls resilient (wrap in try/except) and retry so nodes are still created
@@ -873,7 +975,9 @@ def _import_v1_inner(
         namespace = {"hou": hou, "hou_parent": exec_parent}
     exec_error = None
     try:
-        exec(code, namespace)
+        # Compile explicitly so the source is parsed once into a code object.
+        # Keep the "<string>" filename — the traceback parsing below relies on it.
+        exec(compile(code, '<string>', 'exec'), namespace)
     except Exception as e:
         import traceback
         tb = traceback.format_exc()
@@ -901,8 +1005,8 @@ def _import_v1_inner(
         # Retry with resilient connections — wrap setInput/addItem
         # calls in try/except so node creation can complete even if
         # some wiring fails.
-        items_after_fail = set(target_node.allItems())
-        partial_count = len(items_after_fail - items_before)
+        new_partial = [item for item in target_node.allItems() if item not in items_before]
+        partial_count = len(new_partial)
 
         # Decide whether to retry: if nothing was created, or if very
         # few items were created relative to expected (e.g., 3 out of 1600).
@@ -917,7 +1021,6 @@ def _import_v1_inner(
             # arbitrary order (e.g., child after parent) can segfault.
             if partial_count > 0:
                 print(f"[Sopdrop] Only {partial_count}/{expected} items created. Cleaning up partial result...")
-                new_partial = items_after_fail - items_before
                 top_level_to_destroy = []
                 for item in new_partial:
                     try:
@@ -958,8 +1061,7 @@ def _import_v1_inner(
             print(f"[Sopdrop] Continuing with partial result. Some connections may be missing.")
 
     # Find newly created items
-    items_after = set(target_node.allItems())
-    new_items = list(items_after - items_before)
+    new_items = [item for item in target_node.allItems() if item not in items_before]
 
     # Separate items by type (same approach as v2 import)
     new_nodes = []
@@ -995,62 +1097,49 @@ def _import_v1_inner(
     nodes_in_boxes = set()
     for netbox in new_netboxes:
         try:
-            for n in netbox.nodes():
-                nodes_in_boxes.add(n.path())
+            nodes_in_boxes.update(netbox.nodes())
         except Exception:
             pass
 
-    nodes_to_move = [n for n in new_nodes if n.path() not in nodes_in_boxes]
+    nodes_to_move = [n for n in new_nodes if n not in nodes_in_boxes]
 
     # Capture netbox data for proper repositioning (top-level only)
-    netbox_data = {}
+    netbox_saved = []
     for netbox in top_level_netboxes:
         try:
             pos = netbox.position()
             size = netbox.size()
-            netbox_data[id(netbox)] = {
-                'pos': (pos[0], pos[1]),
-                'size': (size[0], size[1]),
-                'comment': netbox.comment() or 'unnamed',
-            }
+            comment = (netbox.comment() or 'unnamed') if _DEBUG else None
+            netbox_saved.append((netbox, (pos[0], pos[1]), (size[0], size[1]), comment))
         except Exception:
-            pass
+            netbox_saved.append((netbox, None, None, None))
 
-    # Capture sticky data and separate loose stickies from box-contained ones
-    sticky_data = {}
-    stickies_to_move = []
+    # Capture sticky data and separate loose stickies from box-contained ones.
+    # Stickies we fail to inspect are moved like plain items.
+    sticky_saved = []
+    loose_stickies = []
     for sticky in new_stickies:
         try:
             parent_box = sticky.parentNetworkBox()
             if parent_box is None:
-                stickies_to_move.append(sticky)
                 pos = sticky.position()
                 size = sticky.size()
-                sticky_data[id(sticky)] = {
-                    'pos': (pos[0], pos[1]),
-                    'size': (size[0], size[1]),
-                    'text': (sticky.text() or '')[:20],
-                }
+                text_preview = (sticky.text() or '')[:20] if _DEBUG else None
+                sticky_saved.append((sticky, (pos[0], pos[1]), (size[0], size[1]), text_preview))
         except Exception:
-            stickies_to_move.append(sticky)
+            loose_stickies.append(sticky)
 
     # Reposition: move loose nodes + loose stickies + dots individually,
     # move top-level network boxes separately (which moves their contents too)
-    items_to_move = nodes_to_move + stickies_to_move + new_dots
-    if position and (items_to_move or top_level_netboxes):
-        _reposition_items(items_to_move, position, top_level_netboxes, netbox_data, sticky_data)
+    items_to_move = nodes_to_move + loose_stickies + new_dots
+    if position and (items_to_move or sticky_saved or netbox_saved):
+        _reposition_items(items_to_move, position, netbox_saved, sticky_saved)
 
     # All top-level items for selection
     all_top_level = new_nodes + new_netboxes + new_stickies + new_dots
 
     # Clear existing selection, then select the new items
-    target_node.setSelected(False, clear_all_selected=True)
-    for item in all_top_level:
-        try:
-            if hasattr(item, 'setSelected'):
-                item.setSelected(True, clear_all_selected=False)
-        except Exception:
-            pass
+    _select_items(all_top_level)
 
     return all_top_level
 
@@ -1073,7 +1162,8 @@ def import_at_cursor(package: Dict[str, Any], allow_placeholders: bool = False)
     Returns:
         List of created items
     """
-    import hou
+    if hou is None:
+        raise ImportError("Houdini not available")
 
     pane = hou.ui.paneTabOfType(hou.paneTabType.NetworkEditor)
     if not pane:
@@ -1172,49 +1262,60 @@ def _get_context(node) -> str:
         return 'unknown'
 
 
-def _check_missing_hdas(dependencies: List[Dict]) -> List[Dict]:
+def _check_missing_hdas(dependencies: List[Dict], max_missing: Optional[int] = None) -> List[Dict]:
     """Check which HDA dependencies are missing.
 
     Returns list of dicts for each missing dependency, preserving all
     original fields (name, category, label, operator_type, sopdrop_slug, etc.).
-    """
-    import hou
 
+    If max_missing is set, the scan stops once more than max_missing
+    dependencies are missing, so the result holds at most max_missing + 1
+    entries. Use this when the caller only reports the failure.
+    """
     missing = []
 
+    # Enumerate categories once and fetch each category's type map on first
+    # use, rather than re-walking the whole type system per dependency.
+    try:
+        categories = hou.nodeTypeCategories()
+    except Exception:
+        categories = {}
+    type_maps = {}   # category name -> (nodeTypes() dict, set of base names)
+
     for dep in dependencies:
         name = dep.get("name")
         category_name = dep.get("category", "Sop")
         if not name:
             continue
 
+        if category_name not in type_maps:
+            entry = None
+            try:
+                cat = categories.get(category_name)
+                if cat:
+                    types = cat.nodeTypes()
+                    bases = {r.rsplit("::", 1)[0] if "::" in r else r for r in types}
+                    entry = (types, bases)
+            except Exception:
+                pass
+            type_maps[category_name] = entry
+
         found = False
-        cat = None
-        all_types = None
-        try:
-            categories = hou.nodeTypeCategories()
-            cat = categories.get(category_name)
-            if cat:
-                # Look through all registered types in this category.
-                # hou.nodeType() can miss namespaced or versioned HDAs,
-                # so we check the full type map directly.
-                all_types = cat.nodeTypes()
-                if name in all_types:
-                    found = True
-                else:
-                    # Handle version mismatches: an HDA registered as
-                    # "ns::Foo::2.0" should match dep name "ns::Foo",
-                    # and vice versa.
-                    for registered_name in all_types:
-                        base = registered_name.rsplit("::", 1)[0] if "::" in registered_name else registered_name
-                        dep_base = name.rsplit("::", 1)[0] if "::" in name else name
-                        if registered_name == name or base == name or registered_name == dep_base or base == dep_base:
-                            found = True
-                            break
-        except Exception:
-            pass
+        all_types, bases = type_maps[category_name] or (None, None)
+        if all_types is not None:
+            # Look through all registered types in this category.
+            # hou.nodeType() can miss namespaced or versioned HDAs,
+            # so we check the full type map directly.
+            #
+            # Handle version mismatches: an HDA registered as
+            # "ns::Foo::2.0" should match dep name "ns::Foo",
+            # and vice versa.
+            dep_base = name.rsplit("::", 1)[0] if "::" in name else name
+            if (name in all_types or name in bases
+                    or dep_base in all_types or dep_base in bases):
+                found = True
 
-        if not found and cat and all_types is not None:
+        if not found and all_types is not None:
             # Debug: log close matches to help diagnose lookup failures
             name_lower = name.lower()
             close = [r for r in all_types if name_lower in r.lower()]
@@ -1227,13 +1328,24 @@ def _check_missing_hdas(dependencies: List[Dict]) -> List[Dict]:
 
         if not found:
             missing.append(dep)
+            if max_missing is not None and len(missing) > max_missing:
+                break
 
     return missing
 
 
-def _format_missing_deps_error(missing: List[Dict], **kwargs) -> str:
-    """Format a human-readable error message for missing HDA dependencies."""
-    lines = [f"Missing {len(missing)} HDA dependenc{'y' if len(missing) == 1 else 'ies'}:"]
+def _format_missing_deps_error(missing: List[Dict], max_listed: Optional[int] = None, **kwargs) -> str:
+    """Format a human-readable error message for missing HDA dependencies.
+
+    With max_listed, only that many are listed and a longer list is
+    reported as truncated (see _check_missing_hdas(max_missing=...)).
+    """
+    truncated = max_listed is not None and len(missing) > max_listed
+    if truncated:
+        missing = missing[:max_listed]
+        lines = [f"Missing {max_listed}+ HDA dependencies:"]
+    else:
+        lines = [f"Missing {len(missing)} HDA dependenc{'y' if len(missing) == 1 else 'ies'}:"]
     for dep in missing:
         label = dep.get("label") or dep.get("name", "unknown")
         category = dep.get("category", "")
@@ -1242,118 +1354,109 @@ def _format_missing_deps_error(missing: List[Dict], **kwargs) -> str:
             lines.append(f"  - {label} ({category}) -> sopdrop.install(\"{slug}\")")
         else:
             lines.append(f"  - {label} ({category})")
+    if truncated:
+        lines.append("  (and more)")
     lines.append("")
     lines.append("Install the missing HDAs and try again,")
     lines.append("or paste with allow_placeholders=True to load with error nodes.")
     return "\n".join(lines)
 
 
-def _reposition_items(items, target_position: Tuple[float, float], network_boxes=None, netbox_data=None, sticky_data=None) -> None:
+def _select_items(items) -> None:
+    """Replace the current selection with the given items.
+
+    Clears everything with one hou.clearAllSelected() call instead of
+    deselecting per network. Callers run inside import_items()'s
+    "Sopdrop Paste" undo group, so the selection changes land in that
+    single undo entry rather than one per item.
+    """
+    hou.clearAllSelected()
+    try:
+        for item in items:
+            item.setSelected(True, clear_all_selected=False)
+    except Exception:
+        pass
+
+
+def _reposition_items(items, target_position: Tuple[float, float], netbox_saved=None, sticky_saved=None) -> None:
     """Reposition items so their bounding box CENTER is at target_position.
 
+    Args:
+        items: Loose nodes, dots and uncaptured stickies, moved with move()
+        target_position: Where the combined bounding box center should land
+        netbox_saved: (netbox, pos, size, comment) tuples for top-level
+            network boxes, captured before any operations. pos/size may be
+            None if capture failed.
+        sticky_saved: (sticky, pos, size, text) tuples for loose stickies
+
     Strategy:
     - Calculate offset from current center to target
     - Move all loose nodes/stickies by that offset
     - Move network boxes by that offset and restore their original size
-    - Restore sticky note sizes after moving
     """
-    import hou
-
-    if not items and not network_boxes:
-        print("[Sopdrop] _reposition_items: No items to reposition")
+    if netbox_saved is None:
+        netbox_saved = []
+    if sticky_saved is None:
+        sticky_saved = []
+
+    if not items and not netbox_saved and not sticky_saved:
+        if _DEBUG:
+            print("[Sopdrop] _reposition_items: No items to reposition")
         return
 
-    if network_boxes is None:
-        network_boxes = []
-    if netbox_data is None:
-        netbox_data = {}
-    if sticky_data is None:
-        sticky_data = {}
-
-    # Calculate current bounding box including network boxes
+    # Calculate current bounding box including network boxes.
+    # Gather one (x0, y0, x1, y1) rect per item, then reduce each column
+    # with the builtin min()/max() instead of four running comparisons.
     # Use SAVED positions/sizes where available for accuracy
-    min_x = float('inf')
-    min_y = float('inf')
-    max_x = float('-inf')
-    max_y = float('-inf')
+    rects = []
 
-    # Include nodes and sticky notes in bounds
+    # Include nodes, dots and uncaptured stickies in bounds
     for item in items:
         try:
-            # For sticky notes, use saved data if available
+            pos = item.position()
+            x, y = pos[0], pos[1]
             if isinstance(item, hou.StickyNote):
-                data = sticky_data.get(id(item), {})
-                saved_pos = data.get('pos')
-                saved_size = data.get('size')
-
-                if saved_pos and saved_size:
-                    x, y = saved_pos
-                    min_x = min(min_x, x)
-                    min_y = min(min_y, y)
-                    max_x = max(max_x, x + saved_size[0])
-                    max_y = max(max_y, y + saved_size[1])
-                else:
-                    # Fallback to current values
-                    pos = item.position()
-                    x, y = pos[0], pos[1]
-                    min_x = min(min_x, x)
-                    min_y = min(min_y, y)
-                    try:
-                        size = item.size()
-                        max_x = max(max_x, x + size[0])
-                        max_y = max(max_y, y + size[1])
-                    except:
-                        max_x = max(max_x, x + 3)
-                        max_y = max(max_y, y + 1)
+                try:
+                    size = item.size()
+                    rects.append((x, y, x + size[0], y + size[1]))
+                except:
+                    rects.append((x, y, x + 3, y + 1))
             elif isinstance(item, hou.NetworkDot):
                 # Dots are point-sized connector waypoints
-                pos = item.position()
-                x, y = pos[0], pos[1]
-                min_x = min(min_x, x)
-                min_y = min(min_y, y)
-                max_x = max(max_x, x)
-                max_y = max(max_y, y)
+                rects.append((x, y, x, y))
             else:
-                # Regular nodes
-                pos = item.position()
-                x, y = pos[0], pos[1]
-                min_x = min(min_x, x)
-                min_y = min(min_y, y)
-                # Nodes are roughly 2x1 units
-                max_x = max(max_x, x + 2)
-                max_y = max(max_y, y + 1)
-
+                # Regular nodes are roughly 2x1 units
+                rects.append((x, y, x + 2, y + 1))
         except Exception as e:
             print(f"[Sopdrop] Error getting position for {item}: {e}")
 
+    for sticky, saved_pos, saved_size, _text in sticky_saved:
+        x, y = saved_pos
+        rects.append((x, y, x + saved_size[0], y + saved_size[1]))
+
     # Include network boxes in bounds (use saved data for accurate sizes)
-    for netbox in network_boxes:
+    for netbox, saved_pos, saved_size, _comment in netbox_saved:
         try:
-            data = netbox_data.get(id(netbox), {})
-            saved_pos = data.get('pos')
-            saved_size = data.get('size')
-
             if saved_pos and saved_size:
-                min_x = min(min_x, saved_pos[0])
-                min_y = min(min_y, saved_pos[1])
-                max_x = max(max_x, saved_pos[0] + saved_size[0])
-                max_y = max(max_y, saved_pos[1] + saved_size[1])
+                rects.append((saved_pos[0], saved_pos[1],
+                              saved_pos[0] + saved_size[0], saved_pos[1] + saved_size[1]))
             else:
                 # Fallback to current values
                 pos = netbox.position()
                 size = netbox.size()
-                min_x = min(min_x, pos[0])
-                min_y = min(min_y, pos[1])
-                max_x = max(max_x, pos[0] + size[0])
-                max_y = max(max_y, pos[1] + size[1])
+                rects.append((pos[0], pos[1], pos[0] + size[0], pos[1] + size[1]))
         except Exception as e:
             print(f"[Sopdrop] Error getting netbox bounds: {e}")
 
     # Check if we found valid positions
-    if min_x == float('inf') or min_y == float('inf'):
+    if not rects:
         print("[Sopdrop] _reposition_items: Could not calculate bounding box")
         return
 
+    xs0, ys0, xs1, ys1 = zip(*rects)
+    min_x, min_y = min(xs0), min(ys0)
+    max_x, max_y = max(xs1), max(ys1)
+
     # Calculate center of bounding box
     center_x = (min_x + max_x) / 2
     center_y = (min_y + max_y) / 2
@@ -1362,52 +1465,44 @@ def _reposition_items(items, target_position: Tuple[float, float], network_boxes
     offset_x = target_position[0] - center_x
     offset_y = target_position[1] - center_y
 
-    print(f"[Sopdrop] Bounding box: ({min_x:.1f}, {min_y:.1f}) to ({max_x:.1f}, {max_y:.1f})")
-    print(f"[Sopdrop] Center: ({center_x:.1f}, {center_y:.1f}) -> Target: ({target_position[0]:.1f}, {target_position[1]:.1f})")
-    print(f"[Sopdrop] Offset: ({offset_x:.1f}, {offset_y:.1f})")
+    if _DEBUG:
+        print(f"[Sopdrop] Bounding box: ({min_x:.1f}, {min_y:.1f}) to ({max_x:.1f}, {max_y:.1f})")
+        print(f"[Sopdrop] Center: ({center_x:.1f}, {center_y:.1f}) -> Target: ({target_position[0]:.1f}, {target_position[1]:.1f})")
+        print(f"[Sopdrop] Offset: ({offset_x:.1f}, {offset_y:.1f})")
+
+    # Already centered on the target (e.g. pasting back where it was copied)
+    # — skip the per-item move calls entirely.
+    if abs(offset_x) + abs(offset_y) < 0.01:
+        return
 
     offset_vec = hou.Vector2(offset_x, offset_y)
 
-    # Move nodes and sticky notes
+    # Move nodes, dots and uncaptured stickies
     moved_count = 0
     for item in items:
         try:
-            if isinstance(item, hou.StickyNote):
-                # For sticky notes, calculate new position from saved data
-                data = sticky_data.get(id(item), {})
-                saved_pos = data.get('pos')
-                saved_size = data.get('size')
-
-                if saved_pos:
-                    # Set position directly using saved position + offset
-                    new_x = saved_pos[0] + offset_x
-                    new_y = saved_pos[1] + offset_y
-                    item.setPosition(hou.Vector2(new_x, new_y))
-                    # Restore size
-                    if saved_size:
-                        item.setSize(hou.Vector2(saved_size[0], saved_size[1]))
-                    text_preview = data.get('text', '')
-                    print(f"[Sopdrop] Moved sticky '{text_preview}...' to ({new_x:.1f}, {new_y:.1f}), size: {saved_size}")
-                else:
-                    # Fallback - just use move
-                    item.move(offset_vec)
-            else:
-                # Regular nodes - just move
-                item.move(offset_vec)
+            item.move(offset_vec)
             moved_count += 1
         except Exception as e:
             print(f"[Sopdrop] Error moving {item}: {e}")
 
-    # Move network boxes - use saved data from BEFORE any operations
-    for netbox in network_boxes:
+    # Set sticky positions directly from saved position + offset.
+    # hou.StickyNote.setPosition() preserves size, so unlike network
+    # boxes there is nothing to restore afterwards.
+    for sticky, saved_pos, _size, text_preview in sticky_saved:
         try:
-            # Get the data we saved at the very beginning
-            data = netbox_data.get(id(netbox), {})
-            saved_size = data.get('size')
-            comment = data.get('comment', 'unnamed')
-
-            old_pos = netbox.position()
+            new_x = saved_pos[0] + offset_x
+            new_y = saved_pos[1] + offset_y
+            sticky.setPosition(hou.Vector2(new_x, new_y))
+            if _DEBUG:
+                print(f"[Sopdrop] Moved sticky '{text_preview}...' to ({new_x:.1f}, {new_y:.1f})")
+            moved_count += 1
+        except Exception as e:
+            print(f"[Sopdrop] Error moving {sticky}: {e}")
 
+    # Move network boxes - use saved data from BEFORE any operations
+    for netbox, saved_pos, saved_size, comment in netbox_saved:
+        try:
             # Use move() to move both box and contents
             netbox.move(offset_vec)
 
@@ -1415,13 +1510,17 @@ def _reposition_items(items, target_position: Tuple[float, float], network_boxes
             if saved_size:
                 netbox.setSize(hou.Vector2(saved_size[0], saved_size[1]))
 
-            new_pos = netbox.position()
-            print(f"[Sopdrop] Moved netbox '{comment}' from ({old_pos[0]:.1f}, {old_pos[1]:.1f}) to ({new_pos[0]:.1f}, {new_pos[1]:.1f}), restored size: {saved_size}")
+            if _DEBUG and saved_pos:
+                # Derive positions from the saved data rather than reading
+                # them back from Houdini.
+                new_pos = (saved_pos[0] + offset_x, saved_pos[1] + offset_y)
+                print(f"[Sopdrop] Moved netbox '{comment}' from ({saved_pos[0]:.1f}, {saved_pos[1]:.1f}) to ({new_pos[0]:.1f}, {new_pos[1]:.1f}), restored size: {saved_size}")
             moved_count += 1
         except Exception as e:
             print(f"[Sopdrop] Error moving netbox: {e}")
 
-    print(f"[Sopdrop] Moved {moved_count} items total")
+    if _DEBUG:
+        print(f"[Sopdrop] Moved {moved_count} items total")
 
 
 # Legacy function for backwards compatibility
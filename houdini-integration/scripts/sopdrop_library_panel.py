@@ -7004,8 +7004,9 @@ class LibraryPanel(QtWidgets.QWidget):
     def _finalize_bulk_delete(self, asset_ids):
         """Actually delete bulk assets after undo period."""
         if hasattr(self, '_pending_bulk_delete_ids') and self._pending_bulk_delete_ids == asset_ids:
-            for aid in asset_ids:
-                library.delete_asset(aid)
+            with library.deferred_menu_regenerate():
+                for aid in asset_ids:
+                    library.delete_asset(aid)
             self._pending_bulk_delete_ids = []
             self._invalidate_cache()
             self.collections.refresh()
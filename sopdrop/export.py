@@ -125,9 +125,13 @@ def _export_v2(items) -> Dict[str, Any]:
         except OSError:
             pass
 
-    # Encode and checksum
+    # Encode and checksum. "checksum" stays SHA-256 of the decoded bytes,
+    # which is what every released importer verifies. "checksum_b64" covers
+    # the base64 text so newer importers can verify before decoding; it is
+    # BLAKE2b truncated to 32 bytes (see "checksum_b64_algo").
     encoded_data = base64.b64encode(binary_data).decode('ascii')
     checksum = hashlib.sha256(binary_data).hexdigest()
+    checksum_b64 = hashlib.blake2b(encoded_data.encode('ascii'), digest_size=32).hexdigest()
 
     return {
         "format": "sopdrop-v2",
@@ -147,6 +151,8 @@ def _export_v2(items) -> Dict[str, Any]:
         "dependencies": dependencies,
         "data": encoded_data,
         "checksum": checksum,
+        "checksum_b64": checksum_b64,
+        "checksum_b64_algo": "blake2b",
     }
 
 
@@ -16,24 +16,39 @@ Directory structure:
 │       └── {uuid}.sopdrop
 """
 
+import io
 import os
 import json
+import time
 import uuid
 import shutil
+import getpass
+import hashlib
 import sqlite3
 import tempfile
+import functools
 import threading
-import warnings
+import traceback
+import webbrowser
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple
+from urllib.error import HTTPError
+from urllib.request import Request
 
 from .config import (
     get_config_dir, get_library_path, get_active_library,
     get_team_library_path, get_team_mirror_dir,
     get_team_mirror_db_path, get_team_mirror_thumbnails_dir,
+    set_active_library, get_config, get_api_url, get_token,
+    get_cache_dir, get_team_slug, get_team_name, use_lan_trust_auth,
+    get_sqlite_mmap,
 )
+from . import _get_client  # shared SopdropClient
+from .api import NotFoundError, _ssl_urlopen
 from . import _team_http  # HTTP-mode team library shim (see _team_http.py)
+from . import _json  # orjson when available, stdlib json otherwise
 
 import re as _re
 
@@ -51,16 +66,24 @@ def _http_mode():
 # Atomic File Write Helpers
 # ==============================================================================
 
+# Read size for hashing files in chunks (1 MiB)
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
 def _atomic_write_text(target_path, content):
     """Write text to a file atomically (temp + os.replace).
 
-    On failure the temp file is removed and the original is untouched.
+    The temp file is fsynced before the rename, so the replace is the
+    commit point. On failure the temp file is removed and the original is
+    untouched.
     """
     target_path = Path(target_path)
     fd, tmp = tempfile.mkstemp(dir=str(target_path.parent), suffix='.tmp')
     try:
         with os.fdopen(fd, 'w') as f:
             f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(tmp, str(target_path))
     except BaseException:
         try:
@@ -77,6 +100,8 @@ def _atomic_write_bytes(target_path, data):
     try:
         with os.fdopen(fd, 'wb') as f:
             f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(tmp, str(target_path))
     except BaseException:
         try:
@@ -86,13 +111,64 @@ def _atomic_write_bytes(target_path, data):
         raise
 
 
+def _copy_fileobj(src, dst):
+    """Copy an open file to another, in the kernel when the OS allows it.
+
+    os.copy_file_range (Linux) never moves the data through userspace and
+    can reflink on Btrfs/XFS. Filesystems that refuse it (SMB shares,
+    cross-device copies) fall back to a buffered copy from where it left off.
+    Some filesystems answer with 0 (EOF) straight away instead of an error,
+    so a short kernel copy is finished the buffered way too.
+    """
+    if hasattr(os, 'copy_file_range'):
+        copied = 0
+        try:
+            while True:
+                n = os.copy_file_range(src.fileno(), dst.fileno(), 1 << 30)
+                if not n:
+                    break
+                copied += n
+            if copied >= os.fstat(src.fileno()).st_size:
+                return
+        except OSError:
+            pass
+    shutil.copyfileobj(src, dst, _HASH_CHUNK_SIZE)
+
+
 def _atomic_copy(source_path, dest_path):
     """Copy a file atomically (copy to temp in dest dir, then os.replace)."""
     dest_path = Path(dest_path)
     fd, tmp = tempfile.mkstemp(dir=str(dest_path.parent), suffix='.tmp')
-    os.close(fd)
     try:
-        shutil.copy2(str(source_path), tmp)
+        with open(source_path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+            _copy_fileobj(src, dst)
+        shutil.copystat(str(source_path), tmp)  # Preserve metadata like copy2
+        os.replace(tmp, str(dest_path))
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _atomic_copy_hashed(source_path, dest_path):
+    """Copy a file atomically, hashing it on the way through.
+
+    Reads the source once, feeding each chunk to SHA-256 and the temp file.
+    Returns (sha256 hex digest, size in bytes).
+    """
+    dest_path = Path(dest_path)
+    hasher = hashlib.sha256()
+    file_size = 0
+    fd, tmp = tempfile.mkstemp(dir=str(dest_path.parent), suffix='.tmp')
+    try:
+        with open(source_path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+            for chunk in iter(lambda: src.read(_HASH_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+                dst.write(chunk)
+                file_size += len(chunk)
+        shutil.copystat(str(source_path), tmp)  # Preserve metadata like copy2
         os.replace(tmp, str(dest_path))
     except BaseException:
         try:
@@ -100,6 +176,7 @@ def _atomic_copy(source_path, dest_path):
         except OSError:
             pass
         raise
+    return hasher.hexdigest(), file_size
 
 
 # ==============================================================================
@@ -291,6 +368,61 @@ def detect_houdini_license():
 # Database Schema
 # ==============================================================================
 
+# Stored in PRAGMA user_version once _run_migrations() has brought a
+# database up to date. Bump it whenever a migration step is added.
+SCHEMA_VERSION = 12
+
+# Per-tag live-asset counts read by get_all_tags(). The triggers keep them
+# in step with asset_tags and with trash/restore/purge of library_assets,
+# so writes from any client on a shared library are counted. A hard
+# delete is counted BEFORE it runs: by the time the FK cascade removes
+# the asset_tags rows, the asset row is already gone.
+_TAG_COUNTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tag_counts (
+    tag TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS tag_counts_tag_insert AFTER INSERT ON asset_tags
+WHEN EXISTS (SELECT 1 FROM library_assets WHERE id = NEW.asset_id AND deleted_at IS NULL)
+BEGIN
+    INSERT OR IGNORE INTO tag_counts (tag, count) VALUES (NEW.tag, 0);
+    UPDATE tag_counts SET count = count + 1 WHERE tag = NEW.tag;
+END;
+
+CREATE TRIGGER IF NOT EXISTS tag_counts_tag_delete AFTER DELETE ON asset_tags
+WHEN EXISTS (SELECT 1 FROM library_assets WHERE id = OLD.asset_id AND deleted_at IS NULL)
+BEGIN
+    UPDATE tag_counts SET count = count - 1 WHERE tag = OLD.tag;
+    DELETE FROM tag_counts WHERE tag = OLD.tag AND count <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS tag_counts_asset_trash AFTER UPDATE OF deleted_at ON library_assets
+WHEN OLD.deleted_at IS NULL AND NEW.deleted_at IS NOT NULL
+BEGIN
+    UPDATE tag_counts SET count = count - 1
+    WHERE tag IN (SELECT tag FROM asset_tags WHERE asset_id = NEW.id);
+    DELETE FROM tag_counts WHERE count <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS tag_counts_asset_restore AFTER UPDATE OF deleted_at ON library_assets
+WHEN OLD.deleted_at IS NOT NULL AND NEW.deleted_at IS NULL
+BEGIN
+    INSERT OR IGNORE INTO tag_counts (tag, count)
+    SELECT tag, 0 FROM asset_tags WHERE asset_id = NEW.id;
+    UPDATE tag_counts SET count = count + 1
+    WHERE tag IN (SELECT tag FROM asset_tags WHERE asset_id = NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS tag_counts_asset_delete BEFORE DELETE ON library_assets
+WHEN OLD.deleted_at IS NULL
+BEGIN
+    UPDATE tag_counts SET count = count - 1
+    WHERE tag IN (SELECT tag FROM asset_tags WHERE asset_id = OLD.id);
+    DELETE FROM tag_counts WHERE count <= 0;
+END;
+"""
+
 SCHEMA = """
 -- Collections (folders/categories for organization)
 CREATE TABLE IF NOT EXISTS collections (
@@ -366,7 +498,9 @@ CREATE TABLE IF NOT EXISTS collection_assets (
     PRIMARY KEY (collection_id, asset_id)
 );
 
--- Asset tags index for fast filtering
+-- Asset tags index for fast filtering. Derived from library_assets.tags,
+-- which stays the source of truth: it feeds assets_fts and is used to
+-- rebuild these rows when a trashed asset is restored.
 CREATE TABLE IF NOT EXISTS asset_tags (
     asset_id TEXT NOT NULL REFERENCES library_assets(id) ON DELETE CASCADE,
     tag TEXT NOT NULL,
@@ -398,6 +532,7 @@ CREATE TABLE IF NOT EXISTS asset_versions (
 );
 
 CREATE INDEX IF NOT EXISTS idx_asset_versions_asset ON asset_versions(asset_id);
+CREATE INDEX IF NOT EXISTS idx_versions_asset_created ON asset_versions(asset_id, created_at DESC);
 
 -- User preferences and state
 CREATE TABLE IF NOT EXISTS user_prefs (
@@ -413,19 +548,35 @@ CREATE TABLE IF NOT EXISTS library_meta (
 
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_assets_context ON library_assets(context);
-CREATE INDEX IF NOT EXISTS idx_assets_name ON library_assets(name);
-CREATE INDEX IF NOT EXISTS idx_assets_created ON library_assets(created_at);
-CREATE INDEX IF NOT EXISTS idx_assets_last_used ON library_assets(last_used_at);
-CREATE INDEX IF NOT EXISTS idx_assets_use_count ON library_assets(use_count);
+-- Sort keys for search_assets(), with id as the keyset-pagination tiebreaker.
+-- deleted_at is carried along so paging a search reads only the index, not
+-- the (wide) rows it skips.
+CREATE INDEX IF NOT EXISTS idx_assets_sort_updated ON library_assets(updated_at, id, deleted_at);
+CREATE INDEX IF NOT EXISTS idx_assets_sort_created ON library_assets(created_at, id, deleted_at);
+CREATE INDEX IF NOT EXISTS idx_assets_sort_name ON library_assets(name, id, deleted_at);
+CREATE INDEX IF NOT EXISTS idx_assets_sort_last_used ON library_assets(last_used_at, id, deleted_at);
+CREATE INDEX IF NOT EXISTS idx_assets_sort_use_count ON library_assets(use_count, id, deleted_at);
+-- Per-context "recent" / "frequent" listings: filter and sort in one range scan
+CREATE INDEX IF NOT EXISTS idx_assets_context_last_used ON library_assets(context, last_used_at DESC);
+CREATE INDEX IF NOT EXISTS idx_assets_context_use_count ON library_assets(context, use_count DESC);
 CREATE INDEX IF NOT EXISTS idx_assets_remote_slug ON library_assets(remote_slug);
-CREATE INDEX IF NOT EXISTS idx_tags_tag ON asset_tags(tag);
+-- Only the few assets mid-upload, for cleanup_stale_syncing()
+CREATE INDEX IF NOT EXISTS idx_assets_syncing_updated ON library_assets(updated_at) WHERE sync_status = 'syncing';
+-- Covering for tag filters: tag range probe yields asset_ids without row reads
+CREATE INDEX IF NOT EXISTS idx_tags_tag_asset ON asset_tags(tag, asset_id);
 CREATE INDEX IF NOT EXISTS idx_collections_parent ON collections(parent_id);
 CREATE INDEX IF NOT EXISTS idx_collection_assets_asset ON collection_assets(asset_id);
-"""
+CREATE INDEX IF NOT EXISTS idx_collection_assets_sort ON collection_assets(collection_id, sort_order);
+""" + _TAG_COUNTS_SCHEMA
+
+# The trigram tokenizer (SQLite 3.34+) indexes every 3-character run, so
+# substring queries hit the index instead of scanning library_assets.
+# Older SQLite builds keep the default unicode61 tokenizer.
+_FTS_TRIGRAM = sqlite3.sqlite_version_info >= (3, 34, 0)
 
 # FTS5 schema separated so a failure doesn't block core functionality.
 # FTS5 uses memory-mapped I/O which can crash on network/shared drives.
-FTS_SCHEMA = """
+_FTS_SCHEMA_TEMPLATE = """
 -- Full-text search (SQLite FTS5)
 CREATE VIRTUAL TABLE IF NOT EXISTS assets_fts USING fts5(
     name,
@@ -433,7 +584,7 @@ CREATE VIRTUAL TABLE IF NOT EXISTS assets_fts USING fts5(
     tags,
     node_types,
     content=library_assets,
-    content_rowid=rowid
+    content_rowid=rowid{tokenize}
 );
 
 -- Triggers to keep FTS in sync
@@ -447,7 +598,10 @@ CREATE TRIGGER IF NOT EXISTS assets_fts_delete AFTER DELETE ON library_assets BE
     VALUES ('delete', OLD.rowid, OLD.name, OLD.description, OLD.tags, OLD.node_types);
 END;
 
-CREATE TRIGGER IF NOT EXISTS assets_fts_update AFTER UPDATE ON library_assets BEGIN
+-- Only fires when an indexed column changes, so use_count/last_used_at
+-- bumps don't rewrite the index.
+CREATE TRIGGER IF NOT EXISTS assets_fts_update
+AFTER UPDATE OF name, description, tags, node_types ON library_assets BEGIN
     INSERT INTO assets_fts(assets_fts, rowid, name, description, tags, node_types)
     VALUES ('delete', OLD.rowid, OLD.name, OLD.description, OLD.tags, OLD.node_types);
     INSERT INTO assets_fts(rowid, name, description, tags, node_types)
@@ -455,14 +609,20 @@ CREATE TRIGGER IF NOT EXISTS assets_fts_update AFTER UPDATE ON library_assets BE
 END;
 """
 
+# Databases only this workstation writes use trigram when SQLite has it
+FTS_SCHEMA = _FTS_SCHEMA_TEMPLATE.format(
+    tokenize=",\n    tokenize='trigram'" if _FTS_TRIGRAM else "")
+
+# The shared team database (and its local mirror) keeps unicode61: every
+# workstation writes assets_fts through the triggers, and one whose SQLite
+# predates trigram could no longer insert, update or delete assets
+_SHARED_FTS_SCHEMA = _FTS_SCHEMA_TEMPLATE.format(tokenize="")
+
 
 # ==============================================================================
 # Database Connection
 # ==============================================================================
 
-# Track connection per library path to support switching
-_connections = {}
-_current_db_path = None
 _db_lock = threading.Lock()
 _trash_purged = False
 
@@ -489,14 +649,15 @@ def _get_nas_db():
     if not nas_path or not nas_path.exists():
         return None
     if _nas_connection is None:
-        import time as _time
-        _t0 = _time.time()
+        _t0 = time.time()
         print(f"[Sopdrop] Connecting to NAS DB: {nas_path}")
         _nas_connection = sqlite3.connect(str(nas_path), check_same_thread=False)
         _nas_connection.row_factory = sqlite3.Row
-        _nas_connection.execute("PRAGMA foreign_keys = ON")
-        _nas_connection.execute("PRAGMA mmap_size = 0")
-        _nas_connection.execute("PRAGMA busy_timeout = 15000")
+        _nas_connection.executescript(
+            "PRAGMA foreign_keys = ON;"
+            "PRAGMA mmap_size = 0;"
+            "PRAGMA busy_timeout = 15000;"
+        )
         # No WAL for NAS — network drives can't handle it.
         # Only run schema if the core table is missing — avoids acquiring
         # an exclusive write lock on every connection when the tables
@@ -507,12 +668,12 @@ def _get_nas_db():
         if _needs_schema:
             _nas_connection.executescript(SCHEMA)
             try:
-                _nas_connection.executescript(FTS_SCHEMA)
+                _nas_connection.executescript(_SHARED_FTS_SCHEMA)
             except Exception:
                 pass
-        _run_migrations(_nas_connection)
+        _run_migrations(_nas_connection, shared=True)
         _nas_connection.commit()
-        print(f"[Sopdrop] NAS DB connected ({_time.time() - _t0:.1f}s)")
+        print(f"[Sopdrop] NAS DB connected ({time.time() - _t0:.1f}s)")
     return _nas_connection
 
 
@@ -555,19 +716,13 @@ def refresh_team_mirror(force=False):
     # Ensure mirror directory exists
     mirror_db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Close existing mirror connection before overwriting the file
+    # Drop cached mirror connections before overwriting the file
     mirror_path_str = str(mirror_db_path)
     with _db_lock:
-        if mirror_path_str in _connections:
-            try:
-                _connections[mirror_path_str].close()
-            except Exception:
-                pass
-            del _connections[mirror_path_str]
+        _open_mirror_connection.cache_clear()
 
     # Use SQLite backup API — safe against concurrent writers
-    import time as _time
-    _t0 = _time.time()
+    _t0 = time.time()
     print(f"[Sopdrop] Refreshing team mirror from NAS...")
     source_conn = None
     try:
@@ -578,9 +733,9 @@ def refresh_team_mirror(force=False):
         dest_conn.close()
         _nas_db_mtime = current_mtime
         _mirror_available = True
-        print(f"[Sopdrop] Mirror refreshed ({_time.time() - _t0:.1f}s)")
+        print(f"[Sopdrop] Mirror refreshed ({time.time() - _t0:.1f}s)")
     except Exception as e:
-        print(f"[Sopdrop] Mirror refresh failed ({_time.time() - _t0:.1f}s): {e}")
+        print(f"[Sopdrop] Mirror refresh failed ({time.time() - _t0:.1f}s): {e}")
     finally:
         if source_conn:
             try:
@@ -633,9 +788,6 @@ def _writes_to_nas(fn):
     NAS/SMB filesystems have unreliable SQLite locking, so busy_timeout alone
     isn't enough.
     """
-    import functools
-    import time as _time
-
     @functools.wraps(fn)
     def wrapper(*args, **kwargs):
         if get_active_library() != "team":
@@ -662,12 +814,89 @@ def _writes_to_nas(fn):
                     except Exception:
                         pass
                     _nas_connection = None
-                _time.sleep(wait)
+                time.sleep(wait)
         raise last_err
 
     return wrapper
 
 
+class _immediate_transaction:
+    """Context manager that runs a block as one BEGIN IMMEDIATE ... COMMIT.
+
+    Takes the write lock up front, so multi-statement writes see one
+    consistent snapshot and cost a single commit. Rolls back on error.
+    If the connection already has a transaction open, the block joins it
+    and the outer owner commits.
+    """
+
+    def __init__(self, db):
+        self.db = db
+
+    def __enter__(self):
+        self._owner = not self.db.in_transaction
+        if self._owner:
+            self.db.execute("BEGIN IMMEDIATE")
+        return self.db
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._owner:
+            if exc_type is None:
+                self.db.commit()
+            else:
+                self.db.rollback()
+        return False
+
+
+# Per-thread connection whose writes a transaction() block is batching.
+_txn = threading.local()
+
+
+class transaction:
+    """Context manager that batches library writes into a single commit.
+
+    Opens BEGIN IMMEDIATE on the active library connection. The small
+    mutators (mark_asset_*, prefs, filter presets, sync-state cleanup)
+    skip their own commit inside the block, so a publish flow that calls
+    several of them pays for one commit instead of one per call. Nested
+    blocks join the outermost one. Rolls back on error; files already
+    written or moved on disk (thumbnails, trash) are not put back.
+    """
+
+    def __enter__(self):
+        self._outer = getattr(_txn, 'db', None)
+        if self._outer is not None:
+            return self._outer
+        db = get_db()
+        self._block = _immediate_transaction(db)
+        self._block.__enter__()
+        _txn.db = db
+        # get_db() hands this connection back for the rest of the block,
+        # even if the per-thread connection cache has evicted it meanwhile
+        _txn.path = os.path.abspath(db.execute("PRAGMA database_list").fetchone()[2])
+        return db
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._outer is not None:
+            return False
+        _txn.db = None
+        _txn.path = None
+        return self._block.__exit__(exc_type, exc_val, exc_tb)
+
+
+def _txn_db_for(db_path):
+    """The open transaction() connection on this thread if it is for db_path."""
+    db = getattr(_txn, 'db', None)
+    if db is not None and getattr(_txn, 'path', None) == os.path.abspath(db_path):
+        return db
+    return None
+
+
+def _commit(db):
+    """Commit db, unless a transaction() block on this thread owns it."""
+    if getattr(_txn, 'db', None) is not db:
+        db.commit()
+
+
 def _in_write_mode():
     """Check if we're currently inside a _nas_write_session."""
     return getattr(_write_mode, 'active', False)
@@ -682,7 +911,7 @@ def get_db():
       - On first team access, bootstraps the mirror from NAS
       - If NAS is unavailable but a stale mirror exists, serves from it
     """
-    global _connections, _current_db_path, _trash_purged
+    global _trash_purged
 
     is_team = get_active_library() == "team"
 
@@ -708,166 +937,243 @@ def get_db():
                 pass
             else:
                 db_path = str(mirror_path)
+                txn_db = _txn_db_for(db_path)
+                if txn_db is not None:
+                    return txn_db
                 ensure_library_dirs()
                 with _db_lock:
-                    if db_path != _current_db_path:
-                        _current_db_path = db_path
-
-                    if db_path not in _connections:
-                        conn = sqlite3.connect(db_path, check_same_thread=False)
-                        conn.row_factory = sqlite3.Row
-                        conn.execute("PRAGMA foreign_keys = ON")
-                        conn.execute("PRAGMA busy_timeout = 5000")
-                        # Local mirror can use WAL — major perf win
-                        conn.execute("PRAGMA journal_mode = WAL")
-
-                        # Only run schema if tables are missing — avoids
-                        # unnecessary write locks on the mirror file.
-                        _needs_schema = conn.execute(
-                            "SELECT name FROM sqlite_master WHERE type='table' AND name='library_assets'"
-                        ).fetchone() is None
-                        if _needs_schema:
-                            conn.executescript(SCHEMA)
-                            try:
-                                conn.executescript(FTS_SCHEMA)
-                            except Exception as e:
-                                print(f"[Sopdrop] FTS5 unavailable for mirror: {e}")
-
-                        _run_migrations(conn)
-                        conn.commit()
-                        _connections[db_path] = conn
-
-                    return _connections[db_path]
-
-    # Personal library or fallback
+                    return _open_mirror_connection(db_path, threading.get_ident())
+
+    # Personal library or fallback. In team mode the fallback opens (and
+    # may create) the shared team DB itself, so it gets the shared schema.
     ensure_library_dirs()
     db_path = str(get_library_db_path())
+    txn_db = _txn_db_for(db_path)
+    if txn_db is not None:
+        return txn_db
 
     with _db_lock:
-        # If we switched libraries, we need a new connection
-        if db_path != _current_db_path:
-            _current_db_path = db_path
-
-        # Get or create connection for this path
-        if db_path not in _connections:
-            conn = sqlite3.connect(db_path, check_same_thread=False)
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA foreign_keys = ON")
-            # Disable memory-mapped I/O — prevents segfaults on network/shared
-            # drives (team library folders) where mmap behaves unpredictably.
-            conn.execute("PRAGMA mmap_size = 0")
-            # Wait up to 5 s on a locked DB instead of failing immediately
-            # (team libraries may have concurrent access from multiple users).
-            conn.execute("PRAGMA busy_timeout = 5000")
-
-            conn.execute("PRAGMA journal_mode = WAL")
-
-            # Only run schema if tables are missing
-            _needs_schema = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='library_assets'"
-            ).fetchone() is None
-            if _needs_schema:
-                conn.executescript(SCHEMA)
-                # FTS5 uses mmap internally and can crash on network filesystems.
-                # Create it separately so a failure doesn't block core functionality.
-                try:
-                    conn.executescript(FTS_SCHEMA)
-                except Exception as e:
-                    print(f"[Sopdrop] FTS5 unavailable for {db_path}: {e}")
-
-            # Run migrations for existing databases
-            _run_migrations(conn)
-
-            conn.commit()
-            _connections[db_path] = conn
-
-            # Auto-purge old trash once per session
-            if not _trash_purged:
-                _trash_purged = True
-                try:
-                    _auto_purge_trash(conn)
-                except Exception:
-                    pass
-
-        return _connections[db_path]
+        conn = _open_library_connection(db_path, threading.get_ident(), is_team)
 
+        # Auto-purge old trash once per session
+        if not _trash_purged:
+            _trash_purged = True
+            try:
+                _auto_purge_trash(conn)
+            except Exception:
+                pass
 
-def _run_migrations(conn):
-    """Run database migrations for schema updates."""
-    # Add source and remote_id columns to collections table if they don't exist
-    try:
-        cursor = conn.execute("PRAGMA table_info(collections)")
-        columns = {row[1] for row in cursor.fetchall()}
-
-        if 'source' not in columns:
-            conn.execute("ALTER TABLE collections ADD COLUMN source TEXT DEFAULT 'local'")
+        return conn
+
+
+# Connections are cached per (library path, thread id) so each thread gets
+# its own and readers don't queue behind another thread's statements (WAL
+# lets them run alongside the writer). The LRU bounds how many stay open;
+# an evicted or cleared connection closes once the last caller holding it
+# lets go, so close_db() never closes one out from under a worker thread.
+
+@functools.lru_cache(maxsize=8)
+def _open_mirror_connection(db_path, thread_id):
+    """Open and configure a connection to the local team mirror."""
+    conn = sqlite3.connect(db_path, check_same_thread=False,
+                           cached_statements=512)
+    conn.row_factory = sqlite3.Row
+    # One executescript for the settings that return nothing.
+    # - cache_size: 16 MB page cache (negative = KiB) keeps the wide
+    #   library_assets rows hot.
+    # - temp_store: sorts and temp B-trees stay in RAM.
+    # - mmap_size = 0: the mirror lives under ~/.sopdrop, but home
+    #   directories can themselves be NFS or roaming mounts, so mmap
+    #   stays off unless sqlite_mmap opts in (see below).
+    conn.executescript(
+        "PRAGMA foreign_keys = ON;"
+        "PRAGMA mmap_size = 0;"
+        "PRAGMA busy_timeout = 5000;"
+        "PRAGMA cache_size = -16384;"
+        "PRAGMA temp_store = MEMORY;"
+    )
+    if get_sqlite_mmap():
+        conn.execute("PRAGMA mmap_size = 268435456")
+    # Local mirror can use WAL — major perf win.
+    # In WAL mode synchronous=NORMAL stays crash-safe and drops the fsync
+    # on every commit.
+    mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+    if str(mode).lower() == "wal":
+        conn.execute("PRAGMA synchronous = NORMAL")
+
+    # Only run schema if tables are missing — avoids unnecessary write
+    # locks on the mirror file.
+    _needs_schema = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name='library_assets'"
+    ).fetchone() is None
+    if _needs_schema:
+        conn.executescript(SCHEMA)
+        try:
+            conn.executescript(_SHARED_FTS_SCHEMA)
+        except Exception as e:
+            print(f"[Sopdrop] FTS5 unavailable for mirror: {e}")
 
-        if 'remote_id' not in columns:
-            conn.execute("ALTER TABLE collections ADD COLUMN remote_id TEXT")
+    _run_migrations(conn, shared=True)
+    conn.commit()
+    return conn
 
-    except Exception as e:
-        print(f"[Sopdrop] Migration warning (collections): {e}")
 
-    # Add HDA columns to library_assets table if they don't exist
+def _is_local_config_path(path):
+    """True if path is inside the local ~/.sopdrop config directory."""
     try:
-        cursor = conn.execute("PRAGMA table_info(library_assets)")
-        columns = {row[1] for row in cursor.fetchall()}
+        Path(path).resolve().relative_to(get_config_dir().resolve())
+    except (OSError, ValueError):
+        return False
+    return True
 
-        if 'asset_type' not in columns:
-            conn.execute("ALTER TABLE library_assets ADD COLUMN asset_type TEXT DEFAULT 'node'")
 
-        if 'hda_type_name' not in columns:
-            conn.execute("ALTER TABLE library_assets ADD COLUMN hda_type_name TEXT")
+@functools.lru_cache(maxsize=8)
+def _open_library_connection(db_path, thread_id, shared=False):
+    """Open and configure a connection to a personal (or fallback) library.
 
-        if 'hda_type_label' not in columns:
-            conn.execute("ALTER TABLE library_assets ADD COLUMN hda_type_label TEXT")
+    shared is set when db_path is the team library database, which keeps
+    the unicode61 FTS tokenizer (see _SHARED_FTS_SCHEMA).
+    """
+    conn = sqlite3.connect(db_path, check_same_thread=False,
+                           cached_statements=512)
+    conn.row_factory = sqlite3.Row
+    # Settings that return nothing go through one executescript:
+    # - mmap_size = 0: disable memory-mapped I/O — prevents segfaults
+    #   on network/shared drives where mmap behaves unpredictably.
+    # - busy_timeout: wait up to 5 s on a locked DB instead of failing
+    #   immediately (team libraries may have concurrent access).
+    # - cache_size: 16 MB page cache (negative = KiB) keeps the wide
+    #   library_assets rows hot between queries.
+    # - temp_store: sorts and temp B-trees (ORDER BY without an index,
+    #   DISTINCT) stay in RAM instead of temp files.
+    # - page_size: larger pages pack the JSON-heavy asset rows more
+    #   tightly. Only takes effect on a brand-new file (it must
+    #   precede WAL and the first table).
+    conn.executescript(
+        "PRAGMA foreign_keys = ON;"
+        "PRAGMA mmap_size = 0;"
+        "PRAGMA busy_timeout = 5000;"
+        "PRAGMA cache_size = -16384;"
+        "PRAGMA temp_store = MEMORY;"
+        "PRAGMA page_size = 8192;"
+    )
+    # mmap is opt-in (sqlite_mmap): even ~/.sopdrop may sit on an NFS or
+    # roaming home mount. Custom library paths keep it off regardless.
+    if get_sqlite_mmap() and _is_local_config_path(db_path):
+        conn.execute("PRAGMA mmap_size = 268435456")
+
+    # WAL lets readers run alongside a writer. If the filesystem
+    # can't do WAL (shared-memory file unsupported) SQLite keeps the
+    # rollback journal, where we leave synchronous at FULL.
+    mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+    if str(mode).lower() == "wal":
+        conn.execute("PRAGMA synchronous = NORMAL")
+
+    # Only run schema if tables are missing
+    _needs_schema = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name='library_assets'"
+    ).fetchone() is None
+    if _needs_schema:
+        conn.executescript(SCHEMA)
+        # FTS5 uses mmap internally and can crash on network filesystems.
+        # Create it separately so a failure doesn't block core functionality.
+        try:
+            conn.executescript(_SHARED_FTS_SCHEMA if shared else FTS_SCHEMA)
+        except Exception as e:
+            print(f"[Sopdrop] FTS5 unavailable for {db_path}: {e}")
 
-        if 'hda_version' not in columns:
-            conn.execute("ALTER TABLE library_assets ADD COLUMN hda_version TEXT")
+    # Run migrations for existing databases
+    _run_migrations(conn, shared=shared)
 
-        if 'hda_category' not in columns:
-            conn.execute("ALTER TABLE library_assets ADD COLUMN hda_category TEXT")
+    conn.commit()
+    return conn
+
+
+# (column, declaration) pairs added to each table after its original schema,
+# applied by _run_migrations() when missing
+_COLUMN_MIGRATIONS = {
+    'collections': [
+        ('source', "TEXT DEFAULT 'local'"),
+        ('remote_id', "TEXT"),
+    ],
+    'library_assets': [
+        ('asset_type', "TEXT DEFAULT 'node'"),
+        ('hda_type_name', "TEXT"),
+        ('hda_type_label', "TEXT"),
+        ('hda_version', "TEXT"),
+        ('hda_category', "TEXT"),
+        ('icon', "TEXT"),
+        ('license_type', "TEXT"),
+        ('slug', "TEXT"),
+        ('created_by', "TEXT"),
+        ('deleted_at', "TEXT"),
+        ('is_favorite', "INTEGER DEFAULT 0"),
+    ],
+}
+
+
+def _backfill_asset_columns(conn, added):
+    """Fill in values for library_assets columns that were just added."""
+    if 'slug' in added:
+        # Backfill slugs for existing assets
+        rows = conn.execute("SELECT id, name FROM library_assets WHERE slug IS NULL").fetchall()
+        for row in rows:
+            slug = _generate_slug(row[1], db=conn)
+            conn.execute("UPDATE library_assets SET slug = ? WHERE id = ?", (slug, row[0]))
+        if rows:
+            conn.commit()
 
-        if 'icon' not in columns:
-            conn.execute("ALTER TABLE library_assets ADD COLUMN icon TEXT")
+    if 'created_by' in added:
+        # Backfill with OS username for existing assets
+        try:
+            username = getpass.getuser()
+            conn.execute("UPDATE library_assets SET created_by = ? WHERE created_by IS NULL", (username,))
+            conn.commit()
+        except Exception:
+            pass
 
-        if 'license_type' not in columns:
-            conn.execute("ALTER TABLE library_assets ADD COLUMN license_type TEXT")
 
-        if 'slug' not in columns:
-            conn.execute("ALTER TABLE library_assets ADD COLUMN slug TEXT")
-            # Backfill slugs for existing assets
-            rows = conn.execute("SELECT id, name FROM library_assets WHERE slug IS NULL").fetchall()
-            for row in rows:
-                aid = row[0] if isinstance(row, (tuple, list)) else row['id']
-                aname = row[1] if isinstance(row, (tuple, list)) else row['name']
-                slug = _generate_slug(aname, db=conn)
-                conn.execute("UPDATE library_assets SET slug = ? WHERE id = ?", (slug, aid))
-            if rows:
-                conn.commit()
+# (superseded indexes, index name, columns) for search_assets sorts
+_SORT_INDEXES = (
+    (('idx_assets_updated_id',), 'idx_assets_sort_updated', 'updated_at, id, deleted_at'),
+    (('idx_assets_created', 'idx_assets_created_id'), 'idx_assets_sort_created', 'created_at, id, deleted_at'),
+    (('idx_assets_name', 'idx_assets_name_id'), 'idx_assets_sort_name', 'name, id, deleted_at'),
+    (('idx_assets_last_used', 'idx_assets_last_used_id'), 'idx_assets_sort_last_used', 'last_used_at, id, deleted_at'),
+    (('idx_assets_use_count', 'idx_assets_use_count_id'), 'idx_assets_sort_use_count', 'use_count, id, deleted_at'),
+)
 
-        if 'created_by' not in columns:
-            conn.execute("ALTER TABLE library_assets ADD COLUMN created_by TEXT")
-            # Backfill with OS username for existing assets
-            try:
-                import getpass
-                username = getpass.getuser()
-                conn.execute("UPDATE library_assets SET created_by = ? WHERE created_by IS NULL", (username,))
-                conn.commit()
-            except Exception:
-                pass
 
-        if 'deleted_at' not in columns:
-            conn.execute("ALTER TABLE library_assets ADD COLUMN deleted_at TEXT")
+def _run_migrations(conn, shared=False):
+    """Run database migrations for schema updates.
 
-        if 'is_favorite' not in columns:
-            conn.execute("ALTER TABLE library_assets ADD COLUMN is_favorite INTEGER DEFAULT 0")
+    shared marks the team library database and its mirror, which keep the
+    unicode61 FTS tokenizer (see _SHARED_FTS_SCHEMA).
+    """
+    # Already migrated — skip the table_info checks on every new connection
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
 
-        # Always ensure slug index exists (safe for both new and migrated DBs)
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_assets_slug ON library_assets(slug)")
+    ok = True
 
-    except Exception as e:
-        print(f"[Sopdrop] Migration warning (library_assets): {e}")
+    # Add columns introduced after the original schema
+    for table, migrations in _COLUMN_MIGRATIONS.items():
+        try:
+            columns = frozenset(
+                row[1] for row in conn.execute(f"PRAGMA table_info({table})")
+            )
+            added = set()
+            for column, ddl in migrations:
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+                    added.add(column)
+
+            if table == 'library_assets':
+                _backfill_asset_columns(conn, added)
+                # Always ensure slug index exists (safe for both new and migrated DBs)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_assets_slug ON library_assets(slug)")
+        except Exception as e:
+            ok = False
+            print(f"[Sopdrop] Migration warning ({table}): {e}")
 
     # Add library_meta table if it doesn't exist (for existing DBs)
     try:
@@ -878,20 +1184,122 @@ def _run_migrations(conn):
             )
         """)
     except Exception as e:
+        ok = False
         print(f"[Sopdrop] Migration warning (library_meta): {e}")
 
+    # Composite listing indexes (existing DBs predate them in SCHEMA). ANALYZE
+    # once so the planner has stats to choose them over the single-column
+    # indexes; brand-new databases are empty, so there is nothing to analyze.
+    try:
+        has_index = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_assets_context_last_used'"
+        ).fetchone() is not None
+        if not has_index:
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_assets_context_last_used ON library_assets(context, last_used_at DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_assets_context_use_count ON library_assets(context, use_count DESC)")
+            conn.execute("ANALYZE")
+        # Latest-version lookups seek this instead of sorting the history
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_versions_asset_created ON asset_versions(asset_id, created_at DESC)")
+        # Next-sort-order lookups and ordered collection listings
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_collection_assets_sort ON collection_assets(collection_id, sort_order)")
+        # Covering (sort key, id, deleted_at) indexes for search paging,
+        # replacing the earlier sort indexes
+        for old_names, name, columns in _SORT_INDEXES:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON library_assets({columns})")
+            for old_name in old_names:
+                conn.execute(f"DROP INDEX IF EXISTS {old_name}")
+        # Tag filters probe (tag, asset_id); covers the old tag-only index
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_tags_tag_asset ON asset_tags(tag, asset_id)")
+        conn.execute("DROP INDEX IF EXISTS idx_tags_tag")
+        # Partial index over the 'syncing' rows cleanup_stale_syncing() reads
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_assets_syncing_updated ON library_assets(updated_at) WHERE sync_status = 'syncing'")
+    except Exception as e:
+        ok = False
+        print(f"[Sopdrop] Migration warning (indexes): {e}")
+
+    # tag_counts for existing databases: the table, its triggers and the
+    # backfill go in one write transaction, so no other client's tag write
+    # lands between them and gets counted twice (or not at all)
+    try:
+        has_counts = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tag_counts'"
+        ).fetchone() is not None
+        if not has_counts:
+            conn.executescript(
+                "BEGIN IMMEDIATE;"
+                + _TAG_COUNTS_SCHEMA +
+                """
+                INSERT OR REPLACE INTO tag_counts (tag, count)
+                SELECT t.tag, COUNT(*) FROM asset_tags t
+                JOIN library_assets a ON a.id = t.asset_id
+                WHERE a.deleted_at IS NULL
+                GROUP BY t.tag;
+                COMMIT;
+                """
+            )
+    except Exception as e:
+        ok = False
+        if conn.in_transaction:
+            conn.rollback()
+        print(f"[Sopdrop] Migration warning (tag_counts): {e}")
+
+    # Rebuild assets_fts when its tokenizer isn't the one this database
+    # should use: trigram for local databases, unicode61 for shared ones
+    # (which also undoes an earlier client's trigram rebuild of the team
+    # DB). External-content mode lets 'rebuild' repopulate the index from
+    # library_assets in a single statement. Only a SQLite with trigram can
+    # drop or create a trigram table, so older builds leave it pending.
+    fts_schema = _SHARED_FTS_SCHEMA if shared else FTS_SCHEMA
+    fts_pending = False
+    try:
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'assets_fts'"
+        ).fetchone()
+        wrong_tokenizer = row is not None and ('trigram' in (row[0] or '')) == shared
+        if wrong_tokenizer and not _FTS_TRIGRAM:
+            fts_pending = True
+        elif wrong_tokenizer:
+            conn.execute("DROP TRIGGER IF EXISTS assets_fts_insert")
+            conn.execute("DROP TRIGGER IF EXISTS assets_fts_delete")
+            conn.execute("DROP TRIGGER IF EXISTS assets_fts_update")
+            conn.execute("DROP TABLE IF EXISTS assets_fts")
+            conn.executescript(fts_schema)
+            conn.execute("INSERT INTO assets_fts(assets_fts) VALUES('rebuild')")
+            conn.commit()
+    except Exception as e:
+        ok = False
+        print(f"[Sopdrop] Migration warning (fts): {e}")
+
+    # Older databases have an unconditional AFTER UPDATE trigger that
+    # rewrites the FTS row on every update. Swap in the column-scoped one.
+    try:
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'assets_fts_update'"
+        ).fetchone()
+        if row is not None and 'UPDATE OF' not in (row[0] or ''):
+            conn.execute("DROP TRIGGER assets_fts_update")
+            conn.executescript(fts_schema)
+    except Exception as e:
+        ok = False
+        print(f"[Sopdrop] Migration warning (fts trigger): {e}")
+
+    # Only record the version when every step succeeded, so failures are
+    # retried on the next connection. A tokenizer change this SQLite can't
+    # make is left pending for a newer one to pick up.
+    if ok and not fts_pending:
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
 
 def close_db():
-    """Close all database connections (including NAS write connection)."""
-    global _connections, _current_db_path, _nas_connection, _nas_db_mtime
+    """Close all database connections (including NAS write connection).
+
+    Cached library/mirror connections close as soon as no caller still holds
+    them; one a worker thread is mid-query on stays open until it finishes.
+    """
+    global _nas_connection, _nas_db_mtime
     with _db_lock:
-        for conn in _connections.values():
-            try:
-                conn.close()
-            except Exception:
-                pass
-        _connections = {}
-        _current_db_path = None
+        _open_library_connection.cache_clear()
+        _open_mirror_connection.cache_clear()
 
     # Close NAS write connection
     if _nas_connection is not None:
@@ -905,18 +1313,19 @@ def close_db():
 
 def _auto_purge_trash(conn, max_age_days=30):
     """Delete trash files and DB rows older than max_age_days."""
-    import time
     cutoff_ts = time.time() - (max_age_days * 86400)
     cutoff_iso = datetime.utcfromtimestamp(cutoff_ts).isoformat()
 
     # Delete old files from trash directory
     trash_dir = get_library_trash_dir()
     if trash_dir.exists():
-        for f in trash_dir.iterdir():
-            if f.is_file():
+        # scandir reports file types from the directory read itself, so
+        # each entry costs one stat instead of is_file() + stat()
+        with os.scandir(trash_dir) as entries:
+            for entry in entries:
                 try:
-                    if f.stat().st_mtime < cutoff_ts:
-                        f.unlink()
+                    if entry.is_file() and entry.stat().st_mtime < cutoff_ts:
+                        os.unlink(entry.path)
                 except OSError:
                     pass
 
@@ -949,7 +1358,7 @@ def set_library_meta(key: str, value: str, db=None):
         "INSERT OR REPLACE INTO library_meta (key, value) VALUES (?, ?)",
         (key, value)
     )
-    conn.commit()
+    _commit(conn)
 
 
 def detect_team_from_library(path: str) -> Optional[Dict[str, str]]:
@@ -961,16 +1370,13 @@ def detect_team_from_library(path: str) -> Optional[Dict[str, str]]:
 
     Returns dict with 'team_name' and 'team_slug', or None if not found.
     """
-    from pathlib import Path
-
     db_path = Path(path) / "library" / "library.db"
     if not db_path.exists():
         return None
 
     conn = None
     try:
-        import time as _time
-        _t0 = _time.time()
+        _t0 = time.time()
         conn = sqlite3.connect(str(db_path), timeout=10)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA busy_timeout = 10000")
@@ -999,7 +1405,7 @@ def detect_team_from_library(path: str) -> Optional[Dict[str, str]]:
                 'team_slug': team_slug,
             }
     except Exception as e:
-        _elapsed = _time.time() - _t0
+        _elapsed = time.time() - _t0
         print(f"[Sopdrop] Could not read team metadata from {db_path} ({_elapsed:.1f}s): {e}")
     finally:
         if conn:
@@ -1017,8 +1423,6 @@ def switch_library(library_type):
 
     This closes the current connection and updates the active library setting.
     """
-    from .config import set_active_library, get_team_library_path
-
     if library_type == "team":
         team_path = get_team_library_path()
         if not team_path:
@@ -1038,10 +1442,85 @@ def dict_from_row(row):
     return dict(zip(row.keys(), row))
 
 
+# Most "?" placeholders to put in one IN (...) list (SQLite builds before
+# 3.32 cap a statement at 999 bound parameters)
+_MAX_IN_PARAMS = 900
+
+# library_assets columns stored as JSON text
+_JSON_FIELDS = ('node_types', 'node_names', 'tags', 'dependencies', 'metadata')
+
+
+# Encoded forms of the empty containers most JSON columns hold, and back
+_EMPTY_JSON = {list: '[]', tuple: '[]', dict: '{}'}
+_EMPTY_JSON_TYPES = {'[]': list, '{}': dict}
+
+
+def _json_column(value):
+    """Encode a value for one of the _JSON_FIELDS columns (compact separators).
+
+    Empty lists and dicts, the common case for tags and dependencies,
+    skip the encoder.
+    """
+    if not value:
+        empty = _EMPTY_JSON.get(type(value))
+        if empty is not None:
+            return empty
+    return _json.dumps(value)
+
+
+def _parse_json_fields(asset, fields=_JSON_FIELDS):
+    """Decode an asset dict's JSON columns in place (malformed values become [])."""
+    loads = _json.loads
+    for field in fields:
+        value = asset.get(field)
+        if value:
+            # Empty containers (as written by _json_column) skip the decoder;
+            # each row still gets its own list/dict
+            empty = _EMPTY_JSON_TYPES.get(value)
+            if empty is not None:
+                asset[field] = empty()
+                continue
+            try:
+                asset[field] = loads(value)
+            except json.JSONDecodeError:
+                asset[field] = []
+    return asset
+
+
+def _dict_rows(db, sql, params=()):
+    """Run a query and return its rows as plain dicts.
+
+    Uses a cursor without the connection's sqlite3.Row factory and reads the
+    column names once per query, rather than calling row.keys() per row.
+    """
+    cursor = db.cursor()
+    cursor.row_factory = None
+    cursor.execute(sql, params)
+    columns = [d[0] for d in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor]
+
+
 # ==============================================================================
 # Collection Operations
 # ==============================================================================
 
+# RETURNING (SQLite 3.35+) hands back the written row, saving the follow-up
+# SELECT. Houdini's bundled Python may ship an older SQLite.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# ISO-8601 UTC timestamp computed by SQLite, matching the "T"-separated
+# datetime.utcnow().isoformat() strings stored elsewhere
+_SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%f', 'now')"
+
+# Next sort order among siblings is computed inside the INSERT (the aggregate
+# yields one row even when there are no siblings yet)
+_SQL_INSERT_COLLECTION = f"""
+    INSERT INTO collections (id, name, description, color, icon, parent_id, sort_order, created_at, updated_at)
+    SELECT ?, ?, ?, ?, ?, ?, COALESCE(MAX(sort_order), 0) + 1, {_SQL_NOW}, {_SQL_NOW}
+    FROM collections WHERE parent_id IS ?
+"""
+_SQL_INSERT_COLLECTION_RETURNING = _SQL_INSERT_COLLECTION + " RETURNING *"
+
 @_writes_to_nas
 def create_collection(
     name: str,
@@ -1058,22 +1537,16 @@ def create_collection(
         )
     db = get_db()
     collection_id = str(uuid.uuid4())
-    now = datetime.utcnow().isoformat()
 
-    # Get next sort order
-    cursor = db.execute(
-        "SELECT COALESCE(MAX(sort_order), 0) + 1 FROM collections WHERE parent_id IS ?"
-        if parent_id else
-        "SELECT COALESCE(MAX(sort_order), 0) + 1 FROM collections WHERE parent_id IS NULL",
-        (parent_id,) if parent_id else ()
-    )
-    sort_order = cursor.fetchone()[0]
+    params = (collection_id, name, description, color, icon, parent_id, parent_id)
+    if _HAS_RETURNING:
+        # Fetch the row before committing so the statement has finished
+        row = db.execute(_SQL_INSERT_COLLECTION_RETURNING, params).fetchone()
+        _commit(db)
+        return dict_from_row(row)
 
-    db.execute("""
-        INSERT INTO collections (id, name, description, color, icon, parent_id, sort_order, created_at, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (collection_id, name, description, color, icon, parent_id, sort_order, now, now))
-    db.commit()
+    db.execute(_SQL_INSERT_COLLECTION, params)
+    _commit(db)
 
     return get_collection(collection_id)
 
@@ -1092,40 +1565,40 @@ def list_collections(parent_id: Optional[str] = None) -> List[Dict[str, Any]]:
     if _http_mode():
         return _team_http.list_collections(parent_id)
     db = get_db()
-    if parent_id is None:
-        rows = db.execute(
-            "SELECT * FROM collections WHERE parent_id IS NULL ORDER BY sort_order, name"
-        ).fetchall()
-    else:
-        rows = db.execute(
-            "SELECT * FROM collections WHERE parent_id = ? ORDER BY sort_order, name",
-            (parent_id,)
-        ).fetchall()
-    return [dict_from_row(r) for r in rows]
+    # IS matches NULL too, so top-level and child listings share one statement
+    return _dict_rows(
+        db, "SELECT * FROM collections WHERE parent_id IS ? ORDER BY sort_order, name",
+        (parent_id,)
+    )
 
 
 def get_collection_tree() -> List[Dict[str, Any]]:
     """Get full collection hierarchy as nested structure."""
     if _http_mode():
         return _team_http.get_collection_tree()
-    all_collections = [dict_from_row(r) for r in get_db().execute(
-        "SELECT * FROM collections ORDER BY sort_order, name"
-    ).fetchall()]
+    nodes = _dict_rows(get_db(), "SELECT * FROM collections ORDER BY sort_order, name")
 
-    # Build tree
-    by_id = {c['id']: {**c, 'children': []} for c in all_collections}
-    root = []
+    # Give each node its children list, then link them up
+    by_id = {}
+    for node in nodes:
+        node['children'] = []
+        by_id[node['id']] = node
 
-    for c in all_collections:
-        node = by_id[c['id']]
-        if c['parent_id'] and c['parent_id'] in by_id:
-            by_id[c['parent_id']]['children'].append(node)
+    root = []
+    for node in nodes:
+        parent = by_id.get(node['parent_id']) if node['parent_id'] else None
+        if parent is not None:
+            parent['children'].append(node)
         else:
             root.append(node)
 
     return root
 
 
+# UPDATE statements for update_collection(), keyed by sorted field names
+_UPDATE_COLLECTION_SQL = {}
+
+
 @_writes_to_nas
 def update_collection(collection_id: str, **kwargs) -> Optional[Dict[str, Any]]:
     """Update a collection's properties."""
@@ -1138,13 +1611,25 @@ def update_collection(collection_id: str, **kwargs) -> Optional[Dict[str, Any]]:
     if not updates:
         return get_collection(collection_id)
 
-    updates['updated_at'] = datetime.utcnow().isoformat()
-
-    set_clause = ", ".join(f"{k} = ?" for k in updates.keys())
-    values = list(updates.values()) + [collection_id]
-
-    db.execute(f"UPDATE collections SET {set_clause} WHERE id = ?", values)
-    db.commit()
+    # Reuse the exact SQL text per field combination so sqlite3's statement
+    # cache keeps the prepared statement across calls.
+    fields = tuple(sorted(updates))
+    sql = _UPDATE_COLLECTION_SQL.get(fields)
+    if sql is None:
+        set_clause = ", ".join(f"{k} = ?" for k in fields)
+        sql = f"UPDATE collections SET {set_clause}, updated_at = {_SQL_NOW} WHERE id = ?"
+        if _HAS_RETURNING:
+            sql += " RETURNING *"
+        _UPDATE_COLLECTION_SQL[fields] = sql
+    values = [updates[k] for k in fields] + [collection_id]
+
+    if _HAS_RETURNING:
+        row = db.execute(sql, values).fetchone()
+        _commit(db)
+        return dict_from_row(row)
+
+    db.execute(sql, values)
+    _commit(db)
 
     return get_collection(collection_id)
 
@@ -1156,40 +1641,136 @@ def delete_collection(collection_id: str, recursive: bool = False):
         return _team_http.delete_collection(collection_id, recursive=recursive)
     db = get_db()
 
-    if recursive:
-        # Get all descendant IDs
-        def get_descendants(cid):
-            children = db.execute(
-                "SELECT id FROM collections WHERE parent_id = ?", (cid,)
-            ).fetchall()
-            ids = [c[0] for c in children]
-            for child_id in list(ids):
-                ids.extend(get_descendants(child_id))
-            return ids
-
-        all_ids = [collection_id] + get_descendants(collection_id)
-        placeholders = ",".join("?" * len(all_ids))
-        db.execute(f"DELETE FROM collections WHERE id IN ({placeholders})", all_ids)
-    else:
-        # Move children to parent's parent
-        parent = db.execute(
-            "SELECT parent_id FROM collections WHERE id = ?", (collection_id,)
-        ).fetchone()
-        new_parent = parent[0] if parent else None
-
-        db.execute(
-            "UPDATE collections SET parent_id = ? WHERE parent_id = ?",
-            (new_parent, collection_id)
-        )
-        db.execute("DELETE FROM collections WHERE id = ?", (collection_id,))
+    # Take the write lock up front so the parent lookup, reparent and delete
+    # see one consistent snapshot (team libraries have concurrent writers).
+    with _immediate_transaction(db):
+        if recursive:
+            # Collect the collection and all its descendants in SQL and
+            # delete them in one statement. UNION (not UNION ALL) stops on
+            # a parent_id cycle instead of recursing forever.
+            db.execute("""
+                WITH RECURSIVE subtree(id) AS (
+                    VALUES (?)
+                    UNION
+                    SELECT c.id FROM collections c JOIN subtree ON c.parent_id = subtree.id
+                )
+                DELETE FROM collections WHERE id IN subtree
+            """, (collection_id,))
+        else:
+            # Move children to parent's parent
+            parent = db.execute(
+                "SELECT parent_id FROM collections WHERE id = ?", (collection_id,)
+            ).fetchone()
+            new_parent = parent[0] if parent else None
 
-    db.commit()
+            db.execute(
+                "UPDATE collections SET parent_id = ? WHERE parent_id = ?",
+                (new_parent, collection_id)
+            )
+            db.execute("DELETE FROM collections WHERE id = ?", (collection_id,))
 
 
 # ==============================================================================
 # Asset Operations
 # ==============================================================================
 
+# Statements shared by several functions. Defining each once gives every
+# caller the same SQL text, so they share one prepared statement in the
+# connection's statement cache.
+_SQL_INSERT_ASSET = """
+    INSERT INTO library_assets (
+        id, name, description, context, file_path, file_hash, file_size,
+        thumbnail_path, icon, slug, node_count, node_types, node_names, tags,
+        houdini_version, has_hda_dependencies, dependencies, metadata,
+        created_by, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_HDA_ASSET = """
+    INSERT INTO library_assets (
+        id, name, description, context, asset_type, file_path, file_hash, file_size,
+        thumbnail_path, icon, slug, node_count, node_types, node_names, tags,
+        houdini_version, has_hda_dependencies, dependencies, metadata,
+        hda_type_name, hda_type_label, hda_version, hda_category,
+        license_type, created_by, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_ASSET_TAG = "INSERT OR IGNORE INTO asset_tags (asset_id, tag) VALUES (?, ?)"
+
+_SQL_ASSET_COLLECTIONS = """
+    SELECT c.* FROM collections c
+    JOIN collection_assets ca ON c.id = ca.collection_id
+    WHERE ca.asset_id = ?
+    ORDER BY c.name
+"""
+
+# Assets of one collection, each with its memberships assembled by SQLite
+# into a JSON array (same keys and order as _SQL_ASSET_COLLECTIONS)
+_SQL_COLLECTION_ASSETS = """
+    SELECT a.*, (
+        SELECT json_group_array(json_object(
+            'id', c.id, 'name', c.name, 'description', c.description,
+            'color', c.color, 'icon', c.icon, 'parent_id', c.parent_id,
+            'sort_order', c.sort_order, 'source', c.source,
+            'remote_id', c.remote_id, 'created_at', c.created_at,
+            'updated_at', c.updated_at
+        ))
+        FROM (
+            SELECT c.* FROM collections c
+            JOIN collection_assets ca2 ON c.id = ca2.collection_id
+            WHERE ca2.asset_id = a.id
+            ORDER BY c.name
+        ) c
+    ) AS collections_json
+    FROM library_assets a
+    JOIN collection_assets ca ON a.id = ca.asset_id
+    WHERE ca.collection_id = ? AND a.deleted_at IS NULL
+    ORDER BY ca.sort_order, a.name
+"""
+
+_SQL_LATEST_VERSION = (
+    "SELECT version FROM asset_versions WHERE asset_id = ? ORDER BY created_at DESC LIMIT 1"
+)
+
+_SQL_INSERT_VERSION = """
+    INSERT OR IGNORE INTO asset_versions (id, asset_id, version, file_path, file_hash, file_size, node_count, changelog, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Appends at the end of the collection; the MAX is a seek on
+# idx_collection_assets_sort and runs inside the INSERT
+_SQL_INSERT_COLLECTION_ASSET = """
+    INSERT OR IGNORE INTO collection_assets (collection_id, asset_id, sort_order, added_at)
+    SELECT ?, ?, COALESCE(MAX(sort_order), 0) + 1, ?
+    FROM collection_assets WHERE collection_id = ?
+"""
+
+# SET fragment that flags a cloud-synced asset as locally modified
+_SQL_MARK_MODIFIED = (
+    "sync_status = CASE WHEN sync_status = 'synced' AND COALESCE(remote_slug, '') != '' "
+    "THEN 'modified' ELSE sync_status END"
+)
+
+# UPDATE library_assets statements, keyed by (sorted field names, extra SET
+# fragment). Reusing the exact SQL text per combination keeps the prepared
+# statement in sqlite3's statement cache, as update_collection() does.
+_UPDATE_ASSET_SQL = {}
+
+
+def _asset_update_sql(fields, extra=None):
+    """Return the cached UPDATE for a sorted tuple of library_assets fields."""
+    key = (fields, extra)
+    sql = _UPDATE_ASSET_SQL.get(key)
+    if sql is None:
+        set_clause = ", ".join(f"{k} = ?" for k in fields)
+        if extra:
+            set_clause += f", {extra}"
+        sql = f"UPDATE library_assets SET {set_clause} WHERE id = ?"
+        _UPDATE_ASSET_SQL[key] = sql
+    return sql
+
+
 @_writes_to_nas
 def save_asset(
     name: str,
@@ -1239,7 +1820,6 @@ def save_asset(
     _atomic_write_text(file_path, package_json)
 
     # Calculate hash and size
-    import hashlib
     file_hash = hashlib.sha256(package_json.encode()).hexdigest()
     file_size = len(package_json)
 
@@ -1255,51 +1835,42 @@ def save_asset(
     metadata = package_data.get('metadata', {})
     tags = tags or []
 
-    # Generate shareable slug
-    slug = _generate_slug(name, db=db)
-
     # Get creator name
     try:
-        import getpass
         created_by = getpass.getuser()
     except Exception:
         created_by = None
 
-    # Insert asset record
-    db.execute("""
-        INSERT INTO library_assets (
-            id, name, description, context, file_path, file_hash, file_size,
-            thumbnail_path, icon, slug, node_count, node_types, node_names, tags,
-            houdini_version, has_hda_dependencies, dependencies, metadata,
-            created_by, created_at, updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        asset_id, name, description, context, file_name, file_hash, file_size,
-        thumbnail_path, icon, slug,
-        metadata.get('node_count', 0),
-        json.dumps(metadata.get('node_types', [])),
-        json.dumps(metadata.get('node_names', [])),
-        json.dumps(tags),
-        package_data.get('houdini_version', ''),
-        1 if metadata.get('has_hda_dependencies') else 0,
-        json.dumps(package_data.get('dependencies', [])),
-        json.dumps(metadata),
-        created_by, now, now
-    ))
-
-    # Insert tags for indexing
-    for tag in tags:
-        db.execute(
-            "INSERT OR IGNORE INTO asset_tags (asset_id, tag) VALUES (?, ?)",
-            (asset_id, tag.lower())
-        )
+    # Slug check, asset row, tags and collection links commit together
+    with _immediate_transaction(db):
+        # Generate shareable slug
+        slug = _generate_slug(name, db=db)
+
+        # Insert asset record. Context is stored lowercase, as tags are, so
+        # search_assets can compare it straight against idx_assets_context.
+        db.execute(_SQL_INSERT_ASSET, (
+            asset_id, name, description, context.lower(), file_name, file_hash, file_size,
+            thumbnail_path, icon, slug,
+            metadata.get('node_count', 0),
+            _json_column(metadata.get('node_types', [])),
+            _json_column(metadata.get('node_names', [])),
+            _json_column(tags),
+            package_data.get('houdini_version', ''),
+            1 if metadata.get('has_hda_dependencies') else 0,
+            _json_column(package_data.get('dependencies', [])),
+            _json_column(metadata),
+            created_by, now, now
+        ))
 
-    # Add to collections
-    if collection_ids:
-        for coll_id in collection_ids:
-            add_asset_to_collection(asset_id, coll_id)
+        # Insert tags for indexing
+        db.executemany(
+            _SQL_INSERT_ASSET_TAG,
+            [(asset_id, tag.lower()) for tag in tags]
+        )
 
-    db.commit()
+        # Add to collections
+        if collection_ids:
+            _link_asset_to_collections(db, asset_id, collection_ids, now)
 
     # Trigger menu regeneration
     _trigger_menu_regenerate()
@@ -1346,8 +1917,6 @@ def save_hda(
         )
         return _team_http.get_asset(new_id) if new_id else None
 
-    import shutil
-
     ensure_library_dirs()
     db = get_db()
     asset_id = str(uuid.uuid4())
@@ -1358,14 +1927,8 @@ def save_hda(
     file_name = f"{asset_id}.hda"
     dest_path = get_library_assets_dir() / file_name
 
-    _atomic_copy(source_path, dest_path)
-
-    # Calculate hash and size
-    import hashlib
-    with open(dest_path, 'rb') as f:
-        file_data = f.read()
-    file_hash = hashlib.sha256(file_data).hexdigest()
-    file_size = len(file_data)
+    # Copy and hash in a single pass over the HDA
+    file_hash, file_size = _atomic_copy_hashed(source_path, dest_path)
 
     # Save thumbnail if provided
     thumbnail_path = None
@@ -1386,64 +1949,53 @@ def save_hda(
 
     tags = tags or []
 
-    # Generate shareable slug
-    slug = _generate_slug(name, db=db)
-
     # Detect license type for HDA compatibility tracking
     license_type = detect_houdini_license()
 
     # Get creator name
     try:
-        import getpass
         created_by = getpass.getuser()
     except Exception:
         created_by = None
 
-    # Insert asset record with HDA-specific fields
-    db.execute("""
-        INSERT INTO library_assets (
-            id, name, description, context, asset_type, file_path, file_hash, file_size,
-            thumbnail_path, icon, slug, node_count, node_types, node_names, tags,
-            houdini_version, has_hda_dependencies, dependencies, metadata,
-            hda_type_name, hda_type_label, hda_version, hda_category,
-            license_type, created_by, created_at, updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        asset_id, name, description, context, 'hda', file_name, file_hash, file_size,
-        thumbnail_path, icon, slug,
-        1,  # node_count = 1 for HDA
-        json.dumps([hda_info.get('type_name', '')]),
-        json.dumps([name]),
-        json.dumps(tags),
-        hda_info.get('houdini_version', ''),
-        0,  # HDAs don't have HDA dependencies in the same way
-        json.dumps([]),
-        json.dumps({
-            'type_name': hda_info.get('type_name'),
-            'type_label': hda_info.get('type_label'),
-            'category': hda_info.get('category'),
-            'icon': hda_info.get('icon'),
-        }),
-        hda_info.get('type_name'),
-        hda_info.get('type_label'),
-        hda_info.get('version'),
-        hda_info.get('category'),
-        license_type, created_by, now, now
-    ))
-
-    # Insert tags for indexing
-    for tag in tags:
-        db.execute(
-            "INSERT OR IGNORE INTO asset_tags (asset_id, tag) VALUES (?, ?)",
-            (asset_id, tag.lower())
-        )
+    # Slug check, asset row, tags and collection links commit together
+    with _immediate_transaction(db):
+        # Generate shareable slug
+        slug = _generate_slug(name, db=db)
+
+        # Insert asset record with HDA-specific fields
+        db.execute(_SQL_INSERT_HDA_ASSET, (
+            asset_id, name, description, context, 'hda', file_name, file_hash, file_size,
+            thumbnail_path, icon, slug,
+            1,  # node_count = 1 for HDA
+            _json_column([hda_info.get('type_name', '')]),
+            _json_column([name]),
+            _json_column(tags),
+            hda_info.get('houdini_version', ''),
+            0,  # HDAs don't have HDA dependencies in the same way
+            _json_column([]),
+            _json_column({
+                'type_name': hda_info.get('type_name'),
+                'type_label': hda_info.get('type_label'),
+                'category': hda_info.get('category'),
+                'icon': hda_info.get('icon'),
+            }),
+            hda_info.get('type_name'),
+            hda_info.get('type_label'),
+            hda_info.get('version'),
+            hda_info.get('category'),
+            license_type, created_by, now, now
+        ))
 
-    # Add to collections
-    if collection_ids:
-        for coll_id in collection_ids:
-            add_asset_to_collection(asset_id, coll_id)
+        # Insert tags for indexing
+        db.executemany(
+            _SQL_INSERT_ASSET_TAG,
+            [(asset_id, tag.lower()) for tag in tags]
+        )
 
-    db.commit()
+        # Add to collections
+        if collection_ids:
+            _link_asset_to_collections(db, asset_id, collection_ids, now)
 
     # Trigger menu regeneration
     _trigger_menu_regenerate()
@@ -1494,22 +2046,10 @@ def get_asset(asset_id: str) -> Optional[Dict[str, Any]]:
 
     asset = dict_from_row(row)
 
-    # Parse JSON fields
-    for field in ('node_types', 'node_names', 'tags', 'dependencies', 'metadata'):
-        if asset.get(field):
-            try:
-                asset[field] = json.loads(asset[field])
-            except json.JSONDecodeError:
-                asset[field] = []
+    _parse_json_fields(asset)
 
     # Get collections this asset belongs to
-    colls = db.execute("""
-        SELECT c.* FROM collections c
-        JOIN collection_assets ca ON c.id = ca.collection_id
-        WHERE ca.asset_id = ?
-        ORDER BY c.name
-    """, (asset_id,)).fetchall()
-    asset['collections'] = [dict_from_row(c) for c in colls]
+    asset['collections'] = _dict_rows(db, _SQL_ASSET_COLLECTIONS, (asset_id,))
 
     return asset
 
@@ -1523,22 +2063,10 @@ def get_asset_by_slug(slug: str) -> Optional[Dict[str, Any]]:
 
     asset = dict_from_row(row)
 
-    # Parse JSON fields
-    for field in ('node_types', 'node_names', 'tags', 'dependencies', 'metadata'):
-        if asset.get(field):
-            try:
-                asset[field] = json.loads(asset[field])
-            except json.JSONDecodeError:
-                asset[field] = []
+    _parse_json_fields(asset)
 
     # Get collections this asset belongs to
-    colls = db.execute("""
-        SELECT c.* FROM collections c
-        JOIN collection_assets ca ON c.id = ca.collection_id
-        WHERE ca.asset_id = ?
-        ORDER BY c.name
-    """, (asset['id'],)).fetchall()
-    asset['collections'] = [dict_from_row(c) for c in colls]
+    asset['collections'] = _dict_rows(db, _SQL_ASSET_COLLECTIONS, (asset['id'],))
 
     return asset
 
@@ -1555,22 +2083,10 @@ def get_asset_by_remote_slug(remote_slug: str) -> Optional[Dict[str, Any]]:
 
     asset = dict_from_row(row)
 
-    # Parse JSON fields
-    for field in ('node_types', 'node_names', 'tags', 'dependencies', 'metadata'):
-        if asset.get(field):
-            try:
-                asset[field] = json.loads(asset[field])
-            except json.JSONDecodeError:
-                asset[field] = []
+    _parse_json_fields(asset)
 
     # Get collections this asset belongs to
-    colls = db.execute("""
-        SELECT c.* FROM collections c
-        JOIN collection_assets ca ON c.id = ca.collection_id
-        WHERE ca.asset_id = ?
-        ORDER BY c.name
-    """, (asset['id'],)).fetchall()
-    asset['collections'] = [dict_from_row(c) for c in colls]
+    asset['collections'] = _dict_rows(db, _SQL_ASSET_COLLECTIONS, (asset['id'],))
 
     return asset
 
@@ -1587,7 +2103,7 @@ def load_asset_package(asset_id: str) -> Optional[Dict[str, Any]]:
     if not file_path.exists():
         return None
 
-    return json.loads(file_path.read_text())
+    return _json.loads(file_path.read_bytes())
 
 
 @_writes_to_nas
@@ -1603,19 +2119,21 @@ def update_asset_package(asset_id: str, package_data: Dict[str, Any]) -> bool:
     if not file_path.exists():
         return False
 
-    _atomic_write_text(file_path, json.dumps(package_data, indent=2))
+    # Write the encoded bytes directly (no newline translation), so the
+    # hash and size come from the buffer instead of re-reading the file
+    payload = json.dumps(package_data, indent=2).encode()
+    _atomic_write_bytes(file_path, payload)
 
     # Update file hash and size
-    import hashlib
-    file_hash = hashlib.sha256(file_path.read_bytes()).hexdigest()
-    file_size = file_path.stat().st_size
+    file_hash = hashlib.sha256(payload).hexdigest()
+    file_size = len(payload)
 
     db = get_db()
     db.execute(
         "UPDATE library_assets SET file_hash = ?, file_size = ?, updated_at = ? WHERE id = ?",
         (file_hash, file_size, datetime.utcnow().isoformat(), asset_id)
     )
-    db.commit()
+    _commit(db)
     return True
 
 
@@ -1632,30 +2150,30 @@ def update_asset(asset_id: str, **kwargs) -> Optional[Dict[str, Any]]:
     if not updates:
         return get_asset(asset_id)
 
-    # Regenerate slug when name changes
-    if 'name' in updates and 'slug' not in updates:
-        updates['slug'] = _generate_slug(updates['name'], db=db)
-
-    # Handle tags specially
-    if 'tags' in updates:
-        tags = updates['tags']
-        updates['tags'] = json.dumps(tags)
-
-        # Update tags index
-        db.execute("DELETE FROM asset_tags WHERE asset_id = ?", (asset_id,))
-        for tag in tags:
-            db.execute(
-                "INSERT OR IGNORE INTO asset_tags (asset_id, tag) VALUES (?, ?)",
-                (asset_id, tag.lower())
+    # Slug check, tag reindex and the row update commit together
+    with _immediate_transaction(db):
+        # Regenerate slug when name changes
+        if 'name' in updates and 'slug' not in updates:
+            updates['slug'] = _generate_slug(updates['name'], db=db)
+
+        # Handle tags specially
+        if 'tags' in updates:
+            tags = updates['tags']
+            updates['tags'] = _json_column(tags)
+
+            # Update tags index
+            db.execute("DELETE FROM asset_tags WHERE asset_id = ?", (asset_id,))
+            db.executemany(
+                _SQL_INSERT_ASSET_TAG,
+                [(asset_id, tag.lower()) for tag in tags]
             )
 
-    updates['updated_at'] = datetime.utcnow().isoformat()
+        updates['updated_at'] = datetime.utcnow().isoformat()
 
-    set_clause = ", ".join(f"{k} = ?" for k in updates.keys())
-    values = list(updates.values()) + [asset_id]
+        fields = tuple(sorted(updates))
+        values = [updates[k] for k in fields] + [asset_id]
 
-    db.execute(f"UPDATE library_assets SET {set_clause} WHERE id = ?", values)
-    db.commit()
+        db.execute(_asset_update_sql(fields), values)
 
     # Trigger menu regeneration if tags changed (affects categorization)
     if 'tags' in kwargs:
@@ -1669,15 +2187,20 @@ def update_asset_thumbnail(asset_id: str, thumbnail_data: bytes) -> bool:
     """Update an asset's thumbnail image."""
     if _http_mode():
         return _team_http.update_asset_thumbnail(asset_id, thumbnail_data)
-    asset = get_asset(asset_id)
-    if not asset:
+    db = get_db()
+    if not db.execute("SELECT 1 FROM library_assets WHERE id = ?", (asset_id,)).fetchone():
         return False
 
     thumb_name = f"{asset_id}.png"
     thumb_file = get_library_thumbnails_dir() / thumb_name
     _atomic_write_bytes(thumb_file, thumbnail_data)
 
-    return update_asset(asset_id, thumbnail_path=thumb_name) is not None
+    cursor = db.execute(
+        "UPDATE library_assets SET thumbnail_path = ?, updated_at = ? WHERE id = ?",
+        (thumb_name, datetime.utcnow().isoformat(), asset_id),
+    )
+    _commit(db)
+    return cursor.rowcount > 0
 
 
 @_writes_to_nas
@@ -1722,8 +2245,6 @@ def _save_asset_version_sqlite(
     Returns:
         The updated asset record
     """
-    import hashlib
-
     asset = get_asset(asset_id)
     if not asset:
         return None
@@ -1735,128 +2256,108 @@ def _save_asset_version_sqlite(
     file_path = get_library_assets_dir() / asset['file_path']
     current_hash = asset.get('file_hash', '')
 
-    # Determine the current version label for the snapshot
-    latest_row = db.execute(
-        "SELECT version FROM asset_versions WHERE asset_id = ? ORDER BY created_at DESC LIMIT 1",
-        (asset_id,)
-    ).fetchone()
-    snapshot_version = "1.0.0"
-    if latest_row:
-        snapshot_version = latest_row[0] if isinstance(latest_row, (tuple, list)) else latest_row['version']
-    elif file_path.exists():
-        # First version up — snapshot current as 1.0.0
-        snapshot_name = f"{asset_id}_v1.0.0.sopdrop"
-        snapshot_path = get_library_assets_dir() / snapshot_name
-        if not snapshot_path.exists():
-            _atomic_copy(file_path, snapshot_path)
-            # Create initial version record for the original
-            init_version_id = str(uuid.uuid4())
-            db.execute("""
-                INSERT OR IGNORE INTO asset_versions (id, asset_id, version, file_path, file_hash, file_size, node_count, changelog, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                init_version_id, asset_id, "1.0.0",
-                snapshot_name, current_hash, asset.get('file_size', 0),
-                asset.get('node_count', 0), "Initial version", asset.get('created_at', now),
-            ))
-    else:
-        # Edge case — check if there's a snapshot already
+    # Version lookup, snapshot records and the asset update commit together;
+    # holding the write lock keeps concurrent saves from picking the same
+    # version number
+    with _immediate_transaction(db):
+        # Determine the current version label for the snapshot
+        latest_row = db.execute(_SQL_LATEST_VERSION, (asset_id,)).fetchone()
         snapshot_version = "1.0.0"
+        if latest_row:
+            snapshot_version = latest_row[0] if isinstance(latest_row, (tuple, list)) else latest_row['version']
+        elif file_path.exists():
+            # First version up — snapshot current as 1.0.0
+            snapshot_name = f"{asset_id}_v1.0.0.sopdrop"
+            snapshot_path = get_library_assets_dir() / snapshot_name
+            if not snapshot_path.exists():
+                _atomic_copy(file_path, snapshot_path)
+                # Create initial version record for the original
+                init_version_id = str(uuid.uuid4())
+                db.execute(_SQL_INSERT_VERSION, (
+                    init_version_id, asset_id, "1.0.0",
+                    snapshot_name, current_hash, asset.get('file_size', 0),
+                    asset.get('node_count', 0), "Initial version", asset.get('created_at', now),
+                ))
+        else:
+            # Edge case — check if there's a snapshot already
+            snapshot_version = "1.0.0"
+
+        # Write new package data
+        package_json = json.dumps(package_data, separators=(',', ':'))
+        _atomic_write_text(file_path, package_json)
+
+        # Calculate new hash and size
+        file_hash = hashlib.sha256(package_json.encode()).hexdigest()
+        file_size = len(package_json)
+
+        # Update thumbnail if provided
+        thumbnail_path = asset.get('thumbnail_path')
+        if thumbnail_data:
+            thumb_name = f"{asset_id}.png"
+            thumb_file = get_library_thumbnails_dir() / thumb_name
+            _atomic_write_bytes(thumb_file, thumbnail_data)
+            thumbnail_path = thumb_name
+
+        # Extract metadata from new package
+        metadata = package_data.get('metadata', {})
+
+        # Build updates
+        updates = {
+            'file_hash': file_hash,
+            'file_size': file_size,
+            'node_count': metadata.get('node_count', 0),
+            'node_types': _json_column(metadata.get('node_types', [])),
+            'node_names': _json_column(metadata.get('node_names', [])),
+            'houdini_version': package_data.get('houdini_version', ''),
+            'has_hda_dependencies': 1 if metadata.get('has_hda_dependencies') else 0,
+            'dependencies': _json_column(package_data.get('dependencies', [])),
+            'metadata': _json_column(metadata),
+            'updated_at': now,
+        }
 
-    # Write new package data
-    package_json = json.dumps(package_data, separators=(',', ':'))
-    _atomic_write_text(file_path, package_json)
+        if thumbnail_path:
+            updates['thumbnail_path'] = thumbnail_path
 
-    # Calculate new hash and size
-    file_hash = hashlib.sha256(package_json.encode()).hexdigest()
-    file_size = len(package_json)
-
-    # Update thumbnail if provided
-    thumbnail_path = asset.get('thumbnail_path')
-    if thumbnail_data:
-        thumb_name = f"{asset_id}.png"
-        thumb_file = get_library_thumbnails_dir() / thumb_name
-        _atomic_write_bytes(thumb_file, thumbnail_data)
-        thumbnail_path = thumb_name
+        if name is not None and name != asset.get('name'):
+            updates['name'] = name
 
-    # Extract metadata from new package
-    metadata = package_data.get('metadata', {})
+        if description is not None:
+            updates['description'] = description
 
-    # Build updates
-    updates = {
-        'file_hash': file_hash,
-        'file_size': file_size,
-        'node_count': metadata.get('node_count', 0),
-        'node_types': json.dumps(metadata.get('node_types', [])),
-        'node_names': json.dumps(metadata.get('node_names', [])),
-        'houdini_version': package_data.get('houdini_version', ''),
-        'has_hda_dependencies': 1 if metadata.get('has_hda_dependencies') else 0,
-        'dependencies': json.dumps(package_data.get('dependencies', [])),
-        'metadata': json.dumps(metadata),
-        'updated_at': now,
-    }
-
-    if thumbnail_path:
-        updates['thumbnail_path'] = thumbnail_path
-
-    if name is not None and name != asset.get('name'):
-        updates['name'] = name
-
-    if description is not None:
-        updates['description'] = description
-
-    if tags is not None:
-        updates['tags'] = json.dumps(tags)
-        # Update tags index
-        db.execute("DELETE FROM asset_tags WHERE asset_id = ?", (asset_id,))
-        for tag in tags:
-            db.execute(
-                "INSERT OR IGNORE INTO asset_tags (asset_id, tag) VALUES (?, ?)",
-                (asset_id, tag.lower())
+        if tags is not None:
+            updates['tags'] = _json_column(tags)
+            # Update tags index
+            db.execute("DELETE FROM asset_tags WHERE asset_id = ?", (asset_id,))
+            db.executemany(
+                _SQL_INSERT_ASSET_TAG,
+                [(asset_id, tag.lower()) for tag in tags]
             )
 
-    # Execute update
-    set_clause = ", ".join(f"{k} = ?" for k in updates.keys())
-    values = list(updates.values()) + [asset_id]
-    db.execute(f"UPDATE library_assets SET {set_clause} WHERE id = ?", values)
-
-    # Create a version record with its own snapshot file
-    try:
-        # Re-check latest version (may have been created by snapshot above)
-        latest_row2 = db.execute(
-            "SELECT version FROM asset_versions WHERE asset_id = ? ORDER BY created_at DESC LIMIT 1",
-            (asset_id,)
-        ).fetchone()
-
-        if latest_row2:
-            latest_ver = latest_row2[0] if isinstance(latest_row2, (tuple, list)) else latest_row2['version']
-            next_version = _increment_version(latest_ver)
-        else:
-            next_version = "1.1.0"
-
-        # Save a snapshot file for this version
-        snapshot_name = f"{asset_id}_v{next_version}.sopdrop"
-        snapshot_path = get_library_assets_dir() / snapshot_name
-        _atomic_write_text(snapshot_path, package_json)
-
-        version_id = str(uuid.uuid4())
-        db.execute("""
-            INSERT OR IGNORE INTO asset_versions (id, asset_id, version, file_path, file_hash, file_size, node_count, changelog, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            version_id, asset_id, next_version,
-            snapshot_name, file_hash, file_size,
-            metadata.get('node_count', 0), None, now,
-        ))
-    except Exception:
-        pass  # Version tracking is non-critical
-
-    db.commit()
+        # Execute update. A cloud-synced asset is flagged as locally
+        # modified in the same statement (same rule as mark_asset_modified).
+        fields = tuple(sorted(updates))
+        values = [updates[k] for k in fields] + [asset_id]
+        db.execute(_asset_update_sql(fields, _SQL_MARK_MODIFIED), values)
 
-    # Mark as modified if this asset is cloud-synced
-    asset_after = get_asset(asset_id)
-    if asset_after and asset_after.get('sync_status') in ('synced', 'modified') and asset_after.get('remote_slug'):
-        mark_asset_modified(asset_id)
+        # Create a version record with its own snapshot file
+        try:
+            # snapshot_version is the latest version, or 1.0.0 when the
+            # initial snapshot was just recorded above
+            next_version = _increment_version(snapshot_version)
+
+            # Save a snapshot file for this version
+            snapshot_name = f"{asset_id}_v{next_version}.sopdrop"
+            snapshot_path = get_library_assets_dir() / snapshot_name
+            _atomic_write_text(snapshot_path, package_json)
+
+            version_id = str(uuid.uuid4())
+            db.execute(_SQL_INSERT_VERSION, (
+                version_id, asset_id, next_version,
+                snapshot_name, file_hash, file_size,
+                metadata.get('node_count', 0), None, now,
+            ))
+        except Exception:
+            pass  # Version tracking is non-critical
 
     # Trigger menu regeneration
     _trigger_menu_regenerate()
@@ -1885,11 +2386,10 @@ def get_asset_versions(asset_id: str) -> List[Dict[str, Any]]:
         # AssetDetailDialog handles an empty version list cleanly.
         return []
     db = get_db()
-    rows = db.execute(
-        "SELECT * FROM asset_versions WHERE asset_id = ? ORDER BY created_at DESC",
+    return _dict_rows(
+        db, "SELECT * FROM asset_versions WHERE asset_id = ? ORDER BY created_at DESC",
         (asset_id,)
-    ).fetchall()
-    return [dict_from_row(r) for r in rows]
+    )
 
 
 def load_version_package(version_id: str) -> Optional[Dict[str, Any]]:
@@ -1909,7 +2409,7 @@ def load_version_package(version_id: str) -> Optional[Dict[str, Any]]:
     if not file_path.exists():
         # Fallback: try loading the current asset package
         return load_asset_package(version['asset_id'])
-    return json.loads(file_path.read_text())
+    return _json.loads(file_path.read_bytes())
 
 
 @_writes_to_nas
@@ -1923,9 +2423,6 @@ def revert_to_version(asset_id: str, version_id: str) -> Optional[Dict[str, Any]
     if _http_mode():
         return _team_http.revert_to_version(asset_id, version_id)
 
-    import hashlib
-    import shutil
-
     db = get_db()
     asset = get_asset(asset_id)
     if not asset:
@@ -1945,51 +2442,46 @@ def revert_to_version(asset_id: str, version_id: str) -> Optional[Dict[str, Any]
     now = datetime.utcnow().isoformat()
 
     # Determine current latest version
-    latest_row = db.execute(
-        "SELECT version FROM asset_versions WHERE asset_id = ? ORDER BY created_at DESC LIMIT 1",
-        (asset_id,)
-    ).fetchone()
+    latest_row = db.execute(_SQL_LATEST_VERSION, (asset_id,)).fetchone()
     if latest_row:
         cur_ver = latest_row[0] if isinstance(latest_row, (tuple, list)) else latest_row['version']
     else:
         cur_ver = "1.0.0"
 
-    # Copy the version snapshot to the current file
-    _atomic_copy(version_file, current_file)
+    # Restore the version snapshot as the current file; metadata and hash
+    # come from the bytes already in memory
+    payload = version_file.read_bytes()
+    _atomic_write_bytes(current_file, payload)
 
-    # Read the restored package for metadata
-    package_data = json.loads(current_file.read_text())
+    package_data = _json.loads(payload)
     metadata = package_data.get('metadata', {})
-    file_hash = hashlib.sha256(current_file.read_bytes()).hexdigest()
-    file_size = current_file.stat().st_size
+    file_hash = hashlib.sha256(payload).hexdigest()
+    file_size = len(payload)
 
     # Update the asset record
     updates = {
         'file_hash': file_hash,
         'file_size': file_size,
         'node_count': metadata.get('node_count', 0),
-        'node_types': json.dumps(metadata.get('node_types', [])),
-        'node_names': json.dumps(metadata.get('node_names', [])),
+        'node_types': _json_column(metadata.get('node_types', [])),
+        'node_names': _json_column(metadata.get('node_names', [])),
         'houdini_version': package_data.get('houdini_version', ''),
-        'metadata': json.dumps(metadata),
+        'metadata': _json_column(metadata),
         'updated_at': now,
     }
-    set_clause = ", ".join(f"{k} = ?" for k in updates.keys())
-    values = list(updates.values()) + [asset_id]
-    db.execute(f"UPDATE library_assets SET {set_clause} WHERE id = ?", values)
+    fields = tuple(sorted(updates))
+    values = [updates[k] for k in fields] + [asset_id]
+    db.execute(_asset_update_sql(fields), values)
 
     # Create a revert version record
     try:
         next_version = _increment_version(cur_ver)
         snapshot_name = f"{asset_id}_v{next_version}.sopdrop"
         snapshot_path = get_library_assets_dir() / snapshot_name
-        _atomic_copy(current_file, snapshot_path)
+        _atomic_write_bytes(snapshot_path, payload)
 
         revert_id = str(uuid.uuid4())
-        db.execute("""
-            INSERT OR IGNORE INTO asset_versions (id, asset_id, version, file_path, file_hash, file_size, node_count, changelog, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        db.execute(_SQL_INSERT_VERSION, (
             revert_id, asset_id, next_version,
             snapshot_name, file_hash, file_size,
             metadata.get('node_count', 0),
@@ -1999,7 +2491,7 @@ def revert_to_version(asset_id: str, version_id: str) -> Optional[Dict[str, Any]
     except Exception:
         pass
 
-    db.commit()
+    _commit(db)
     _trigger_menu_regenerate()
     return get_asset(asset_id)
 
@@ -2061,7 +2553,6 @@ def detect_path_metadata(file_path: str) -> Dict[str, Any]:
 
     Uses fallback chain: OpenImageIO -> Pillow -> Qt QImage.
     """
-    import os
     result = {
         "file_type": os.path.splitext(file_path)[1].lstrip('.').lower(),
         "resolution": None,
@@ -2118,9 +2609,6 @@ def generate_path_thumbnail(file_path: str, max_size: int = 512) -> Optional[byt
     Fallback chain: OpenImageIO (EXR/HDR tonemapping) -> Pillow -> Qt QImage.
     Returns PNG bytes or None.
     """
-    import os
-    import tempfile
-
     # Try OpenImageIO first (handles EXR/HDR with tonemapping)
     try:
         import OpenImageIO as oiio
@@ -2166,7 +2654,6 @@ def generate_path_thumbnail(file_path: str, max_size: int = 512) -> Optional[byt
     # Try Pillow
     try:
         from PIL import Image
-        import io
         with Image.open(file_path) as img:
             img.thumbnail((max_size, max_size), Image.LANCZOS)
             if img.mode not in ('RGB', 'RGBA'):
@@ -2189,7 +2676,6 @@ def generate_path_thumbnail(file_path: str, max_size: int = 512) -> Optional[byt
         img = QtGui.QImage(file_path)
         if not img.isNull():
             scaled = img.scaled(max_size, max_size, _qc.Qt.KeepAspectRatio, _qc.Qt.SmoothTransformation)
-            import io
             buf = _qc.QBuffer()
             buf.open(_qc.QIODevice.WriteOnly)
             scaled.save(buf, "PNG")
@@ -2226,8 +2712,6 @@ def save_path_asset(
     Returns:
         The saved asset record
     """
-    import os
-
     if path_metadata is None:
         path_metadata = detect_path_metadata(file_path)
 
@@ -2327,7 +2811,7 @@ def record_asset_use(asset_id: str):
             SET last_used_at = ?, use_count = use_count + 1
             WHERE id = ?
         """, (now, asset_id))
-        db.commit()
+        _commit(db)
     except Exception:
         pass  # Non-critical — don't block the paste operation
 
@@ -2368,7 +2852,7 @@ def delete_asset(asset_id: str):
     # Mark as deleted instead of removing
     now = datetime.utcnow().isoformat()
     db.execute("UPDATE library_assets SET deleted_at = ? WHERE id = ?", (now, asset_id))
-    db.commit()
+    _commit(db)
 
     # Trigger menu regeneration
     _trigger_menu_regenerate(skip_reload=False)
@@ -2419,13 +2903,12 @@ def restore_asset(asset_id: str):
             tags = json.loads(tags)
         except (json.JSONDecodeError, TypeError):
             tags = []
-    for tag in tags:
-        db.execute(
-            "INSERT OR IGNORE INTO asset_tags (asset_id, tag) VALUES (?, ?)",
-            (asset_id, tag.lower()),
-        )
+    db.executemany(
+        _SQL_INSERT_ASSET_TAG,
+        [(asset_id, tag.lower()) for tag in tags],
+    )
 
-    db.commit()
+    _commit(db)
     _trigger_menu_regenerate(skip_reload=False)
 
 
@@ -2459,7 +2942,7 @@ def purge_asset(asset_id: str):
     # Delete version records and then the asset row
     db.execute("DELETE FROM asset_versions WHERE asset_id = ?", (asset_id,))
     db.execute("DELETE FROM library_assets WHERE id = ?", (asset_id,))
-    db.commit()
+    _commit(db)
 
 
 def list_trashed_assets() -> List[Dict[str, Any]]:
@@ -2467,20 +2950,11 @@ def list_trashed_assets() -> List[Dict[str, Any]]:
     if _http_mode():
         return _team_http.list_trashed_assets()
     db = get_db()
-    rows = db.execute(
-        "SELECT * FROM library_assets WHERE deleted_at IS NOT NULL ORDER BY deleted_at DESC"
-    ).fetchall()
-
-    assets = []
-    for row in rows:
-        asset = dict_from_row(row)
-        for field in ('node_types', 'node_names', 'tags', 'dependencies', 'metadata'):
-            if asset.get(field):
-                try:
-                    asset[field] = json.loads(asset[field])
-                except json.JSONDecodeError:
-                    asset[field] = []
-        assets.append(asset)
+    assets = _dict_rows(
+        db, "SELECT * FROM library_assets WHERE deleted_at IS NOT NULL ORDER BY deleted_at DESC"
+    )
+    for asset in assets:
+        _parse_json_fields(asset)
     return assets
 
 
@@ -2503,20 +2977,16 @@ def add_asset_to_collection(asset_id: str, collection_id: str):
     if _http_mode():
         return _team_http.add_asset_to_collection(asset_id, collection_id)
     db = get_db()
-    now = datetime.utcnow().isoformat()
+    _link_asset_to_collections(db, asset_id, (collection_id,), datetime.utcnow().isoformat())
+    _commit(db)
 
-    # Get next sort order
-    cursor = db.execute(
-        "SELECT COALESCE(MAX(sort_order), 0) + 1 FROM collection_assets WHERE collection_id = ?",
-        (collection_id,)
-    )
-    sort_order = cursor.fetchone()[0]
 
-    db.execute("""
-        INSERT OR IGNORE INTO collection_assets (collection_id, asset_id, sort_order, added_at)
-        VALUES (?, ?, ?, ?)
-    """, (collection_id, asset_id, sort_order, now))
-    db.commit()
+def _link_asset_to_collections(db, asset_id, collection_ids, now):
+    """Insert collection_assets rows at the end of each collection (no commit)."""
+    db.executemany(
+        _SQL_INSERT_COLLECTION_ASSET,
+        [(coll_id, asset_id, now, coll_id) for coll_id in collection_ids]
+    )
 
 
 @_writes_to_nas
@@ -2529,7 +2999,7 @@ def remove_asset_from_collection(asset_id: str, collection_id: str):
         "DELETE FROM collection_assets WHERE collection_id = ? AND asset_id = ?",
         (collection_id, asset_id)
     )
-    db.commit()
+    _commit(db)
 
 
 def get_collection_assets(collection_id: str) -> List[Dict[str, Any]]:
@@ -2537,44 +3007,10 @@ def get_collection_assets(collection_id: str) -> List[Dict[str, Any]]:
     if _http_mode():
         return _team_http.get_collection_assets(collection_id)
     db = get_db()
-    rows = db.execute("""
-        SELECT a.* FROM library_assets a
-        JOIN collection_assets ca ON a.id = ca.asset_id
-        WHERE ca.collection_id = ? AND a.deleted_at IS NULL
-        ORDER BY ca.sort_order, a.name
-    """, (collection_id,)).fetchall()
-
-    assets = []
-    asset_ids = []
-    for row in rows:
-        asset = dict_from_row(row)
-        for field in ('node_types', 'node_names', 'tags', 'dependencies', 'metadata'):
-            if asset.get(field):
-                try:
-                    asset[field] = json.loads(asset[field])
-                except json.JSONDecodeError:
-                    asset[field] = []
-        asset['collections'] = []
-        assets.append(asset)
-        asset_ids.append(asset['id'])
-
-    # Batch-fetch collection memberships
-    if asset_ids:
-        placeholders = ",".join("?" * len(asset_ids))
-        coll_rows = db.execute(f"""
-            SELECT ca2.asset_id, c.* FROM collections c
-            JOIN collection_assets ca2 ON c.id = ca2.collection_id
-            WHERE ca2.asset_id IN ({placeholders})
-            ORDER BY c.name
-        """, asset_ids).fetchall()
-        coll_map = {}
-        for cr in coll_rows:
-            aid = cr[0]
-            coll_dict = dict_from_row(cr)
-            coll_dict.pop('asset_id', None)
-            coll_map.setdefault(aid, []).append(coll_dict)
-        for asset in assets:
-            asset['collections'] = coll_map.get(asset['id'], [])
+    assets = _dict_rows(db, _SQL_COLLECTION_ASSETS, (collection_id,))
+    for asset in assets:
+        _parse_json_fields(asset)
+        asset['collections'] = _json.loads(asset.pop('collections_json'))
 
     return assets
 
@@ -2584,13 +3020,7 @@ def get_asset_collections(asset_id: str) -> List[Dict[str, Any]]:
     if _http_mode():
         return _team_http.get_asset_collections(asset_id)
     db = get_db()
-    rows = db.execute("""
-        SELECT c.* FROM collections c
-        JOIN collection_assets ca ON c.id = ca.collection_id
-        WHERE ca.asset_id = ?
-        ORDER BY c.name
-    """, (asset_id,)).fetchall()
-    return [dict_from_row(r) for r in rows]
+    return _dict_rows(db, _SQL_ASSET_COLLECTIONS, (asset_id,))
 
 
 def get_all_assets_cached():
@@ -2605,22 +3035,13 @@ def get_all_assets_cached():
     db = get_db()
 
     # 1. All active assets
-    rows = db.execute(
-        "SELECT * FROM library_assets WHERE deleted_at IS NULL ORDER BY updated_at DESC"
-    ).fetchall()
-
-    assets = []
+    assets = _dict_rows(
+        db, "SELECT * FROM library_assets WHERE deleted_at IS NULL ORDER BY updated_at DESC"
+    )
     asset_ids = []
-    for row in rows:
-        asset = dict_from_row(row)
-        for field in ('node_types', 'node_names', 'tags', 'dependencies', 'metadata'):
-            if asset.get(field):
-                try:
-                    asset[field] = json.loads(asset[field])
-                except json.JSONDecodeError:
-                    asset[field] = []
+    for asset in assets:
+        _parse_json_fields(asset)
         asset['collections'] = []
-        assets.append(asset)
         asset_ids.append(asset['id'])
 
     # 2. All collection memberships in one query
@@ -2654,6 +3075,115 @@ def get_all_assets_cached():
 # Search and Query
 # ==============================================================================
 
+def _fts_match_expr(db, query):
+    """Build an assets_fts MATCH expression equivalent to the LIKE search.
+
+    Returns None when the LIKE fallback must be used: the trigram tokenizer
+    is the only one that matches arbitrary substrings, it needs at least
+    three characters and a SQLite that has it (a mirror may carry a trigram
+    table this build can't read), and assets_fts may be missing (FTS5
+    unavailable) or still on the old tokenizer.
+    """
+    if not _FTS_TRIGRAM or len(query) < 3:
+        return None
+    row = db.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'assets_fts'"
+    ).fetchone()
+    if row is None or 'trigram' not in (row[0] or ''):
+        return None
+    # Quoted as one phrase so FTS operators in the query are literal text;
+    # restricted to the columns the LIKE search covers
+    phrase = query.replace('"', '""')
+    return f'{{name description tags}} : "{phrase}"'
+
+
+# search_assets statements, keyed by the shape of the filters (which ones
+# are set, how many tags, sort). Only a few dozen shapes occur, so each is
+# assembled once and its SQL text stays in sqlite3's statement cache.
+_SEARCH_SQL = {}
+
+
+def _search_sql(text_mode, favorites_only, has_context, n_tags,
+                has_collection, after_mode, sort_by, sort_order, columns=None):
+    """Return the cached search_assets SQL for one filter shape.
+
+    columns is a sorted tuple of library_assets columns to select, or None
+    for all of them.
+    """
+    key = (text_mode, bool(favorites_only), has_context, n_tags,
+           has_collection, after_mode, sort_by, sort_order, columns)
+    sql = _SEARCH_SQL.get(key)
+    if sql is not None:
+        return sql
+
+    # Exclude trashed assets
+    conditions = ["library_assets.deleted_at IS NULL"]
+
+    # Favorites filter
+    if favorites_only:
+        conditions.append("library_assets.is_favorite = 1")
+
+    if text_mode == 'fts':
+        conditions.append("library_assets.rowid IN (SELECT rowid FROM assets_fts WHERE assets_fts MATCH ?)")
+    elif text_mode == 'like':
+        conditions.append("(library_assets.name LIKE ? OR library_assets.description LIKE ? OR library_assets.tags LIKE ?)")
+
+    # Context filter
+    if has_context:
+        conditions.append("library_assets.context = ?")
+
+    # Tags filter (all must match): one probe of the tag index for the whole
+    # set instead of a self-join per tag
+    if n_tags:
+        placeholders = ",".join("?" * n_tags)
+        conditions.append(f"""library_assets.id IN (
+            SELECT asset_id FROM asset_tags WHERE tag IN ({placeholders})
+            GROUP BY asset_id HAVING COUNT(DISTINCT tag) = ?
+        )""")
+
+    # Collection filter: a semi-join, like the tags filter, so no row can
+    # come back twice and the page query needs no DISTINCT
+    if has_collection:
+        conditions.append("library_assets.id IN (SELECT asset_id FROM collection_assets WHERE collection_id = ?)")
+
+    # Keyset pagination: rows strictly after the cursor in (sort_by, id)
+    # order. NULL sort values come first ascending and last descending.
+    if after_mode is not None:
+        col = f"library_assets.{sort_by}"
+        op = '<' if sort_order == 'DESC' else '>'
+        if after_mode == 'null':
+            cond = f"({col} IS NULL AND library_assets.id {op} ?)"
+            if sort_order == 'ASC':
+                cond = f"({cond} OR {col} IS NOT NULL)"
+        else:
+            cond = f"{col} {op} ? OR ({col} = ? AND library_assets.id {op} ?)"
+            if sort_order == 'DESC':
+                cond += f" OR {col} IS NULL"
+            cond = f"({cond})"
+        conditions.append(cond)
+
+    where = " AND ".join(conditions)
+    select = ", ".join(f"la.{c}" for c in columns) if columns else "la.*"
+
+    # Page over (rowid, sort key, id) only, so sorting and skipping can run
+    # on the sort index; full rows, with their large JSON columns, are read
+    # for just the page.
+    sql = f"""
+        SELECT {select} FROM (
+            SELECT library_assets.rowid AS rid,
+                   library_assets.{sort_by} AS sort_key, library_assets.id AS id
+            FROM library_assets
+            WHERE {where}
+            ORDER BY library_assets.{sort_by} {sort_order}, library_assets.id {sort_order}
+            LIMIT ? OFFSET ?
+        ) AS page
+        JOIN library_assets la ON la.rowid = page.rid
+        ORDER BY page.sort_key {sort_order}, page.id {sort_order}
+    """
+    _SEARCH_SQL[key] = sql
+    return sql
+
+
 def search_assets(
     query: str = "",
     context: str = None,
@@ -2664,6 +3194,8 @@ def search_assets(
     limit: int = 100,
     offset: int = 0,
     favorites_only: bool = False,
+    after: Optional[Tuple[Any, str]] = None,
+    fields: Optional[Set[str]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Search assets with filtering.
@@ -2677,6 +3209,14 @@ def search_assets(
         sort_order: asc or desc
         limit: Max results
         offset: Pagination offset
+        after: Keyset cursor (sort_by value, id) of the last asset on the
+            previous page; the page starts right after it. Cheaper than a
+            large offset, which still walks every skipped row. The team
+            HTTP server pages by offset only and raises ValueError.
+        fields: Keys to return for each asset (library_assets columns,
+            plus 'collections'); 'id' is always included. None returns
+            everything. List views that skip the JSON-heavy columns read
+            and decode far less per row.
 
     Returns:
         List of matching assets
@@ -2686,96 +3226,103 @@ def search_assets(
             query=query, context=context, tags=tags,
             collection_id=collection_id, sort_by=sort_by,
             sort_order=sort_order, limit=limit, offset=offset,
-            favorites_only=favorites_only,
+            favorites_only=favorites_only, after=after, fields=fields,
         )
     db = get_db()
 
-    # Build query
-    conditions = []
-    params = []
-    joins = []
-
-    # Exclude trashed assets
-    conditions.append("library_assets.deleted_at IS NULL")
+    # Validate sort
+    valid_sorts = {'updated_at', 'created_at', 'name', 'use_count', 'last_used_at', 'node_count'}
+    if sort_by not in valid_sorts:
+        sort_by = 'updated_at'
+    sort_order = 'DESC' if sort_order.lower() == 'desc' else 'ASC'
 
-    # Favorites filter
-    if favorites_only:
-        conditions.append("library_assets.is_favorite = 1")
+    # Bind parameters in the order _search_sql() places the conditions,
+    # then LIMIT/OFFSET.
+    params = []
 
-    # Text search - use simple LIKE for reliability
+    # Text search - trigram FTS index when available, LIKE scan otherwise
+    text_mode = None
     if query:
-        search_pattern = f"%{query}%"
-        conditions.append("(library_assets.name LIKE ? OR library_assets.description LIKE ? OR library_assets.tags LIKE ?)")
-        params.extend([search_pattern, search_pattern, search_pattern])
+        match_expr = _fts_match_expr(db, query)
+        if match_expr is not None:
+            text_mode = 'fts'
+            params.append(match_expr)
+        else:
+            text_mode = 'like'
+            search_pattern = f"%{query}%"
+            params.extend([search_pattern, search_pattern, search_pattern])
 
-    # Context filter
     if context:
-        conditions.append("library_assets.context = ?")
         params.append(context.lower())
 
-    # Tags filter (all must match)
-    if tags:
-        for i, tag in enumerate(tags):
-            alias = f"t{i}"
-            joins.append(f"JOIN asset_tags {alias} ON library_assets.id = {alias}.asset_id AND {alias}.tag = ?")
-            params.insert(len(params), tag.lower())
+    wanted = sorted({tag.lower() for tag in tags}) if tags else []
+    if wanted:
+        params.extend(wanted)
+        params.append(len(wanted))
 
-    # Collection filter
     if collection_id:
-        joins.append("JOIN collection_assets ca ON library_assets.id = ca.asset_id AND ca.collection_id = ?")
         params.append(collection_id)
 
-    # Build SQL
-    where = " AND ".join(conditions) if conditions else "1=1"
-    join_sql = " ".join(joins)
-
-    # Validate sort
-    valid_sorts = {'updated_at', 'created_at', 'name', 'use_count', 'last_used_at', 'node_count'}
-    if sort_by not in valid_sorts:
-        sort_by = 'updated_at'
-    sort_order = 'DESC' if sort_order.lower() == 'desc' else 'ASC'
-
-    sql = f"""
-        SELECT DISTINCT library_assets.* FROM library_assets
-        {join_sql}
-        WHERE {where}
-        ORDER BY library_assets.{sort_by} {sort_order}
-        LIMIT ? OFFSET ?
-    """
+    after_mode = None
+    if after is not None:
+        after_value, after_id = after
+        if after_value is None:
+            after_mode = 'null'
+            params.append(after_id)
+        else:
+            after_mode = 'value'
+            params.extend([after_value, after_value, after_id])
+
+    # Column projection. Names are interpolated into the SQL, so only
+    # plain identifiers are accepted.
+    columns = None
+    json_fields = _JSON_FIELDS
+    want_collections = True
+    if fields is not None:
+        want_collections = 'collections' in fields
+        columns = tuple(sorted((set(fields) - {'collections'}) | {'id'}))
+        for column in columns:
+            if not column.isidentifier():
+                raise ValueError(f"Invalid field name: {column!r}")
+        json_fields = tuple(f for f in _JSON_FIELDS if f in columns)
+
+    shape = (favorites_only, bool(context), len(wanted),
+             bool(collection_id), after_mode, sort_by, sort_order, columns)
+    sql = _search_sql(text_mode, *shape)
     params.extend([limit, offset])
 
-    rows = db.execute(sql, params).fetchall()
-
-    assets = []
+    try:
+        assets = _dict_rows(db, sql, params)
+    except sqlite3.OperationalError:
+        if text_mode != 'fts':
+            raise
+        # assets_fts is there but can't be queried (e.g. a damaged index);
+        # the MATCH expression is the first parameter, swap in the LIKE ones
+        search_pattern = f"%{query}%"
+        params[:1] = [search_pattern, search_pattern, search_pattern]
+        assets = _dict_rows(db, _search_sql('like', *shape), params)
     asset_ids = []
-    for row in rows:
-        asset = dict_from_row(row)
-        for field in ('node_types', 'node_names', 'tags', 'dependencies', 'metadata'):
-            if asset.get(field):
-                try:
-                    asset[field] = json.loads(asset[field])
-                except json.JSONDecodeError:
-                    asset[field] = []
-        asset['collections'] = []
-        assets.append(asset)
+    for asset in assets:
+        _parse_json_fields(asset, json_fields)
+        if want_collections:
+            asset['collections'] = []
         asset_ids.append(asset['id'])
 
-    # Batch-fetch collection memberships for all assets in one query
-    if asset_ids:
-        placeholders = ",".join("?" * len(asset_ids))
-        coll_rows = db.execute(f"""
-            SELECT ca.asset_id, c.* FROM collections c
-            JOIN collection_assets ca ON c.id = ca.collection_id
-            WHERE ca.asset_id IN ({placeholders})
-            ORDER BY c.name
-        """, asset_ids).fetchall()
+    # Batch-fetch collection memberships for the whole page, in chunks that
+    # stay under older SQLite's 999 bound-parameter limit
+    if asset_ids and want_collections:
         coll_map = {}
-        for cr in coll_rows:
-            aid = cr[0]
-            coll_dict = dict_from_row(cr)
-            # Remove the extra asset_id key from the collection dict
-            coll_dict.pop('asset_id', None)
-            coll_map.setdefault(aid, []).append(coll_dict)
+        for start in range(0, len(asset_ids), _MAX_IN_PARAMS):
+            chunk = asset_ids[start:start + _MAX_IN_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            coll_rows = _dict_rows(db, f"""
+                SELECT ca.asset_id, c.* FROM collections c
+                JOIN collection_assets ca ON c.id = ca.collection_id
+                WHERE ca.asset_id IN ({placeholders})
+                ORDER BY c.name
+            """, chunk)
+            for coll_dict in coll_rows:
+                coll_map.setdefault(coll_dict.pop('asset_id'), []).append(coll_dict)
         for asset in assets:
             asset['collections'] = coll_map.get(asset['id'], [])
 
@@ -2787,14 +3334,21 @@ def get_all_tags() -> List[Dict[str, Any]]:
     if _http_mode():
         return _team_http.get_all_tags()
     db = get_db()
-    rows = db.execute("""
-        SELECT t.tag, COUNT(*) as count
-        FROM asset_tags t
-        JOIN library_assets a ON t.asset_id = a.id
-        WHERE a.deleted_at IS NULL
-        GROUP BY t.tag
-        ORDER BY count DESC, t.tag ASC
-    """).fetchall()
+    try:
+        # Maintained by the _TAG_COUNTS_SCHEMA triggers: one row per tag
+        rows = db.execute(
+            "SELECT tag, count FROM tag_counts ORDER BY count DESC, tag ASC"
+        ).fetchall()
+    except sqlite3.OperationalError:
+        # A mirror copied from a NAS library no client has migrated yet
+        rows = db.execute("""
+            SELECT t.tag, COUNT(*) as count
+            FROM asset_tags t
+            JOIN library_assets a ON t.asset_id = a.id
+            WHERE a.deleted_at IS NULL
+            GROUP BY t.tag
+            ORDER BY count DESC, t.tag ASC
+        """).fetchall()
     return [{'tag': r[0], 'count': r[1]} for r in rows]
 
 
@@ -2829,14 +3383,24 @@ def get_all_artists() -> List[Dict[str, Any]]:
     return [{'artist': r[0], 'count': r[1]} for r in rows if r[0]]
 
 
+# Fields returned by the short recent/frequent lists, which only render a
+# name, thumbnail and usage (no package metadata or collections)
+_USAGE_LIST_FIELDS = frozenset({
+    'id', 'name', 'context', 'thumbnail_path', 'updated_at',
+    'use_count', 'last_used_at', 'tags',
+})
+
+
 def get_recent_assets(limit: int = 10) -> List[Dict[str, Any]]:
     """Get recently used assets."""
-    return search_assets(sort_by='last_used_at', sort_order='desc', limit=limit)
+    return search_assets(sort_by='last_used_at', sort_order='desc', limit=limit,
+                         fields=_USAGE_LIST_FIELDS)
 
 
 def get_frequent_assets(limit: int = 10) -> List[Dict[str, Any]]:
     """Get most frequently used assets."""
-    return search_assets(sort_by='use_count', sort_order='desc', limit=limit)
+    return search_assets(sort_by='use_count', sort_order='desc', limit=limit,
+                         fields=_USAGE_LIST_FIELDS)
 
 
 @_writes_to_nas
@@ -2851,7 +3415,7 @@ def toggle_favorite(asset_id: str) -> bool:
     current = row[0] if isinstance(row, (tuple, list)) else row['is_favorite']
     new_val = 0 if current else 1
     db.execute("UPDATE library_assets SET is_favorite = ? WHERE id = ?", (new_val, asset_id))
-    db.commit()
+    _commit(db)
     return bool(new_val)
 
 
@@ -2882,12 +3446,28 @@ def save_filter_preset(
     db.execute("""
         INSERT INTO filter_presets (id, name, description, filters, sort_order, created_at)
         VALUES (?, ?, ?, ?, ?, ?)
-    """, (preset_id, name, description, json.dumps(filters), sort_order, now))
-    db.commit()
+    """, (preset_id, name, description, _json.dumps(filters), sort_order, now))
+    _commit(db)
 
     return get_filter_preset(preset_id)
 
 
+# Decoded preset filters keyed by preset id -> (raw JSON, parsed dict).
+# The panel lists presets on every refresh; the raw text is compared so an
+# edit from another client is picked up without trusting timestamps.
+_preset_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
+
+def _decode_preset_filters(preset_id: str, raw: str) -> Dict[str, Any]:
+    """Return the parsed filters for a preset, reusing the last decode."""
+    cached = _preset_cache.get(preset_id)
+    if cached is None or cached[0] != raw:
+        cached = (raw, _json.loads(raw))
+        _preset_cache[preset_id] = cached
+    # Shallow copy so a caller adding keys can't alter the cached dict.
+    return dict(cached[1])
+
+
 def get_filter_preset(preset_id: str) -> Optional[Dict[str, Any]]:
     """Get a filter preset by ID."""
     db = get_db()
@@ -2896,19 +3476,16 @@ def get_filter_preset(preset_id: str) -> Optional[Dict[str, Any]]:
         return None
 
     preset = dict_from_row(row)
-    preset['filters'] = json.loads(preset['filters'])
+    preset['filters'] = _decode_preset_filters(preset['id'], preset['filters'])
     return preset
 
 
 def list_filter_presets() -> List[Dict[str, Any]]:
     """List all filter presets."""
     db = get_db()
-    rows = db.execute("SELECT * FROM filter_presets ORDER BY sort_order, name").fetchall()
-    presets = []
-    for row in rows:
-        preset = dict_from_row(row)
-        preset['filters'] = json.loads(preset['filters'])
-        presets.append(preset)
+    presets = _dict_rows(db, "SELECT * FROM filter_presets ORDER BY sort_order, name")
+    for preset in presets:
+        preset['filters'] = _decode_preset_filters(preset['id'], preset['filters'])
     return presets
 
 
@@ -2917,7 +3494,8 @@ def delete_filter_preset(preset_id: str):
     """Delete a filter preset."""
     db = get_db()
     db.execute("DELETE FROM filter_presets WHERE id = ?", (preset_id,))
-    db.commit()
+    _commit(db)
+    _preset_cache.pop(preset_id, None)
 
 
 # ==============================================================================
@@ -2931,7 +3509,7 @@ def get_pref(key: str, default: Any = None) -> Any:
     if row is None:
         return default
     try:
-        return json.loads(row[0])
+        return _json.loads(row[0])
     except json.JSONDecodeError:
         return row[0]
 
@@ -2941,9 +3519,9 @@ def set_pref(key: str, value: Any):
     db = get_db()
     db.execute(
         "INSERT OR REPLACE INTO user_prefs (key, value) VALUES (?, ?)",
-        (key, json.dumps(value))
+        (key, _json.dumps(value))
     )
-    db.commit()
+    _commit(db)
 
 
 # ==============================================================================
@@ -2954,13 +3532,53 @@ def set_pref(key: str, value: Any):
 # Menu Regeneration Hook
 # ==============================================================================
 
+# Per-thread deferral state for deferred_menu_regenerate(). 'pending' holds
+# the skip_reload value the deferred regeneration will use, or None when
+# nothing has been requested yet.
+_menu_regen = threading.local()
+
+
+class deferred_menu_regenerate:
+    """Context manager that coalesces TAB menu regeneration.
+
+    Library writes inside the block only record that the menu is stale;
+    it is regenerated once when the outermost block exits, so a bulk
+    import of N assets rebuilds the menu once instead of N times.
+    If any deferred write asked for a shelf reload, the final
+    regeneration reloads too.
+    """
+
+    def __enter__(self):
+        self._was_active = getattr(_menu_regen, 'active', False)
+        if not self._was_active:
+            _menu_regen.active = True
+            _menu_regen.pending = None
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if not self._was_active:
+            _menu_regen.active = False
+            pending = _menu_regen.pending
+            _menu_regen.pending = None
+            if pending is not None:
+                _trigger_menu_regenerate(skip_reload=pending)
+        return False
+
+
 def _trigger_menu_regenerate(skip_reload: bool = True):
     """Trigger TAB menu regeneration (lazy import to avoid circular deps).
 
+    Inside deferred_menu_regenerate() the request is recorded and run once
+    when the block exits.
+
     Args:
         skip_reload: If True, skip hou.shelves.loadFile() (safe for modal dialogs).
                      If False, also reload the shelf so Houdini picks up changes immediately.
     """
+    if getattr(_menu_regen, 'active', False):
+        pending = _menu_regen.pending
+        _menu_regen.pending = skip_reload if pending is None else (pending and skip_reload)
+        return
     try:
         from . import menu
         menu.trigger_regenerate(skip_reload=skip_reload)
@@ -2975,18 +3593,17 @@ def get_library_stats() -> Dict[str, Any]:
         return _team_http.get_library_stats()
     db = get_db()
 
-    asset_count = db.execute("SELECT COUNT(*) FROM library_assets WHERE deleted_at IS NULL").fetchone()[0]
-    collection_count = db.execute("SELECT COUNT(*) FROM collections").fetchone()[0]
-    tag_count = db.execute("""
-        SELECT COUNT(DISTINCT t.tag) FROM asset_tags t
-        JOIN library_assets a ON t.asset_id = a.id
-        WHERE a.deleted_at IS NULL
-    """).fetchone()[0]
-
-    # Size from DB (avoids expensive disk iteration on network drives)
-    total_size = db.execute(
-        "SELECT COALESCE(SUM(file_size), 0) FROM library_assets WHERE deleted_at IS NULL"
-    ).fetchone()[0]
+    # Counts and size in one statement. Size comes from the DB (avoids
+    # expensive disk iteration on network drives).
+    asset_count, total_size, collection_count, tag_count = db.execute("""
+        SELECT COUNT(*), COALESCE(SUM(file_size), 0),
+            (SELECT COUNT(*) FROM collections),
+            (SELECT COUNT(DISTINCT t.tag) FROM asset_tags t
+             JOIN library_assets a ON t.asset_id = a.id
+             WHERE a.deleted_at IS NULL)
+        FROM library_assets
+        WHERE deleted_at IS NULL
+    """).fetchone()
 
     # Context breakdown
     context_counts = db.execute("""
@@ -3011,16 +3628,32 @@ def get_library_stats() -> Dict[str, Any]:
 # Sync Status Tracking
 # ==============================================================================
 
+_SQL_MARK_SYNCED = """
+    UPDATE library_assets
+    SET remote_slug = ?, remote_version = ?, sync_status = 'synced', synced_at = ?
+    WHERE id = ?
+"""
+
+
 def mark_asset_synced(asset_id: str, remote_slug: str, remote_version: str):
     """Mark an asset as synced with the cloud."""
+    mark_assets_synced([(asset_id, remote_slug, remote_version)])
+
+
+def mark_assets_synced(items: List[Tuple[str, str, str]]):
+    """Mark several assets as synced with the cloud in one transaction.
+
+    Args:
+        items: (asset_id, remote_slug, remote_version) tuples
+    """
     db = get_db()
     now = datetime.utcnow().isoformat()
-    db.execute("""
-        UPDATE library_assets
-        SET remote_slug = ?, remote_version = ?, sync_status = 'synced', synced_at = ?
-        WHERE id = ?
-    """, (remote_slug, remote_version, now, asset_id))
-    db.commit()
+    db.executemany(
+        _SQL_MARK_SYNCED,
+        [(remote_slug, remote_version, now, asset_id)
+         for asset_id, remote_slug, remote_version in items]
+    )
+    _commit(db)
 
 
 def mark_asset_modified(asset_id: str):
@@ -3031,7 +3664,7 @@ def mark_asset_modified(asset_id: str):
         SET sync_status = 'modified', updated_at = ?
         WHERE id = ? AND sync_status = 'synced'
     """, (datetime.utcnow().isoformat(), asset_id))
-    db.commit()
+    _commit(db)
 
 
 def mark_asset_syncing(asset_id: str, draft_id: str):
@@ -3042,7 +3675,7 @@ def mark_asset_syncing(asset_id: str, draft_id: str):
         SET sync_status = 'syncing', metadata = json_set(COALESCE(metadata, '{}'), '$.draft_id', ?)
         WHERE id = ?
     """, (draft_id, asset_id))
-    db.commit()
+    _commit(db)
 
 
 def get_sync_status() -> Dict[str, List[Dict[str, Any]]]:
@@ -3055,26 +3688,31 @@ def get_sync_status() -> Dict[str, List[Dict[str, Any]]]:
         'modified': [],
     }
 
-    for status in result.keys():
-        rows = db.execute(
-            "SELECT id, name, context, remote_slug, remote_version, synced_at FROM library_assets WHERE sync_status = ?",
-            (status,)
-        ).fetchall()
-        result[status] = [dict_from_row(r) for r in rows]
+    # One scan for all three buckets
+    rows = _dict_rows(db, """
+        SELECT sync_status, id, name, context, remote_slug, remote_version, synced_at
+        FROM library_assets
+        WHERE sync_status IN ('local_only', 'synced', 'modified')
+    """)
+    for asset in rows:
+        result[asset.pop('sync_status')].append(asset)
 
     return result
 
 
+_SQL_RESET_SYNCING = """
+    UPDATE library_assets
+    SET sync_status = 'local_only',
+        metadata = json_remove(COALESCE(metadata, '{}'), '$.draft_id')
+    WHERE id = ? AND sync_status = 'syncing'
+"""
+
+
 def reset_syncing_status(asset_id: str):
     """Reset a 'syncing' asset back to 'local_only' (e.g., after publish failure)."""
     db = get_db()
-    db.execute("""
-        UPDATE library_assets
-        SET sync_status = 'local_only',
-            metadata = json_remove(COALESCE(metadata, '{}'), '$.draft_id')
-        WHERE id = ? AND sync_status = 'syncing'
-    """, (asset_id,))
-    db.commit()
+    db.execute(_SQL_RESET_SYNCING, (asset_id,))
+    _commit(db)
 
 
 def clear_cloud_status(asset_id: str):
@@ -3093,7 +3731,7 @@ def clear_cloud_status(asset_id: str):
             metadata = json_remove(COALESCE(metadata, '{}'), '$.draft_id')
         WHERE id = ?
     """, (asset_id,))
-    db.commit()
+    _commit(db)
 
 
 def verify_cloud_status(asset_id: str) -> str:
@@ -3103,57 +3741,103 @@ def verify_cloud_status(asset_id: str) -> str:
     Returns the verified status: 'synced', 'local_only', or 'error'.
     Also updates the local database to match reality.
     """
-    db = get_db()
-    row = db.execute(
-        "SELECT remote_slug, sync_status FROM library_assets WHERE id = ?",
-        (asset_id,)
-    ).fetchone()
+    return verify_cloud_status_batch([asset_id]).get(asset_id, 'error')
 
-    if not row:
-        return 'error'
 
-    asset = dict_from_row(row)
-    remote_slug = asset.get('remote_slug')
-    current_status = asset.get('sync_status', 'local_only')
+# Concurrent slug lookups in verify_cloud_status_batch()
+_VERIFY_WORKERS = 8
 
-    # If local_only and no remote slug, nothing to verify
-    if current_status == 'local_only' and not remote_slug:
-        return 'local_only'
+_SQL_CLEAR_REMOTE = """
+    UPDATE library_assets
+    SET sync_status = 'local_only', remote_slug = NULL,
+        remote_version = NULL, synced_at = NULL
+    WHERE id = ?
+"""
 
-    # If 'syncing' with no remote_slug, it was a failed publish attempt
-    if current_status == 'syncing' and not remote_slug:
-        reset_syncing_status(asset_id)
-        return 'local_only'
 
-    # Check server for the asset
-    if remote_slug:
-        try:
-            from .api import SopdropClient, NotFoundError
-            client = SopdropClient()
-            client._get(f"assets/{remote_slug}", auth=False)
-            # Asset exists on server — mark as synced
-            if current_status != 'synced':
-                db.execute(
-                    "UPDATE library_assets SET sync_status = 'synced' WHERE id = ?",
-                    (asset_id,)
-                )
-                db.commit()
-            return 'synced'
-        except NotFoundError:
-            # Asset no longer exists on server
-            db.execute("""
-                UPDATE library_assets
-                SET sync_status = 'local_only', remote_slug = NULL,
-                    remote_version = NULL, synced_at = NULL
-                WHERE id = ?
-            """, (asset_id,))
-            db.commit()
-            return 'local_only'
-        except Exception:
-            # Network error — can't verify, keep current status
-            return current_status
+def verify_cloud_status_batch(asset_ids: List[str]) -> Dict[str, str]:
+    """Verify several assets' cloud status against the server.
+
+    The server has no bulk lookup, so the per-slug requests run
+    concurrently instead of one round trip after another, and every
+    resulting status change is written in a single commit.
+
+    Returns:
+        Dict of asset_id -> 'synced', 'local_only', or 'error' (unknown id).
+        An asset whose check fails on a network error keeps its current
+        status.
+    """
+    db = get_db()
+    statuses = {asset_id: 'error' for asset_id in asset_ids}
+    ids = list(statuses)
+    rows = []
+    for start in range(0, len(ids), _MAX_IN_PARAMS):
+        chunk = ids[start:start + _MAX_IN_PARAMS]
+        placeholders = ",".join("?" * len(chunk))
+        rows.extend(db.execute(
+            f"SELECT id, remote_slug, sync_status FROM library_assets WHERE id IN ({placeholders})",
+            chunk
+        ).fetchall())
+
+    failed_publishes = []
+    to_check = {}  # asset_id -> (remote_slug, current status)
+    for asset_id, remote_slug, current_status in rows:
+        current_status = current_status or 'local_only'
+        if remote_slug:
+            to_check[asset_id] = (remote_slug, current_status)
+        elif current_status == 'syncing':
+            # 'syncing' with no remote_slug was a failed publish attempt
+            failed_publishes.append((asset_id,))
+            statuses[asset_id] = 'local_only'
+        else:
+            statuses[asset_id] = current_status
+
+    newly_synced = []
+    removed = []
+    if to_check:
+        client = _get_client()
 
-    return current_status
+        def _exists(remote_slug):
+            # True/False once the server answers; None on a network error
+            try:
+                client._get(f"assets/{remote_slug}", auth=False)
+                return True
+            except NotFoundError:
+                return False
+            except Exception:
+                return None
+
+        slugs = sorted({slug for slug, _ in to_check.values()})
+        if len(slugs) == 1:
+            found = {slugs[0]: _exists(slugs[0])}
+        else:
+            with ThreadPoolExecutor(max_workers=min(_VERIFY_WORKERS, len(slugs))) as pool:
+                found = dict(zip(slugs, pool.map(_exists, slugs)))
+
+        for asset_id, (remote_slug, current_status) in to_check.items():
+            exists = found[remote_slug]
+            if exists is None:
+                # Network error — can't verify, keep current status
+                statuses[asset_id] = current_status
+            elif exists:
+                if current_status != 'synced':
+                    newly_synced.append((asset_id,))
+                statuses[asset_id] = 'synced'
+            else:
+                # Asset no longer exists on server
+                removed.append((asset_id,))
+                statuses[asset_id] = 'local_only'
+
+    if failed_publishes or newly_synced or removed:
+        db.executemany(_SQL_RESET_SYNCING, failed_publishes)
+        db.executemany(
+            "UPDATE library_assets SET sync_status = 'synced' WHERE id = ?",
+            newly_synced
+        )
+        db.executemany(_SQL_CLEAR_REMOTE, removed)
+        _commit(db)
+
+    return statuses
 
 
 def cleanup_stale_syncing():
@@ -3166,7 +3850,7 @@ def cleanup_stale_syncing():
         WHERE sync_status = 'syncing'
           AND updated_at < datetime('now', '-24 hours')
     """)
-    db.commit()
+    _commit(db)
 
 
 # ==============================================================================
@@ -3188,11 +3872,62 @@ def pull_from_cloud(slug: str, version: str = None, collection_id: str = None,
     Returns:
         The created local asset record
     """
-    from .api import SopdropClient
-    from urllib.request import urlopen, Request
-    from urllib.error import URLError
+    asset_info, package, thumbnail_data = _fetch_cloud_asset(
+        slug, version, thumbnail_url, cloud_asset_info)
+    return _save_pulled_asset(
+        slug, version, collection_id, asset_info, package, thumbnail_data)
+
+
+# Thumbnail downloads: read size, and the most a server may send us
+_THUMB_READ_CHUNK = 64 * 1024
+_MAX_THUMBNAIL_BYTES = 8 * 1024 * 1024
 
-    client = SopdropClient()
+
+def _read_thumbnail_body(response) -> bytearray:
+    """Read a thumbnail response body, refusing anything over the size cap.
+
+    With a Content-Length the body is read straight into one buffer of that
+    size; otherwise it is read in chunks until EOF. Raises ValueError as
+    soon as the body is known to exceed _MAX_THUMBNAIL_BYTES.
+    """
+    try:
+        length = int(response.headers.get('Content-Length') or 0)
+    except ValueError:
+        length = 0
+    if length > _MAX_THUMBNAIL_BYTES:
+        raise ValueError(f"Thumbnail too large ({length} bytes)")
+
+    if length > 0:
+        buf = bytearray(length)
+        view = memoryview(buf)
+        offset = 0
+        while offset < length:
+            n = response.readinto(view[offset:])
+            if not n:
+                break
+            offset += n
+        view.release()
+        if offset < length:
+            del buf[offset:]
+        return buf
+
+    buf = bytearray()
+    while True:
+        chunk = response.read(_THUMB_READ_CHUNK)
+        if not chunk:
+            return buf
+        buf += chunk
+        if len(buf) > _MAX_THUMBNAIL_BYTES:
+            raise ValueError(f"Thumbnail too large (over {_MAX_THUMBNAIL_BYTES} bytes)")
+
+
+def _fetch_cloud_asset(slug, version=None, thumbnail_url=None, cloud_asset_info=None):
+    """Network half of pull_from_cloud(): (asset_info, package, thumbnail bytes).
+
+    Touches no database and no hou, so sync loops can run it on worker
+    threads. The thumbnail downloads alongside the package.
+    """
+    client = _get_client()
 
     # Get asset info if not provided
     asset_info = cloud_asset_info
@@ -3201,8 +3936,16 @@ def pull_from_cloud(slug: str, version: str = None, collection_id: str = None,
         if not asset_info:
             raise ValueError(f"Asset not found: {slug}")
 
-    # Install (downloads to cache and returns package)
-    result = client.install(f"{slug}@{version}" if version else slug)
+    # Try multiple possible thumbnail URL fields
+    thumb_url = thumbnail_url or asset_info.get('thumbnailUrl') or asset_info.get('thumbnail_url') or asset_info.get('thumbnail')
+    print(f"[Sopdrop] Thumbnail URL from cloud: {thumb_url}")
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        thumb_future = pool.submit(_download_thumbnail, thumb_url) if thumb_url else None
+
+        # Install (downloads to cache and returns package)
+        result = client.install(f"{slug}@{version}" if version else slug)
+        thumbnail_data = thumb_future.result() if thumb_future else None
 
     if result['type'] == 'node':
         package = result['package']
@@ -3210,64 +3953,47 @@ def pull_from_cloud(slug: str, version: str = None, collection_id: str = None,
         # For HDAs, we need different handling
         raise NotImplementedError("HDA pull not yet implemented")
 
-    # Download thumbnail if available
-    thumbnail_data = None
-    # Try multiple possible thumbnail URL fields
-    thumb_url = thumbnail_url or asset_info.get('thumbnailUrl') or asset_info.get('thumbnail_url') or asset_info.get('thumbnail')
-    print(f"[Sopdrop] Thumbnail URL from cloud: {thumb_url}")
+    return asset_info, package, thumbnail_data
 
-    if thumb_url:
-        try:
-            import ssl
-            from .config import get_config
-
-            # Handle relative URLs
-            if thumb_url.startswith('/'):
-                config = get_config()
-                base = config.get('server_url', 'https://sopdrop.com').rstrip('/')
-                thumb_url = base + thumb_url
-                print(f"[Sopdrop] Full thumbnail URL: {thumb_url}")
-
-            # Create request with headers
-            headers = {
-                "User-Agent": "sopdrop-client/0.1.2",
-                "Accept": "image/*",
-            }
-            req = Request(thumb_url, headers=headers)
 
-            # Handle SSL (Houdini's Python often has cert issues)
-            if thumb_url.startswith("https://"):
-                ctx = ssl.create_default_context()
-                try:
-                    import certifi
-                    ctx = ssl.create_default_context(cafile=certifi.where())
-                except ImportError:
-                    pass
-                try:
-                    response = urlopen(req, timeout=15, context=ctx)
-                except (ssl.SSLCertVerificationError, URLError):
-                    ctx = ssl.create_default_context()
-                    ctx.check_hostname = False
-                    ctx.verify_mode = ssl.CERT_NONE
-                    response = urlopen(req, timeout=15, context=ctx)
-            else:
-                response = urlopen(req, timeout=15)
+def _download_thumbnail(thumb_url: str) -> Optional[bytearray]:
+    """Download a cloud thumbnail, or None if it fails or isn't an image."""
+    try:
+        # Handle relative URLs
+        if thumb_url.startswith('/'):
+            config = get_config()
+            base = config.get('server_url', 'https://sopdrop.com').rstrip('/')
+            thumb_url = base + thumb_url
+            print(f"[Sopdrop] Full thumbnail URL: {thumb_url}")
+
+        # Create request with headers
+        headers = {
+            "User-Agent": "sopdrop-client/0.1.2",
+            "Accept": "image/*",
+        }
+        req = Request(thumb_url, headers=headers)
 
-            thumbnail_data = response.read()
-            content_type = response.headers.get('Content-Type', '')
-            print(f"[Sopdrop] Downloaded thumbnail: {len(thumbnail_data)} bytes, type: {content_type}")
+        # Same transport (and SSL fallback) as the API client
+        response = _ssl_urlopen(req, timeout=15)
 
-            # Validate it's actually an image
-            if thumbnail_data and len(thumbnail_data) < 100:
-                print(f"[Sopdrop] Warning: Thumbnail data too small, might be an error response")
-                thumbnail_data = None
+        thumbnail_data = _read_thumbnail_body(response)
+        content_type = response.headers.get('Content-Type', '')
+        print(f"[Sopdrop] Downloaded thumbnail: {len(thumbnail_data)} bytes, type: {content_type}")
 
-        except Exception as e:
-            print(f"[Sopdrop] Failed to download thumbnail from {thumb_url}: {e}")
-            import traceback
-            traceback.print_exc()
+        # Validate it's actually an image
+        if thumbnail_data and len(thumbnail_data) < 100:
+            print(f"[Sopdrop] Warning: Thumbnail data too small, might be an error response")
+            return None
+        return thumbnail_data
 
-    # Save to library
+    except Exception as e:
+        print(f"[Sopdrop] Failed to download thumbnail from {thumb_url}: {e}")
+        traceback.print_exc()
+        return None
+
+
+def _save_pulled_asset(slug, version, collection_id, asset_info, package, thumbnail_data):
+    """Database half of pull_from_cloud(): save the asset and mark it synced."""
     asset = save_asset(
         name=asset_info.get('name', slug.split('/')[-1]),
         context=package.get('context', 'unknown'),
@@ -3295,14 +4021,6 @@ def push_to_cloud(asset_id: str) -> Dict[str, Any]:
     Returns:
         Dict with 'draft_id' and 'complete_url' for browser completion
     """
-    import json
-    import ssl
-    import webbrowser
-    from urllib.request import Request, urlopen
-    from urllib.error import HTTPError
-
-    from .config import get_api_url, get_token
-
     asset = get_asset(asset_id)
     if not asset:
         raise ValueError(f"Asset not found: {asset_id}")
@@ -3332,29 +4050,8 @@ def push_to_cloud(asset_id: str) -> Dict[str, Any]:
 
     req = Request(url, data=body, headers=headers, method="POST")
 
-    # Handle SSL with fallback for Houdini's Python
-    ctx = ssl.create_default_context()
-    try:
-        import certifi
-        ctx = ssl.create_default_context(cafile=certifi.where())
-    except ImportError:
-        pass
-
-    try:
-        response = urlopen(req, timeout=120, context=ctx)
-    except (ssl.SSLCertVerificationError, URLError) as e:
-        is_ssl = isinstance(e, ssl.SSLCertVerificationError) or (
-            isinstance(e, URLError) and 'CERTIFICATE_VERIFY_FAILED' in str(e.reason))
-        if not is_ssl:
-            raise
-        warnings.warn(
-            "SSL verification failed for publish. Install certifi to fix.",
-            stacklevel=2,
-        )
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-        response = urlopen(req, timeout=120, context=ctx)
+    # SSL fallback for Houdini's Python is handled by the shared transport
+    response = _ssl_urlopen(req, timeout=120)
 
     try:
         result = json.loads(response.read().decode('utf-8'))
@@ -3374,6 +4071,33 @@ def push_to_cloud(asset_id: str) -> Dict[str, Any]:
     }
 
 
+# Server-side asset UUID by (API URL, login token, cloud slug), remembered
+# from list responses so push_version_to_cloud() can skip its
+# assets/<slug> lookup. The URL and token keep one server's or account's
+# ids from being used for another.
+_cloud_asset_ids: Dict[Tuple[str, Optional[str], str], str] = {}
+
+
+def _cloud_asset_id_scope() -> Tuple[str, Optional[str]]:
+    """(API URL, token) prefix of _cloud_asset_ids keys for the current login."""
+    return (get_api_url(), get_token())
+
+
+def _lookup_cloud_asset_id(remote_slug: str) -> str:
+    """Fetch the server-side asset UUID for remote_slug and remember it."""
+    try:
+        server_asset = _get_client()._get(f"assets/{remote_slug}", auth=False)
+        # assets/<slug> returns the UUID as 'id'
+        server_asset_id = (server_asset.get('assetId') or server_asset.get('asset_id')
+                           or server_asset.get('id'))
+        if not server_asset_id:
+            raise ValueError("Could not get server asset ID")
+    except Exception as e:
+        raise ValueError(f"Failed to look up cloud asset: {e}")
+    _cloud_asset_ids[_cloud_asset_id_scope() + (remote_slug,)] = server_asset_id
+    return server_asset_id
+
+
 def push_version_to_cloud(asset_id: str) -> Dict[str, Any]:
     """
     Push a new version of a cloud-synced asset.
@@ -3387,14 +4111,6 @@ def push_version_to_cloud(asset_id: str) -> Dict[str, Any]:
     Returns:
         Dict with 'draft_id' and 'complete_url'
     """
-    import json
-    import ssl
-    import webbrowser
-    from urllib.request import Request, urlopen
-    from urllib.error import HTTPError
-
-    from .config import get_api_url, get_token
-
     asset = get_asset(asset_id)
     if not asset:
         raise ValueError(f"Asset not found: {asset_id}")
@@ -3412,16 +4128,12 @@ def push_version_to_cloud(asset_id: str) -> Dict[str, Any]:
         raise ValueError("Not logged in. Please log in first.")
 
     # We need the server-side asset_id (UUID), not the local ID.
-    # Fetch from the server using the slug.
-    from .api import SopdropClient
-    client = SopdropClient()
-    try:
-        server_asset = client._get(f"assets/{remote_slug}", auth=False)
-        server_asset_id = server_asset.get('assetId') or server_asset.get('asset_id')
-        if not server_asset_id:
-            raise ValueError("Could not get server asset ID")
-    except Exception as e:
-        raise ValueError(f"Failed to look up cloud asset: {e}")
+    # Use the one a cloud listing already gave us, else fetch by slug.
+    id_key = _cloud_asset_id_scope() + (remote_slug,)
+    server_asset_id = _cloud_asset_ids.get(id_key)
+    from_cache = server_asset_id is not None
+    if not from_cache:
+        server_asset_id = _lookup_cloud_asset_id(remote_slug)
 
     # Upload as version draft
     url = f"{get_api_url()}/drafts/version"
@@ -3431,43 +4143,35 @@ def push_version_to_cloud(asset_id: str) -> Dict[str, Any]:
         "User-Agent": "sopdrop-library/0.1.0",
     }
 
-    body = json.dumps({
-        "package": package,
-        "assetId": server_asset_id,
-    }).encode('utf-8')
+    while True:
+        body = json.dumps({
+            "package": package,
+            "assetId": server_asset_id,
+        }).encode('utf-8')
 
-    req = Request(url, data=body, headers=headers, method="POST")
+        req = Request(url, data=body, headers=headers, method="POST")
 
-    # Handle SSL with fallback for Houdini's Python
-    ctx = ssl.create_default_context()
-    try:
-        import certifi
-        ctx = ssl.create_default_context(cafile=certifi.where())
-    except ImportError:
-        pass
-
-    try:
-        response = urlopen(req, timeout=120, context=ctx)
-    except (ssl.SSLCertVerificationError, URLError) as e:
-        is_ssl = isinstance(e, ssl.SSLCertVerificationError) or (
-            isinstance(e, URLError) and 'CERTIFICATE_VERIFY_FAILED' in str(e.reason))
-        if not is_ssl:
-            raise
-        warnings.warn(
-            "SSL verification failed for version upload. Install certifi to fix.",
-            stacklevel=2,
-        )
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-        response = urlopen(req, timeout=120, context=ctx)
-
-    try:
-        result = json.loads(response.read().decode('utf-8'))
-    except HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        reset_syncing_status(asset_id)
-        raise ValueError(f"Upload failed: {error_body}")
+        try:
+            # SSL fallback for Houdini's Python is handled by the shared transport
+            response = _ssl_urlopen(req, timeout=120)
+            result = json.loads(response.read().decode('utf-8'))
+            break
+        except HTTPError as e:
+            if from_cache and 400 <= e.code < 500:
+                # The remembered UUID may be stale (e.g. the asset was
+                # deleted and republished under the same slug): forget it
+                # and look the slug up once before giving up
+                _cloud_asset_ids.pop(id_key, None)
+                from_cache = False
+                try:
+                    server_asset_id = _lookup_cloud_asset_id(remote_slug)
+                except ValueError:
+                    reset_syncing_status(asset_id)
+                    raise
+                continue
+            error_body = e.read().decode('utf-8')
+            reset_syncing_status(asset_id)
+            raise ValueError(f"Upload failed: {error_body}")
 
     # Open browser to set version number and confirm
     complete_url = result.get('completeUrl')
@@ -3497,8 +4201,6 @@ def import_from_cache(slug: str, version: str = None, collection_id: str = None)
     Returns:
         The created library asset, or None if not cached
     """
-    from .config import get_cache_dir
-
     cache_dir = get_cache_dir()
     slug_safe = slug.replace('/', '_')
 
@@ -3518,7 +4220,7 @@ def import_from_cache(slug: str, version: str = None, collection_id: str = None)
         return None
 
     # Load package
-    package = json.loads(cache_file.read_text())
+    package = _json.loads(cache_file.read_bytes())
 
     # Save to library
     asset = save_asset(
@@ -3539,13 +4241,10 @@ def get_cloud_saved_assets() -> List[Dict[str, Any]]:
     Combines the saved/bookmarked list with the user's own published assets
     to ensure all cloud assets are available for pull.
     """
-    from .api import SopdropClient
-    from .config import get_token
-
     if not get_token():
         return []
 
-    client = SopdropClient()
+    client = _get_client()
     seen_slugs = set()
     all_assets = []
 
@@ -3569,6 +4268,7 @@ def get_cloud_saved_assets() -> List[Dict[str, Any]]:
                 seen_slugs.add(slug)
                 # Normalize field names to match saved format
                 all_assets.append({
+                    'assetId': asset.get('asset_id'),
                     'name': asset.get('name', ''),
                     'slug': slug,
                     'description': asset.get('description', ''),
@@ -3582,9 +4282,69 @@ def get_cloud_saved_assets() -> List[Dict[str, Any]]:
     except Exception as e:
         print(f"[Sopdrop] Failed to fetch published assets: {e}")
 
+    scope = _cloud_asset_id_scope()
+    for asset in all_assets:
+        if asset.get('assetId'):
+            _cloud_asset_ids[scope + (asset['slug'],)] = asset['assetId']
+
     return all_assets
 
 
+# Concurrent downloads in _pull_many()
+_SYNC_WORKERS = 8
+
+# Re-link an already-synced asset to its cloud collection during sync
+_SQL_REATTACH_COLLECTION_ASSET = """
+    INSERT OR IGNORE INTO collection_assets (collection_id, asset_id, added_at)
+    VALUES (?, ?, ?)
+"""
+
+
+def _remote_slug_ids(db) -> Dict[str, str]:
+    """Map remote_slug -> local asset id for every cloud-linked asset."""
+    return dict(db.execute(
+        "SELECT remote_slug, id FROM library_assets WHERE remote_slug IS NOT NULL"
+    ).fetchall())
+
+
+def _pull_many(jobs):
+    """Pull several cloud assets, downloading concurrently.
+
+    Each job is a dict of pull_from_cloud() keyword arguments. The
+    downloads (package install and thumbnail) run on a thread pool; each
+    result is saved on the calling thread as it arrives, so every SQLite
+    write stays on this thread's connection and the TAB menu is rebuilt
+    once at the end.
+
+    Yields (job, asset) on success and (job, exception) on failure, in
+    completion order.
+    """
+    if not jobs:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(_SYNC_WORKERS, len(jobs))) as pool, \
+            deferred_menu_regenerate():
+        futures = {
+            pool.submit(
+                _fetch_cloud_asset, job['slug'], job.get('version'),
+                job.get('thumbnail_url'), job.get('cloud_asset_info'),
+            ): job
+            for job in jobs
+        }
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                asset_info, package, thumbnail_data = future.result()
+                asset = _save_pulled_asset(
+                    job['slug'], job.get('version'), job.get('collection_id'),
+                    asset_info, package, thumbnail_data,
+                )
+            except Exception as e:
+                yield job, e
+            else:
+                yield job, asset
+
+
 def sync_saved_assets(collection_name: str = "Cloud Library") -> Dict[str, Any]:
     """
     Sync all saved assets from cloud to local library.
@@ -3595,9 +4355,6 @@ def sync_saved_assets(collection_name: str = "Cloud Library") -> Dict[str, Any]:
     Returns:
         Summary of sync operation
     """
-    from .api import SopdropClient
-    from .config import get_token
-
     if not get_token():
         return {'error': 'Not logged in', 'synced': 0, 'skipped': 0}
 
@@ -3619,69 +4376,65 @@ def sync_saved_assets(collection_name: str = "Cloud Library") -> Dict[str, Any]:
 
     # Get local assets by remote_slug
     db = get_db()
-    local_slugs = set()
-    rows = db.execute("SELECT remote_slug FROM library_assets WHERE remote_slug IS NOT NULL").fetchall()
-    for row in rows:
-        local_slugs.add(row[0])
+    local_ids = _remote_slug_ids(db)
 
     synced = 0
     skipped = 0
     errors = []
+    jobs = []
 
     for cloud_asset in cloud_assets:
         slug = cloud_asset.get('slug')
         if not slug:
             continue
 
-        if slug in local_slugs:
+        if slug in local_ids:
             skipped += 1
             continue
 
-        try:
-            # Get thumbnail URL - try multiple possible field names
-            thumb_url = (
-                cloud_asset.get('thumbnailUrl') or
-                cloud_asset.get('thumbnail_url') or
-                cloud_asset.get('thumbnail') or
-                cloud_asset.get('previewUrl') or
-                cloud_asset.get('preview_url')
-            )
-
-            # Debug: show what we got from cloud
-            print(f"[Sopdrop] Cloud asset data for {slug}:")
-            print(f"  - thumbnailUrl: {cloud_asset.get('thumbnailUrl')}")
-            print(f"  - thumbnail_url: {cloud_asset.get('thumbnail_url')}")
-            print(f"  - Using: {thumb_url}")
-
-            # Build asset info from cloud response
-            asset_info = {
-                'name': cloud_asset.get('name', slug.split('/')[-1]),
-                'description': cloud_asset.get('description', ''),
-                'tags': cloud_asset.get('tags', []),
-                'latestVersion': cloud_asset.get('latestVersion') or cloud_asset.get('latest_version'),
-                'thumbnailUrl': thumb_url,
-            }
+        # Get thumbnail URL - try multiple possible field names
+        thumb_url = (
+            cloud_asset.get('thumbnailUrl') or
+            cloud_asset.get('thumbnail_url') or
+            cloud_asset.get('thumbnail') or
+            cloud_asset.get('previewUrl') or
+            cloud_asset.get('preview_url')
+        )
 
-            # Pull the asset
-            asset = pull_from_cloud(
-                slug=slug,
-                version=cloud_asset.get('savedVersion') or cloud_asset.get('latestVersion') or cloud_asset.get('latest_version'),
-                collection_id=cloud_coll['id'],
-                thumbnail_url=thumb_url,
-                cloud_asset_info=asset_info,
-            )
-            if asset:
-                synced += 1
-                print(f"[Sopdrop] Synced: {slug} (thumbnail: {asset.get('thumbnail_path')})")
-        except Exception as e:
-            errors.append(f"{slug}: {e}")
-            print(f"[Sopdrop] Failed to sync {slug}: {e}")
-            import traceback
-            traceback.print_exc()
+        # Debug: show what we got from cloud
+        print(f"[Sopdrop] Cloud asset data for {slug}:")
+        print(f"  - thumbnailUrl: {cloud_asset.get('thumbnailUrl')}")
+        print(f"  - thumbnail_url: {cloud_asset.get('thumbnail_url')}")
+        print(f"  - Using: {thumb_url}")
+
+        # Build asset info from cloud response
+        asset_info = {
+            'name': cloud_asset.get('name', slug.split('/')[-1]),
+            'description': cloud_asset.get('description', ''),
+            'tags': cloud_asset.get('tags', []),
+            'latestVersion': cloud_asset.get('latestVersion') or cloud_asset.get('latest_version'),
+            'thumbnailUrl': thumb_url,
+        }
 
-    # Trigger menu regeneration if we synced any assets
-    if synced > 0:
-        _trigger_menu_regenerate()
+        jobs.append({
+            'slug': slug,
+            'version': cloud_asset.get('savedVersion') or cloud_asset.get('latestVersion') or cloud_asset.get('latest_version'),
+            'collection_id': cloud_coll['id'],
+            'thumbnail_url': thumb_url,
+            'cloud_asset_info': asset_info,
+        })
+
+    # Pull the assets
+    for job, result in _pull_many(jobs):
+        slug = job['slug']
+        if isinstance(result, Exception):
+            errors.append(f"{slug}: {result}")
+            print(f"[Sopdrop] Failed to sync {slug}: {result}")
+        elif result:
+            synced += 1
+            print(f"[Sopdrop] Synced: {slug} (thumbnail: {result.get('thumbnail_path')})")
+
+    # _pull_many() already rebuilt the TAB menu once if anything was saved
 
     return {
         'synced': synced,
@@ -3701,9 +4454,6 @@ def sync_saved_assets_with_folders() -> Dict[str, Any]:
     Returns:
         Summary of sync operation
     """
-    from .api import SopdropClient
-    from .config import get_token
-
     if not get_token():
         return {'error': 'Not logged in', 'synced': 0, 'skipped': 0}
 
@@ -3714,11 +4464,8 @@ def sync_saved_assets_with_folders() -> Dict[str, Any]:
 
     db = get_db()
 
-    # Get local assets by remote_slug to check what's already synced
-    local_slugs = set()
-    rows = db.execute("SELECT remote_slug FROM library_assets WHERE remote_slug IS NOT NULL").fetchall()
-    for row in rows:
-        local_slugs.add(row[0])
+    # Local asset ids by remote_slug, to check what's already synced
+    local_ids = _remote_slug_ids(db)
 
     # Group cloud assets by folder
     assets_by_folder = {}
@@ -3731,6 +4478,8 @@ def sync_saved_assets_with_folders() -> Dict[str, Any]:
     # Create/get collections for each folder
     folder_to_collection = {}
     existing_collections = {c['name']: c for c in list_collections()}
+    # Collections to mark source='cloud', written with the reattachments below
+    mark_cloud = []
 
     for folder_name in assets_by_folder.keys():
         if folder_name == '__default__':
@@ -3742,25 +4491,20 @@ def sync_saved_assets_with_folders() -> Dict[str, Any]:
             coll = existing_collections[coll_name]
             # Update to mark as cloud source if not already
             if coll.get('source') != 'cloud':
-                db.execute(
-                    "UPDATE collections SET source = 'cloud' WHERE id = ?",
-                    (coll['id'],)
-                )
-                db.commit()
+                mark_cloud.append((coll['id'],))
             folder_to_collection[folder_name] = coll['id']
         else:
             # Create new cloud collection
             new_coll = create_collection(coll_name, color='#6366f1')
-            db.execute(
-                "UPDATE collections SET source = 'cloud' WHERE id = ?",
-                (new_coll['id'],)
-            )
-            db.commit()
+            mark_cloud.append((new_coll['id'],))
             folder_to_collection[folder_name] = new_coll['id']
 
     synced = 0
     skipped = 0
     errors = []
+    jobs = []
+    reattach = []
+    now = datetime.now().isoformat()
 
     for folder_name, folder_assets in assets_by_folder.items():
         collection_id = folder_to_collection.get(folder_name)
@@ -3770,57 +4514,54 @@ def sync_saved_assets_with_folders() -> Dict[str, Any]:
             if not slug:
                 continue
 
-            if slug in local_slugs:
+            if slug in local_ids:
                 # Already have it - just ensure it's in the right collection
-                asset_row = db.execute(
-                    "SELECT id FROM library_assets WHERE remote_slug = ?",
-                    (slug,)
-                ).fetchone()
-                if asset_row and collection_id:
-                    now = datetime.now().isoformat()
-                    db.execute("""
-                        INSERT OR IGNORE INTO collection_assets (collection_id, asset_id, added_at)
-                        VALUES (?, ?, ?)
-                    """, (collection_id, asset_row[0], now))
-                    db.commit()
+                if collection_id:
+                    reattach.append((collection_id, local_ids[slug], now))
                 skipped += 1
                 continue
 
-            try:
-                # Get thumbnail URL
-                thumb_url = (
-                    cloud_asset.get('thumbnailUrl') or
-                    cloud_asset.get('thumbnail_url') or
-                    cloud_asset.get('thumbnail')
-                )
+            # Get thumbnail URL
+            thumb_url = (
+                cloud_asset.get('thumbnailUrl') or
+                cloud_asset.get('thumbnail_url') or
+                cloud_asset.get('thumbnail')
+            )
 
-                # Build asset info
-                asset_info = {
-                    'name': cloud_asset.get('name', slug.split('/')[-1]),
-                    'description': cloud_asset.get('description', ''),
-                    'tags': cloud_asset.get('tags', []),
-                    'latestVersion': cloud_asset.get('latestVersion') or cloud_asset.get('latest_version'),
-                    'thumbnailUrl': thumb_url,
-                }
-
-                # Pull the asset into the correct collection
-                asset = pull_from_cloud(
-                    slug=slug,
-                    version=cloud_asset.get('savedVersion') or cloud_asset.get('latestVersion'),
-                    collection_id=collection_id,
-                    thumbnail_url=thumb_url,
-                    cloud_asset_info=asset_info,
-                )
-                if asset:
-                    synced += 1
-                    print(f"[Sopdrop] Synced: {slug} -> {folder_name}")
-            except Exception as e:
-                errors.append(f"{slug}: {e}")
-                print(f"[Sopdrop] Failed to sync {slug}: {e}")
+            # Build asset info
+            asset_info = {
+                'name': cloud_asset.get('name', slug.split('/')[-1]),
+                'description': cloud_asset.get('description', ''),
+                'tags': cloud_asset.get('tags', []),
+                'latestVersion': cloud_asset.get('latestVersion') or cloud_asset.get('latest_version'),
+                'thumbnailUrl': thumb_url,
+            }
 
-    # Trigger menu regeneration if we synced any assets
-    if synced > 0:
-        _trigger_menu_regenerate()
+            # Pull the asset into the correct collection
+            jobs.append({
+                'slug': slug,
+                'version': cloud_asset.get('savedVersion') or cloud_asset.get('latestVersion'),
+                'collection_id': collection_id,
+                'thumbnail_url': thumb_url,
+                'cloud_asset_info': asset_info,
+                'folder_name': folder_name,
+            })
+
+    # Collection source flags and reattachments commit together
+    with _immediate_transaction(db):
+        db.executemany("UPDATE collections SET source = 'cloud' WHERE id = ?", mark_cloud)
+        db.executemany(_SQL_REATTACH_COLLECTION_ASSET, reattach)
+
+    for job, result in _pull_many(jobs):
+        slug = job['slug']
+        if isinstance(result, Exception):
+            errors.append(f"{slug}: {result}")
+            print(f"[Sopdrop] Failed to sync {slug}: {result}")
+        elif result:
+            synced += 1
+            print(f"[Sopdrop] Synced: {slug} -> {job['folder_name']}")
+
+    # _pull_many() already rebuilt the TAB menu once if anything was saved
 
     return {
         'synced': synced,
@@ -3830,52 +4571,66 @@ def sync_saved_assets_with_folders() -> Dict[str, Any]:
     }
 
 
-def get_cloud_folders() -> List[Dict[str, Any]]:
+# Last get_cloud_folders() result as (token, fetched_at, folders), reused
+# for _FOLDERS_CACHE_TTL seconds so a batch of folder syncs fetches once
+_folders_cache = None
+_FOLDERS_CACHE_TTL = 30.0
+
+
+def get_cloud_folders(force: bool = False) -> List[Dict[str, Any]]:
     """
     Fetch user's folders from the cloud.
 
+    Args:
+        force: Skip the short-lived in-process cache and refetch
+
     Returns:
         List of folder objects with id, name, slug, color, etc.
     """
-    from .api import SopdropClient
-    from .config import get_token
+    global _folders_cache
 
-    if not get_token():
+    token = get_token()
+    if not token:
         return []
 
+    cached = _folders_cache
+    if (not force and cached and cached[0] == token
+            and time.monotonic() - cached[1] < _FOLDERS_CACHE_TTL):
+        return list(cached[2])
+
     try:
-        client = SopdropClient()
+        client = _get_client()
         result = client._get("folders?flat=true")
-        return result.get('folders', [])
+        folders = result.get('folders', [])
+        _folders_cache = (token, time.monotonic(), folders)
+        return list(folders)
     except Exception as e:
         print(f"[Sopdrop] Failed to fetch cloud folders: {e}")
         return []
 
 
-def sync_cloud_folders() -> Dict[str, Any]:
+def sync_cloud_folders(force: bool = False) -> Dict[str, Any]:
     """
     Sync folders from cloud to local library as cloud collections.
 
     Cloud folders become read-only collections locally with source='cloud'.
     Assets in those folders are synced down.
 
+    Args:
+        force: Refetch the folder list even if a recent one is cached
+
     Returns:
         Summary of sync operation.
     """
-    from .api import SopdropClient
-    from .config import get_token
-
     if not get_token():
         return {'error': 'Not logged in', 'synced': 0, 'created': 0}
 
     # Get cloud folders
-    cloud_folders = get_cloud_folders()
+    cloud_folders = get_cloud_folders(force=force)
     if not cloud_folders:
         return {'synced': 0, 'created': 0, 'total': 0}
 
     db = get_db()
-    created = 0
-    updated = 0
 
     # Get existing cloud collections
     existing = {}
@@ -3885,20 +4640,19 @@ def sync_cloud_folders() -> Dict[str, Any]:
     for row in rows:
         existing[row[1]] = row[0]
 
+    # One timestamp for the whole batch
+    now = datetime.now().isoformat()
+
+    updates = []
+    inserts = []
     for folder in cloud_folders:
         folder_id = folder.get('id')
         if not folder_id:
             continue
 
-        now = datetime.now().isoformat()
-
         if folder_id in existing:
             # Update existing
-            db.execute("""
-                UPDATE collections
-                SET name = ?, description = ?, color = ?, icon = ?, updated_at = ?
-                WHERE id = ?
-            """, (
+            updates.append((
                 folder.get('name'),
                 folder.get('description'),
                 folder.get('color', '#6366f1'),
@@ -3906,15 +4660,10 @@ def sync_cloud_folders() -> Dict[str, Any]:
                 now,
                 existing[folder_id],
             ))
-            updated += 1
         else:
             # Create new cloud collection
-            coll_id = str(uuid.uuid4())
-            db.execute("""
-                INSERT INTO collections (id, name, description, color, icon, source, remote_id, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, 'cloud', ?, ?, ?)
-            """, (
-                coll_id,
+            inserts.append((
+                str(uuid.uuid4()),
                 folder.get('name'),
                 folder.get('description'),
                 folder.get('color', '#6366f1'),
@@ -3923,16 +4672,28 @@ def sync_cloud_folders() -> Dict[str, Any]:
                 now,
                 now,
             ))
-            created += 1
+    updated = len(updates)
+    created = len(inserts)
 
-    db.commit()
-
-    # Remove cloud collections that no longer exist remotely
+    # Cloud collections that no longer exist remotely
     cloud_ids = {f.get('id') for f in cloud_folders if f.get('id')}
-    for remote_id, local_id in existing.items():
-        if remote_id not in cloud_ids:
-            db.execute("DELETE FROM collections WHERE id = ?", (local_id,))
-            db.commit()
+    removed = [existing[remote_id] for remote_id in existing.keys() - cloud_ids]
+
+    # Updates, inserts and removals commit together
+    with _immediate_transaction(db):
+        db.executemany("""
+            UPDATE collections
+            SET name = ?, description = ?, color = ?, icon = ?, updated_at = ?
+            WHERE id = ?
+        """, updates)
+        db.executemany("""
+            INSERT INTO collections (id, name, description, color, icon, source, remote_id, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, 'cloud', ?, ?, ?)
+        """, inserts)
+        for start in range(0, len(removed), _MAX_IN_PARAMS):
+            chunk = removed[start:start + _MAX_IN_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            db.execute(f"DELETE FROM collections WHERE id IN ({placeholders})", chunk)
 
     return {
         'created': created,
@@ -3951,14 +4712,11 @@ def sync_folder_assets(folder_slug: str) -> Dict[str, Any]:
     Returns:
         Summary of sync operation.
     """
-    from .api import SopdropClient
-    from .config import get_token
-
     if not get_token():
         return {'error': 'Not logged in', 'synced': 0}
 
     try:
-        client = SopdropClient()
+        client = _get_client()
         result = client._get(f"folders/{folder_slug}?limit=100")
     except Exception as e:
         return {'error': str(e), 'synced': 0}
@@ -3976,9 +4734,12 @@ def sync_folder_assets(folder_slug: str) -> Dict[str, Any]:
         (folder.get('id'),)
     ).fetchone()
 
-    if not row:
-        # Need to sync folders first
-        sync_cloud_folders()
+    # Need to sync folders first; a cached folder list may predate this
+    # folder, so refetch once before giving up
+    for force in (False, True):
+        if row:
+            break
+        sync_cloud_folders(force=force)
         row = db.execute(
             "SELECT id FROM collections WHERE source = 'cloud' AND remote_id = ?",
             (folder.get('id'),)
@@ -3989,49 +4750,46 @@ def sync_folder_assets(folder_slug: str) -> Dict[str, Any]:
 
     collection_id = row[0]
 
-    # Get local assets by remote_slug
-    local_slugs = set()
-    rows = db.execute("SELECT remote_slug FROM library_assets WHERE remote_slug IS NOT NULL").fetchall()
-    for r in rows:
-        local_slugs.add(r[0])
+    # Local asset ids by remote_slug
+    local_ids = _remote_slug_ids(db)
 
     synced = 0
     skipped = 0
+    jobs = []
+    reattach = []
+    now = datetime.now().isoformat()
 
+    id_scope = _cloud_asset_id_scope()
     for asset in assets:
         slug = asset.get('slug')
         if not slug:
             continue
+        # Folder listings carry the asset UUID as 'id'
+        if asset.get('id'):
+            _cloud_asset_ids[id_scope + (slug,)] = asset['id']
 
-        if slug in local_slugs:
+        if slug in local_ids:
             # Already have it - just ensure it's in this collection
-            asset_row = db.execute(
-                "SELECT id FROM library_assets WHERE remote_slug = ?",
-                (slug,)
-            ).fetchone()
-            if asset_row:
-                now = datetime.now().isoformat()
-                db.execute("""
-                    INSERT OR IGNORE INTO collection_assets (collection_id, asset_id, added_at)
-                    VALUES (?, ?, ?)
-                """, (collection_id, asset_row[0], now))
+            reattach.append((collection_id, local_ids[slug], now))
             skipped += 1
             continue
 
-        try:
-            # Pull asset from cloud
-            pulled = pull_from_cloud(
-                slug=slug,
-                version=asset.get('version'),
-                collection_id=collection_id,
-                thumbnail_url=asset.get('thumbnailUrl'),
-            )
-            if pulled:
-                synced += 1
-        except Exception as e:
-            print(f"[Sopdrop] Failed to sync {slug}: {e}")
+        jobs.append({
+            'slug': slug,
+            'version': asset.get('version'),
+            'collection_id': collection_id,
+            'thumbnail_url': asset.get('thumbnailUrl'),
+        })
+
+    with _immediate_transaction(db):
+        db.executemany(_SQL_REATTACH_COLLECTION_ASSET, reattach)
 
-    db.commit()
+    # Pull assets from cloud
+    for job, result in _pull_many(jobs):
+        if isinstance(result, Exception):
+            print(f"[Sopdrop] Failed to sync {job['slug']}: {result}")
+        elif result:
+            synced += 1
 
     return {
         'synced': synced,
@@ -4051,14 +4809,11 @@ def get_team_saved_assets(team_slug: str) -> List[Dict[str, Any]]:
     Returns:
         List of team saved assets from the cloud.
     """
-    from .api import SopdropClient
-    from .config import get_token
-
     if not get_token():
         return []
 
     try:
-        client = SopdropClient()
+        client = _get_client()
         result = client._get(f"teams/{team_slug}/saved?limit=200")
         return result.get('assets', [])
     except Exception as e:
@@ -4082,9 +4837,6 @@ def sync_team_library(team_slug: str = None, collection_name: str = None) -> Dic
     Returns:
         Summary of sync operation with synced/skipped/error counts.
     """
-    from .api import SopdropClient
-    from .config import get_token, get_team_slug, get_active_library
-
     if not get_token():
         return {'error': 'Not logged in', 'synced': 0, 'skipped': 0}
 
@@ -4123,10 +4875,7 @@ def sync_team_library(team_slug: str = None, collection_name: str = None) -> Dic
 
     # Get local assets by remote_slug
     db = get_db()
-    local_slugs = set()
-    rows = db.execute("SELECT remote_slug FROM library_assets WHERE remote_slug IS NOT NULL").fetchall()
-    for row in rows:
-        local_slugs.add(row[0])
+    local_ids = _remote_slug_ids(db)
 
     synced = 0
     skipped = 0
@@ -4137,7 +4886,7 @@ def sync_team_library(team_slug: str = None, collection_name: str = None) -> Dic
         if not slug:
             continue
 
-        if slug in local_slugs:
+        if slug in local_ids:
             skipped += 1
             continue
 
@@ -4177,14 +4926,12 @@ def sync_team_library(team_slug: str = None, collection_name: str = None) -> Dic
         except Exception as e:
             errors.append(f"{slug}: {e}")
             print(f"[Sopdrop] Failed to sync {slug}: {e}")
-            import traceback
             traceback.print_exc()
 
     # Store team identity in the library database itself
     try:
-        from .config import get_team_name as _get_team_name
         set_library_meta('team_slug', team_slug)
-        team_name = _get_team_name() or team_slug
+        team_name = get_team_name() or team_slug
         set_library_meta('team_name', team_name)
     except Exception as e:
         print(f"[Sopdrop] Warning: could not write team metadata to library: {e}")
@@ -4209,16 +4956,13 @@ def get_user_teams() -> List[Dict[str, Any]]:
     Returns:
         List of team objects with id, slug, name, role, etc.
     """
-    from .api import SopdropClient
-    from .config import get_token, use_lan_trust_auth
-
     # Identity comes from a Bearer token OR from trust-LAN's X-Sopdrop-User
     # header. Both bail-quickly if neither is configured.
     if not get_token() and not use_lan_trust_auth():
         return []
 
     try:
-        client = SopdropClient()
+        client = _get_client()
         result = client._get("teams")
         return result.get('teams', [])
     except Exception as e:
@@ -4242,9 +4986,6 @@ def copy_asset_to_library(asset_id: str, target_library: str) -> Optional[Dict[s
     Returns:
         The newly created asset in the target library, or None on failure.
     """
-    import shutil
-    from .config import get_active_library, get_team_library_path, set_active_library
-
     current_library = get_active_library()
 
     if current_library == target_library:
@@ -4379,8 +5120,6 @@ def get_other_library_type() -> Optional[str]:
         'personal' if currently in team, 'team' if currently in personal,
         or None if team library is not configured.
     """
-    from .config import get_active_library, get_team_library_path
-
     current = get_active_library()
 
     if current == "team":
@@ -63,6 +63,11 @@ class ThumbnailCache:
         self._dir = (cache_dir or (get_cache_dir() / "thumbnails")).resolve()
         self._dir.mkdir(parents=True, exist_ok=True)
         self._evict_lock = threading.Lock()
+        # Running estimate of the directory size, so puts don't rescan it.
+        # None until the first scan. Writes from other processes are only
+        # picked up at the next full scan (eviction / total_bytes()).
+        self._size_lock = threading.Lock()
+        self._size_estimate: int | None = None
 
     # ── Internal ────────────────────────────────────────────────────────
 
@@ -113,7 +118,7 @@ class ThumbnailCache:
         self._atomic_write(path, data)
         # Evict opportunistically — cheap when under budget, blocks new
         # writes only when over.
-        self._maybe_evict()
+        self._maybe_evict(len(data))
 
     def fetch(self, url: str) -> bytes | None:
         """Cache hit → return bytes. Miss → HTTP GET, store, return bytes.
@@ -146,50 +151,65 @@ class ThumbnailCache:
     # ── Eviction ────────────────────────────────────────────────────────
 
     def total_bytes(self) -> int:
-        try:
-            return sum(p.stat().st_size for p in self._dir.iterdir() if p.is_file())
-        except FileNotFoundError:
-            return 0
+        """Scan the cache directory for its size (and resync the estimate)."""
+        total = sum(size for _, size, _ in self._scan())
+        with self._size_lock:
+            self._size_estimate = total
+        return total
+
+    def _scan(self) -> list[tuple[float, int, str]]:
+        """(mtime, size, path) for every cached file.
 
-    def _maybe_evict(self) -> None:
-        # Avoid scanning the directory on every put — only when we plausibly
-        # exceeded budget. Cheap probe first; full scan under lock.
+        os.scandir hands back file types from the directory read itself,
+        so this is one stat per file rather than is_file() + stat() calls.
+        """
+        entries = []
         try:
-            total = self.total_bytes()
-        except OSError:
-            return
+            with os.scandir(self._dir) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            st = entry.stat(follow_symlinks=False)
+                            entries.append((st.st_mtime, st.st_size, entry.path))
+                    except OSError:
+                        continue
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _maybe_evict(self, added: int) -> None:
+        # Only the first put scans the directory; after that the estimate
+        # is bumped per write and the full scan waits until it says we're
+        # over budget.
+        with self._size_lock:
+            total = self._size_estimate
+            if total is not None:
+                total += added
+                self._size_estimate = total
+        if total is None:
+            try:
+                total = self.total_bytes()
+            except OSError:
+                return
         if total <= self.max_bytes:
             return
         with self._evict_lock:
             self._evict_to_target(self.max_bytes // 10 * 9)  # drop to 90%
 
     def _evict_to_target(self, target_bytes: int) -> None:
-        try:
-            files = [p for p in self._dir.iterdir() if p.is_file()]
-        except FileNotFoundError:
-            return
         # Sort oldest-mtime first so we evict LRU
-        try:
-            files.sort(key=lambda p: p.stat().st_mtime)
-        except OSError:
-            return
-        running = sum(self._safe_size(p) for p in files)
-        for p in files:
+        files = sorted(self._scan())
+        running = sum(size for _, size, _ in files)
+        for _, size, path in files:
             if running <= target_bytes:
-                return
-            sz = self._safe_size(p)
+                break
             try:
-                p.unlink()
-                running -= sz
+                os.unlink(path)
+                running -= size
             except OSError:
                 continue
-
-    @staticmethod
-    def _safe_size(p: Path) -> int:
-        try:
-            return p.stat().st_size
-        except OSError:
-            return 0
+        with self._size_lock:
+            self._size_estimate = running
 
     def clear(self) -> None:
         """Wipe the entire cache. For settings UI / tests."""
@@ -203,6 +223,8 @@ class ThumbnailCache:
                             pass
             except FileNotFoundError:
                 pass
+            with self._size_lock:
+                self._size_estimate = 0
 
 
 # ─── Module-level singleton ─────────────────────────────────────────────